@@ -15,14 +15,14 @@ cursor.execute( "PRAGMA foreign_keys = ON;" )
 with open( "list-facility-classification.tex.tmp", "w" ) as f:
     f.write( r"\begin{itemize}"+"\n" )
 
-    cursor.execute(
-    """
-    SELECT facility_class_id, facility_class_name
-    FROM facility_classes
-    ORDER BY facility_class_id;
-    """
-    )
-    for result in cursor.fetchall():
+    for result in sd.stream_rows(
+        cursor,
+        """
+        SELECT facility_class_id, facility_class_name
+        FROM facility_classes
+        ORDER BY facility_class_id;
+        """,
+    ):
         f.write(
             r"\item "+"Class {:s} --- {:s}\n".format(
                 r"\texttt{"+result[0]+r"}",
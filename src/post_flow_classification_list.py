@@ -15,14 +15,14 @@ cursor.execute( "PRAGMA foreign_keys = ON;" )
 with open( "list-flow-classification.tex.tmp", "w" ) as f:
     f.write( r"\begin{itemize}"+"\n" )
 
-    cursor.execute(
-    """
-    SELECT flow_class_id, flow_class_name
-    FROM flow_classes
-    ORDER BY flow_class_id;
-    """
-    )
-    for result in cursor.fetchall():
+    for result in sd.stream_rows(
+        cursor,
+        """
+        SELECT flow_class_id, flow_class_name
+        FROM flow_classes
+        ORDER BY flow_class_id;
+        """,
+    ):
         f.write(
             r"\item "+"Class {:s} --- {:s}\n".format(
                 r"\texttt{"+result[0]+r"}",
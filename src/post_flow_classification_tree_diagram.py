@@ -19,28 +19,28 @@ with open( "figure-flow-classification-tree-diagram.gv", "w" ) as f:
     f.write( 'ranksep="0.25";\n' )
     f.write( 'node [shape=circle, fixedsize=true, width="0.5", height="0.5", margin="0.25"];\n' )
 
-    cursor.execute(
-    """
-    SELECT flow_class_id
-    FROM flow_classes
-    ORDER BY flow_class_id;
-    """
-    )
-    for result in cursor.fetchall():
+    for result in sd.stream_rows(
+        cursor,
+        """
+        SELECT flow_class_id
+        FROM flow_classes
+        ORDER BY flow_class_id;
+        """,
+    ):
         f.write( '"{:s}" [texlbl="{:s}"]'.format(
             result[0],
             r"\texttt{"+result[0]+r"}",
         )+";\n" )
     
-    cursor.execute(
-    """
-    SELECT flow_class_ancestor_id, flow_class_descendant_id
-    FROM flow_class_paths
-    WHERE flow_class_path_length=1
-    ORDER BY flow_class_ancestor_id;
-    """
-    )
-    for result in cursor.fetchall():
+    for result in sd.stream_rows(
+        cursor,
+        """
+        SELECT flow_class_ancestor_id, flow_class_descendant_id
+        FROM flow_class_paths
+        WHERE flow_class_path_length=1
+        ORDER BY flow_class_ancestor_id;
+        """,
+    ):
         f.write( '"{:s}" -> "{:s}"'.format(
             result[0],
             result[1],
@@ -15,14 +15,14 @@ cursor.execute( "PRAGMA foreign_keys = ON;" )
 with open( "list-notes.tex.tmp", "w" ) as f:
     f.write( r"\begin{itemize}"+"\n" )
 
-    cursor.execute(
-    """
-    SELECT note_id, note_contents
-    FROM notes
-    ORDER BY note_id;
-    """
-    )
-    for result in cursor.fetchall():
+    for result in sd.stream_rows(
+        cursor,
+        """
+        SELECT note_id, note_contents
+        FROM notes
+        ORDER BY note_id;
+        """,
+    ):
         note_id  = int(result[0])
         contents = str(result[1])
         line = r"\item[{:d}] ".format(note_id)+contents+"\n"
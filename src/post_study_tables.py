@@ -22,96 +22,26 @@ with open( "table-all-studies.tex.tmp", "w" ) as f:
     f.write( r"\# stations & \# points \\"+"\n" )
     f.write( r"\hline"+"\n" )
 
-    cursor.execute(
-    """
-    SELECT study_id
-    FROM studies
-    ORDER BY study_id;
-    """
-    )
-    for result in cursor.fetchall():
-        study = result[0]
-
-        cursor.execute(
-        """
-        SELECT citation_key
-        FROM study_sources
-        WHERE study_id=? AND source_classification_id=?
-        ORDER BY citation_key COLLATE NOCASE;
-        """,
-        (
-            study,
-            sd.PRIMARY_SOURCE,
-        )
-        )
-        primary_sources = []
-        for result in cursor.fetchall():
-            primary_sources.append( str(result[0]) )
-
-        cursor.execute(
-        """
-        SELECT study_type_id
-        FROM studies
-        WHERE study_id=?;
-        """,
-        ( study, )
-        )
-        study_type = str(cursor.fetchone()[0])
-
-        cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM series
-        WHERE study_id=?;
-        """,
-        ( study, )
-        )
-        number_of_series = int(cursor.fetchone()[0])
-
-        cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM series, stations
-        WHERE series.study_id=? AND series.series_id = stations.series_id;
-        """,
-        ( study, )
-        )
-        number_of_stations = int(cursor.fetchone()[0])
-
-        cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM series, stations, points
-        WHERE series.study_id=? AND series.series_id = stations.series_id AND stations.station_id = points.station_id;
-        """,
-        ( study, )
-        )
-        number_of_points = int(cursor.fetchone()[0])
-
+    for summary in sd.study_summary( cursor ):
         line = r"\texttt{"+"{:s}".format(
-            sd.make_readable_identifier( study ),
+            sd.make_readable_identifier( summary.study_id ),
         )+r"} & \texttt{"+"{:s}".format(
-            study_type,
+            summary.study_type_id,
         )+r"} & \parbox[t]{0.4\textwidth}{\citet{"
 
-        i = 0
-        for primary_source in primary_sources:
-            if ( i != 0 ):
-                line += ","
-            i += 1
-            line += primary_source
+        line += ",".join( summary.primary_sources )
 
         line += r"}} & "+"{:d} & {:d} & {:d}".format(
-            number_of_series,
-            number_of_stations,
-            number_of_points,
+            summary.number_of_series,
+            summary.number_of_stations,
+            summary.number_of_points,
         )+r"\\"+"\n"
 
         f.write( line )
 
-        total_number_of_series   += number_of_series
-        total_number_of_stations += number_of_stations
-        total_number_of_points   += number_of_points
+        total_number_of_series   += summary.number_of_series
+        total_number_of_stations += summary.number_of_stations
+        total_number_of_points   += summary.number_of_points
 
     f.write( r"\hline"+"\n" )
 
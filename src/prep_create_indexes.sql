@@ -0,0 +1,65 @@
+/*
+Copyright (C) 2023 Andrew Trettel
+
+SPDX-License-Identifier: MIT
+*/
+
+/*
+Indexes for the foreign keys and lookup columns that the primary keys do not
+already cover.  These are created after the proc_ stages load the data, since
+building an index once over the whole table is faster than updating it for
+every inserted row, and then ANALYZE gives the query planner the statistics
+for the new indexes.
+
+SQLite only indexes the primary key and UNIQUE columns on its own, so without
+these every query on a foreign key (the points at a station, for example) and
+every check of a foreign key when a row is deleted scans the whole child table.
+
+The wall distance views (see prep_create_views.py) find the wall point of each
+station with wall_points_by_station, and then match coordinates on ( point_key,
+time_id, instrument_id ).  That is already the primary key of each coordinate
+table, so its automatic index serves those joins and is not duplicated here.
+The partial index on the wall points also tells the query planner that each
+station has only one or two wall points.  The statistics of points_by_station average
+over every label, including the unlabeled points, and without the partial index
+the planner may look up the wall point of each point among every wall point in
+the database instead.
+
+points_by_station ends with point_number so that resolve_labeled_points() can
+find the labeled points of each station and compare their point numbers using
+the index, reading only the rows of the labeled points themselves.
+*/
+
+CREATE INDEX IF NOT EXISTS series_by_study      ON series( study_id );
+CREATE INDEX IF NOT EXISTS series_by_facility   ON series( facility_id );
+CREATE INDEX IF NOT EXISTS series_by_model      ON series( model_id );
+CREATE INDEX IF NOT EXISTS stations_by_series   ON stations( series_id );
+CREATE INDEX IF NOT EXISTS points_by_station    ON points( station_id, point_label_id, point_number );
+CREATE INDEX IF NOT EXISTS times_by_series      ON times( series_id );
+CREATE INDEX IF NOT EXISTS times_by_instrument  ON times( instrument_id );
+
+CREATE INDEX IF NOT EXISTS wall_points_by_station ON points( station_id ) WHERE point_label_id = 'W';
+
+CREATE INDEX IF NOT EXISTS station_paths_by_descendant ON station_paths( station_descendant_id );
+
+CREATE INDEX IF NOT EXISTS facilities_by_predecessor ON facilities( predecessor_facility_id );
+CREATE INDEX IF NOT EXISTS facilities_by_successor   ON facilities( successor_facility_id );
+
+CREATE INDEX IF NOT EXISTS study_sources_by_classification ON study_sources( study_id, source_classification_id );
+
+CREATE INDEX IF NOT EXISTS study_notes_by_note      ON study_notes( note_id );
+CREATE INDEX IF NOT EXISTS series_notes_by_note     ON series_notes( note_id );
+CREATE INDEX IF NOT EXISTS station_notes_by_note    ON station_notes( note_id );
+CREATE INDEX IF NOT EXISTS point_notes_by_note      ON point_notes( note_id );
+CREATE INDEX IF NOT EXISTS facility_notes_by_note   ON facility_notes( note_id );
+CREATE INDEX IF NOT EXISTS instrument_notes_by_note ON instrument_notes( note_id );
+CREATE INDEX IF NOT EXISTS model_notes_by_note      ON model_notes( note_id );
+
+CREATE INDEX IF NOT EXISTS streamwise_coordinate_by_time       ON streamwise_coordinate( time_id );
+CREATE INDEX IF NOT EXISTS streamwise_coordinate_by_instrument ON streamwise_coordinate( instrument_id );
+CREATE INDEX IF NOT EXISTS transverse_coordinate_by_time       ON transverse_coordinate( time_id );
+CREATE INDEX IF NOT EXISTS transverse_coordinate_by_instrument ON transverse_coordinate( instrument_id );
+CREATE INDEX IF NOT EXISTS spanwise_coordinate_by_time         ON spanwise_coordinate( time_id );
+CREATE INDEX IF NOT EXISTS spanwise_coordinate_by_instrument   ON spanwise_coordinate( instrument_id );
+
+ANALYZE;
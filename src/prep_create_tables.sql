@@ -74,6 +74,62 @@ CREATE TABLE fluids (
     FOREIGN KEY(phase_id) REFERENCES phases(phase_id)
 );
 
+/*
+Tabulated fluid properties from the literature, in SI units.  The primary key
+orders the values of each property of each fluid from each source by pressure
+and then temperature, which is the order in which they are interpolated.
+*/
+CREATE TABLE fluid_property_values (
+    fluid_id                   TEXT NOT NULL,
+    quantity_id                TEXT NOT NULL,
+    citation_key               TEXT NOT NULL,
+    pressure                   REAL NOT NULL CHECK ( pressure    > 0.0 ),
+    temperature                REAL NOT NULL CHECK ( temperature > 0.0 ),
+    fluid_property_value       REAL NOT NULL,
+    fluid_property_uncertainty REAL DEFAULT NULL CHECK ( fluid_property_uncertainty >= 0.0 ),
+    preferred                  INTEGER NOT NULL DEFAULT FALSE,
+    PRIMARY KEY(fluid_id, quantity_id, citation_key, pressure, temperature),
+    FOREIGN KEY(fluid_id) REFERENCES fluids(fluid_id),
+    FOREIGN KEY(preferred) REFERENCES booleans(boolean_id)
+);
+
+CREATE TABLE correlation_types (
+    correlation_type_id   TEXT PRIMARY KEY CHECK ( length(correlation_type_id) = 1 ),
+    correlation_type_name TEXT UNIQUE NOT NULL
+);
+
+/*
+Correlations fitted to the preferred values in fluid_property_values along the
+pressure level closest to standard atmospheric pressure.  The correlations are
+only valid between the minimum and maximum temperatures of the fitted values.
+The correlation uncertainty is a relative standard uncertainty.
+*/
+CREATE TABLE fluid_property_correlations (
+    fluid_id                TEXT NOT NULL,
+    quantity_id             TEXT NOT NULL,
+    correlation_type_id     TEXT NOT NULL,
+    pressure                REAL NOT NULL CHECK ( pressure              > 0.0 ),
+    reference_temperature   REAL NOT NULL CHECK ( reference_temperature > 0.0 ),
+    minimum_temperature     REAL NOT NULL CHECK ( minimum_temperature   > 0.0 ),
+    maximum_temperature     REAL NOT NULL CHECK ( maximum_temperature   > minimum_temperature ),
+    correlation_uncertainty REAL NOT NULL CHECK ( correlation_uncertainty >= 0.0 ),
+    preferred               INTEGER NOT NULL DEFAULT FALSE,
+    PRIMARY KEY(fluid_id, quantity_id, correlation_type_id),
+    FOREIGN KEY(fluid_id) REFERENCES fluids(fluid_id),
+    FOREIGN KEY(correlation_type_id) REFERENCES correlation_types(correlation_type_id),
+    FOREIGN KEY(preferred) REFERENCES booleans(boolean_id)
+);
+
+CREATE TABLE fluid_property_correlation_coefficients (
+    fluid_id            TEXT NOT NULL,
+    quantity_id         TEXT NOT NULL,
+    correlation_type_id TEXT NOT NULL,
+    coefficient_number  INTEGER NOT NULL CHECK ( coefficient_number >= 0 ),
+    coefficient_value   REAL NOT NULL,
+    PRIMARY KEY(fluid_id, quantity_id, correlation_type_id, coefficient_number),
+    FOREIGN KEY(fluid_id, quantity_id, correlation_type_id) REFERENCES fluid_property_correlations(fluid_id, quantity_id, correlation_type_id)
+);
+
 CREATE TABLE instrument_classes (
     instrument_class_id        TEXT PRIMARY KEY,
     instrument_class_name      TEXT UNIQUE NOT NULL,
@@ -228,8 +284,16 @@ CREATE TABLE station_paths (
     FOREIGN KEY(station_descendant_id) REFERENCES stations(station_id)
 );
 
+/*
+The point_key is the physical key of each point, and it is what every table
+that refers to points stores.  It packs the same fields as the point_id into a
+single integer (see sd.identify_point_key), so it is much smaller than the
+18-character point_id and it makes the points table a rowid table ordered by
+point.  The readable point_id is kept as a unique attribute.
+*/
 CREATE TABLE points (
-    point_id          TEXT PRIMARY KEY,
+    point_key         INTEGER PRIMARY KEY,
+    point_id          TEXT NOT NULL UNIQUE,
     station_id        TEXT NOT NULL,
     point_number      INTEGER NOT NULL CHECK ( point_number > 0 AND point_number <= 9999 ),
     point_label_id    TEXT DEFAULT NULL,
@@ -317,11 +381,11 @@ CREATE TABLE station_notes (
 );
 
 CREATE TABLE point_notes (
-    point_id TEXT NOT NULL,
-    note_id  INTEGER NOT NULL,
-    PRIMARY KEY(point_id, note_id),
-    FOREIGN KEY(point_id) REFERENCES points(point_id),
-    FOREIGN KEY(note_id)  REFERENCES notes(note_id)
+    point_key INTEGER NOT NULL,
+    note_id   INTEGER NOT NULL,
+    PRIMARY KEY(point_key, note_id),
+    FOREIGN KEY(point_key) REFERENCES points(point_key),
+    FOREIGN KEY(note_id)   REFERENCES notes(note_id)
 );
 
 CREATE TABLE facility_notes (
@@ -388,11 +452,11 @@ CREATE TABLE station_external_ids (
 );
 
 CREATE TABLE point_external_ids (
-    point_id          TEXT NOT NULL,
+    point_key         INTEGER NOT NULL,
     compilation_id    INTEGER NOT NULL,
     point_external_id TEXT NOT NULL,
-    PRIMARY KEY(point_id, compilation_id),
-    FOREIGN KEY(point_id)       REFERENCES points(point_id),
+    PRIMARY KEY(point_key, compilation_id),
+    FOREIGN KEY(point_key)      REFERENCES points(point_key),
     FOREIGN KEY(compilation_id) REFERENCES compilations(compilation_id)
 );
 
@@ -410,224 +474,118 @@ CREATE TABLE times (
 );
 
 CREATE TABLE streamwise_coordinate (
-    point_id      TEXT NOT NULL,
+    point_key     INTEGER NOT NULL,
     time_id       INTEGER NOT NULL,
     instrument_id INTEGER DEFAULT NULL,
     value         REAL NOT NULL,
     uncertainty   REAL DEFAULT NULL CHECK ( uncertainty >= 0.0 ),
     outlier       INTEGER NOT NULL DEFAULT FALSE,
-    PRIMARY KEY(point_id, time_id, instrument_id),
-    FOREIGN KEY(point_id)      REFERENCES points(point_id),
+    PRIMARY KEY(point_key, time_id, instrument_id),
+    FOREIGN KEY(point_key)     REFERENCES points(point_key),
     FOREIGN KEY(time_id)       REFERENCES times(time_id),
     FOREIGN KEY(instrument_id) REFERENCES instruments(instrument_id),
     FOREIGN KEY(outlier)       REFERENCES booleans(boolean_id)
 );
 
 CREATE TABLE transverse_coordinate (
-    point_id      TEXT NOT NULL,
+    point_key     INTEGER NOT NULL,
     time_id       INTEGER NOT NULL,
     instrument_id INTEGER DEFAULT NULL,
     value         REAL NOT NULL,
     uncertainty   REAL DEFAULT NULL CHECK ( uncertainty >= 0.0 ),
     outlier       INTEGER NOT NULL DEFAULT FALSE,
-    PRIMARY KEY(point_id, time_id, instrument_id),
-    FOREIGN KEY(point_id)      REFERENCES points(point_id),
+    PRIMARY KEY(point_key, time_id, instrument_id),
+    FOREIGN KEY(point_key)     REFERENCES points(point_key),
     FOREIGN KEY(time_id)       REFERENCES times(time_id),
     FOREIGN KEY(instrument_id) REFERENCES instruments(instrument_id),
     FOREIGN KEY(outlier)       REFERENCES booleans(boolean_id)
 );
 
 CREATE TABLE spanwise_coordinate (
-    point_id      TEXT NOT NULL,
+    point_key     INTEGER NOT NULL,
     time_id       INTEGER NOT NULL,
     instrument_id INTEGER DEFAULT NULL,
     value         REAL NOT NULL,
     uncertainty   REAL DEFAULT NULL CHECK ( uncertainty >= 0.0 ),
     outlier       INTEGER NOT NULL DEFAULT FALSE,
-    PRIMARY KEY(point_id, time_id, instrument_id),
-    FOREIGN KEY(point_id)      REFERENCES points(point_id),
+    PRIMARY KEY(point_key, time_id, instrument_id),
+    FOREIGN KEY(point_key)     REFERENCES points(point_key),
     FOREIGN KEY(time_id)       REFERENCES times(time_id),
     FOREIGN KEY(instrument_id) REFERENCES instruments(instrument_id),
     FOREIGN KEY(outlier)       REFERENCES booleans(boolean_id)
 );
 
-CREATE VIEW wall_streamwise_coordinate AS
-     SELECT                points.station_id    AS station_id,
-                           points.point_id      AS point_id,
-            streamwise_coordinate.time_id       AS time_id,
-            streamwise_coordinate.instrument_id AS instrument_id,
-            streamwise_coordinate.value         AS value,
-            streamwise_coordinate.uncertainty   AS uncertainty,
-            streamwise_coordinate.outlier       AS outlier
-       FROM streamwise_coordinate
- INNER JOIN points
-         ON points.point_id       = streamwise_coordinate.point_id
-        AND points.point_label_id = 'W';
-
-CREATE VIEW wall_transverse_coordinate AS
-     SELECT                points.station_id    AS station_id,
-                           points.point_id      AS point_id,
-            transverse_coordinate.time_id       AS time_id,
-            transverse_coordinate.instrument_id AS instrument_id,
-            transverse_coordinate.value         AS value,
-            transverse_coordinate.uncertainty   AS uncertainty,
-            transverse_coordinate.outlier       AS outlier
-       FROM transverse_coordinate
- INNER JOIN points
-         ON points.point_id       = transverse_coordinate.point_id
-        AND points.point_label_id = 'W';
-
-CREATE VIEW wall_spanwise_coordinate AS
-     SELECT              points.station_id    AS station_id,
-                         points.point_id      AS point_id,
-            spanwise_coordinate.time_id       AS time_id,
-            spanwise_coordinate.instrument_id AS instrument_id,
-            spanwise_coordinate.value         AS value,
-            spanwise_coordinate.uncertainty   AS uncertainty,
-            spanwise_coordinate.outlier       AS outlier
-       FROM spanwise_coordinate
- INNER JOIN points
-         ON points.point_id       = spanwise_coordinate.point_id
-        AND points.point_label_id = 'W';
-
-CREATE VIEW streamwise_wall_distance AS
-     SELECT                points.station_id    AS station_id,
-                           points.point_id      AS point_id,
-            streamwise_coordinate.time_id       AS time_id,
-            streamwise_coordinate.instrument_id AS instrument_id,
-                   streamwise_coordinate.value
-            - wall_streamwise_coordinate.value  AS value,
-            SQRT(
-                     streamwise_coordinate.uncertainty *      streamwise_coordinate.uncertainty
-              + wall_streamwise_coordinate.uncertainty * wall_streamwise_coordinate.uncertainty
-            ) AS uncertainty,
-            (      streamwise_coordinate.outlier = TRUE ) OR
-            ( wall_streamwise_coordinate.outlier = TRUE ) AS outlier
-       FROM points
- INNER JOIN streamwise_coordinate
-         ON points.point_id = streamwise_coordinate.point_id
- INNER JOIN wall_streamwise_coordinate
-         ON                points.station_id = wall_streamwise_coordinate.station_id
-        AND streamwise_coordinate.time_id    = wall_streamwise_coordinate.time_id
-        AND ( ( streamwise_coordinate.instrument_id = wall_streamwise_coordinate.instrument_id )
-              OR ( streamwise_coordinate.instrument_id IS NULL
-                  AND wall_streamwise_coordinate.instrument_id IS NULL ) );
-
-CREATE VIEW transverse_wall_distance AS
-     SELECT                points.station_id    AS station_id,
-                           points.point_id      AS point_id,
-            transverse_coordinate.time_id       AS time_id,
-            transverse_coordinate.instrument_id AS instrument_id,
-                   transverse_coordinate.value
-            - wall_transverse_coordinate.value  AS value,
-            SQRT(
-                     transverse_coordinate.uncertainty *      transverse_coordinate.uncertainty
-              + wall_transverse_coordinate.uncertainty * wall_transverse_coordinate.uncertainty
-            ) AS uncertainty,
-            (      transverse_coordinate.outlier = TRUE ) OR
-            ( wall_transverse_coordinate.outlier = TRUE ) AS outlier
-       FROM points
- INNER JOIN transverse_coordinate
-         ON points.point_id = transverse_coordinate.point_id
- INNER JOIN wall_transverse_coordinate
-         ON                points.station_id = wall_transverse_coordinate.station_id
-        AND transverse_coordinate.time_id    = wall_transverse_coordinate.time_id
-        AND ( ( transverse_coordinate.instrument_id = wall_transverse_coordinate.instrument_id )
-              OR ( transverse_coordinate.instrument_id IS NULL
-                  AND wall_transverse_coordinate.instrument_id IS NULL ) );
-
-CREATE VIEW spanwise_wall_distance AS
-     SELECT                points.station_id  AS station_id,
-                           points.point_id    AS point_id,
-            spanwise_coordinate.time_id       AS time_id,
-            spanwise_coordinate.instrument_id AS instrument_id,
-                   spanwise_coordinate.value
-            - wall_spanwise_coordinate.value  AS value,
-            SQRT(
-                     spanwise_coordinate.uncertainty *      spanwise_coordinate.uncertainty
-              + wall_spanwise_coordinate.uncertainty * wall_spanwise_coordinate.uncertainty
-            ) AS uncertainty,
-            (      spanwise_coordinate.outlier = TRUE ) OR
-            ( wall_spanwise_coordinate.outlier = TRUE ) AS outlier
-       FROM points
- INNER JOIN spanwise_coordinate
-         ON points.point_id = spanwise_coordinate.point_id
- INNER JOIN wall_spanwise_coordinate
-         ON              points.station_id = wall_spanwise_coordinate.station_id
-        AND spanwise_coordinate.time_id    = wall_spanwise_coordinate.time_id
-        AND ( ( spanwise_coordinate.instrument_id = wall_spanwise_coordinate.instrument_id )
-              OR ( spanwise_coordinate.instrument_id IS NULL
-                  AND wall_spanwise_coordinate.instrument_id IS NULL ) );
-
-CREATE VIEW wall_distance AS
-     SELECT points.station_id AS station_id,
-            points.point_id   AS point_id,
-            streamwise_wall_distance.time_id       AS time_id,
-            streamwise_wall_distance.instrument_id AS instrument_id,
-            SQRT(
-                streamwise_wall_distance.value * streamwise_wall_distance.value
-              + transverse_wall_distance.value * transverse_wall_distance.value
-              +   spanwise_wall_distance.value *   spanwise_wall_distance.value
-            ) AS value,
-            SQRT(
-                streamwise_wall_distance.value       * streamwise_wall_distance.value
-              * streamwise_wall_distance.uncertainty * streamwise_wall_distance.uncertainty
-              + transverse_wall_distance.value       * transverse_wall_distance.value
-              * transverse_wall_distance.uncertainty * transverse_wall_distance.uncertainty
-              +   spanwise_wall_distance.value       *   spanwise_wall_distance.value
-              *   spanwise_wall_distance.uncertainty *   spanwise_wall_distance.uncertainty
-            ) / SQRT(
-                streamwise_wall_distance.value * streamwise_wall_distance.value
-              + transverse_wall_distance.value * transverse_wall_distance.value
-              +   spanwise_wall_distance.value *   spanwise_wall_distance.value
-            ) AS uncertainty,
-            ( streamwise_wall_distance.outlier = TRUE ) OR
-            ( transverse_wall_distance.outlier = TRUE ) OR
-            (   spanwise_wall_distance.outlier = TRUE ) AS outlier
-       FROM points
- INNER JOIN streamwise_wall_distance
-         ON points.point_id = streamwise_wall_distance.point_id
- INNER JOIN transverse_wall_distance
-         ON                   points.point_id      = transverse_wall_distance.point_id
-        AND streamwise_wall_distance.time_id       = transverse_wall_distance.time_id
-        AND ( ( streamwise_wall_distance.instrument_id = transverse_wall_distance.instrument_id )
-              OR ( streamwise_wall_distance.instrument_id IS NULL
-                  AND transverse_wall_distance.instrument_id IS NULL ) )
- INNER JOIN spanwise_wall_distance
-         ON                   points.point_id = spanwise_wall_distance.point_id
-        AND streamwise_wall_distance.time_id  = spanwise_wall_distance.time_id
-        AND ( ( streamwise_wall_distance.instrument_id = spanwise_wall_distance.instrument_id )
-              OR ( streamwise_wall_distance.instrument_id IS NULL
-                  AND spanwise_wall_distance.instrument_id IS NULL ) )
-      WHERE ( points.point_label_id IS NULL OR points.point_label_id != "W" )
-  UNION ALL
-     SELECT points.station_id AS station_id,
-            points.point_id   AS point_id,
-            streamwise_wall_distance.time_id       AS time_id,
-            streamwise_wall_distance.instrument_id AS instrument_id,
-            SQRT(
-                streamwise_wall_distance.value * streamwise_wall_distance.value
-              + transverse_wall_distance.value * transverse_wall_distance.value
-              +   spanwise_wall_distance.value *   spanwise_wall_distance.value
-            ) AS value,
-            0.0 AS uncertainty,
-            ( streamwise_wall_distance.outlier = TRUE ) OR
-            ( transverse_wall_distance.outlier = TRUE ) OR
-            (   spanwise_wall_distance.outlier = TRUE ) AS outlier
-       FROM points
- INNER JOIN streamwise_wall_distance
-         ON points.point_id = streamwise_wall_distance.point_id
- INNER JOIN transverse_wall_distance
-         ON                   points.point_id      = transverse_wall_distance.point_id
-        AND streamwise_wall_distance.time_id       = transverse_wall_distance.time_id
-        AND ( ( streamwise_wall_distance.instrument_id = transverse_wall_distance.instrument_id )
-              OR ( streamwise_wall_distance.instrument_id IS NULL
-                  AND transverse_wall_distance.instrument_id IS NULL ) )
- INNER JOIN spanwise_wall_distance
-         ON                   points.point_id = spanwise_wall_distance.point_id
-        AND streamwise_wall_distance.time_id  = spanwise_wall_distance.time_id
-        AND ( ( streamwise_wall_distance.instrument_id = spanwise_wall_distance.instrument_id )
-              OR ( streamwise_wall_distance.instrument_id IS NULL
-                  AND spanwise_wall_distance.instrument_id IS NULL ) )
-      WHERE points.point_label_id = "W";
+/*
+A materialized copy of the wall_distance view (see prep_create_views.py).  The
+view recalculates every wall distance from six coordinate lookups on every
+query, so queries read this table instead.  sd.refresh_wall_distances rebuilds
+it from the view after the data for some or all of the stations changes.
+
+At stations with more than one wall point, the distance is from the nearest
+wall, so the table has one row for each point, time, and instrument.  (The
+views once had one row for each pair of a point and a wall instead.)  The
+views of the distances in each direction measure from that same wall, so they
+are always the components of this distance (see sd.nearest_wall_view_sql).
+
+The only foreign key on a parent that is ever deleted is the station, which
+the primary key covers.  Foreign keys to the points, times, and instruments
+would need their own indexes here, or else every deleted point would scan the
+whole table to check them.  The rows are instead always deleted with their
+stations (see sd.delete_series_subtrees).
+*/
+CREATE TABLE wall_distance_mat (
+    station_id    TEXT NOT NULL,
+    point_key     INTEGER NOT NULL,
+    time_id       INTEGER NOT NULL,
+    instrument_id INTEGER DEFAULT NULL,
+    value         REAL NOT NULL,
+    uncertainty   REAL DEFAULT NULL CHECK ( uncertainty >= 0.0 ),
+    outlier       INTEGER NOT NULL DEFAULT FALSE,
+    PRIMARY KEY(station_id, point_key, time_id, instrument_id),
+    FOREIGN KEY(station_id) REFERENCES stations(station_id),
+    FOREIGN KEY(outlier)    REFERENCES booleans(boolean_id)
+);
 
+/*
+A materialized copy of the study_summary view (see prep_create_views.py), so
+that documentation tables read the counts of every study with one query
+instead of counting every point again.  sd.refresh_study_summaries rebuilds it
+from the view after the data for some or all of the studies changes.
+*/
+CREATE TABLE study_summary_mat (
+    study_id           TEXT PRIMARY KEY,
+    study_type_id      TEXT NOT NULL,
+    primary_sources    TEXT NOT NULL DEFAULT '',
+    number_of_series   INTEGER NOT NULL DEFAULT 0 CHECK ( number_of_series   >= 0 ),
+    number_of_stations INTEGER NOT NULL DEFAULT 0 CHECK ( number_of_stations >= 0 ),
+    number_of_points   INTEGER NOT NULL DEFAULT 0 CHECK ( number_of_points   >= 0 ),
+    FOREIGN KEY(study_id)      REFERENCES studies(study_id),
+    FOREIGN KEY(study_type_id) REFERENCES study_types(study_type_id)
+);
+
+/*
+Fingerprints of the inputs of each build stage (the stage's script, its data
+files, and the Python package), used to rebuild only the studies whose inputs
+changed.  See sheardata.build for details.
+*/
+CREATE TABLE build_fingerprints (
+    stage_name  TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+
+/*
+The number of changes to each table that sheardata keeps in memory, counted by
+the triggers that sheardata.create_table_version_triggers creates in
+prep_create_views.py.  The in-memory copies are read again once the version of
+their tables changes after a write (see sheardata.get_connection_cache).
+*/
+CREATE TABLE table_versions (
+    table_name TEXT PRIMARY KEY,
+    version    INTEGER NOT NULL DEFAULT 0
+);
+
+/*
+The wall_* coordinate views and the *_wall_distance and wall_distance views are
+generated by sheardata.create_wall_distance_views in prep_create_views.py, and
+the study_summary view by sheardata.create_study_summary_view.
+*/
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+def main( cursor ):
+    sd.create_wall_distance_views( cursor )
+    sd.create_study_summary_view( cursor )
+    sd.create_table_version_triggers( cursor )
+
+if ( __name__ == "__main__" ):
+    db = sd.Database( sys.argv[1], build_mode=True )
+    main( db.cursor )
+    db.commit()
+    db.close()
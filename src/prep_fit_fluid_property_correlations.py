@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import sheardata as sd
+import sys
+
+def main( cursor ):
+    reference_temperature = sd.ABSOLUTE_ZERO
+
+    # Fluid, quantity, correlation type, minimum and maximum temperatures of
+    # the fitted values, and the degree of the polynomials.  A temperature
+    # range of None uses every value along the level.
+    correlations = [
+        ( sd.F_GASEOUS_AIR,  sd.Q_DYNAMIC_VISCOSITY,    sd.CT_SUTHERLAND_LAW,         None,  None,  None ),
+        ( sd.F_GASEOUS_AIR,  sd.Q_DYNAMIC_VISCOSITY,    sd.CT_POWER_LAW,              200.0, 600.0, None ),
+        ( sd.F_GASEOUS_AIR,  sd.Q_THERMAL_CONDUCTIVITY, sd.CT_SUTHERLAND_LAW,         200.0, 600.0, None ),
+        ( sd.F_GASEOUS_AIR,  sd.Q_THERMAL_CONDUCTIVITY, sd.CT_POWER_LAW,              200.0, 600.0, None ),
+        ( sd.F_LIQUID_WATER, sd.Q_MASS_DENSITY,         sd.CT_POLYNOMIAL,             None,  None,  3    ),
+        ( sd.F_LIQUID_WATER, sd.Q_DYNAMIC_VISCOSITY,    sd.CT_EXPONENTIAL_POLYNOMIAL, None,  None,  3    ),
+    ]
+
+    uncertainties = {}
+    for fluid_id, quantity_id, correlation_type_id, minimum_temperature, \
+        maximum_temperature, degree in correlations:
+        table = sd.get_fluid_property_table( cursor, fluid_id, quantity_id,
+                                             preferred=True )
+        k = table.nearest_level()
+        begin, end = table.offsets[k], table.offsets[k+1]
+        temperatures = table.temperatures[begin:end]
+
+        fitted = np.ones( len(temperatures), dtype=bool )
+        if ( minimum_temperature != None ):
+            fitted &= temperatures >= minimum_temperature
+        if ( maximum_temperature != None ):
+            fitted &= temperatures <= maximum_temperature
+        temperatures = temperatures[fitted]
+
+        coefficients, correlation_uncertainty = sd.fit_fluid_property_correlation(
+            correlation_type_id,
+            temperatures,
+            table.values[begin:end][fitted],
+            table.uncertainties[begin:end][fitted],
+            reference_temperature,
+            degree,
+        )
+
+        cursor.execute(
+        """
+        INSERT INTO fluid_property_correlations( fluid_id, quantity_id,
+                                                 correlation_type_id, pressure,
+                                                 reference_temperature,
+                                                 minimum_temperature,
+                                                 maximum_temperature,
+                                                 correlation_uncertainty )
+        VALUES( ?, ?, ?, ?, ?, ?, ?, ? );
+        """,
+        (
+            fluid_id,
+            quantity_id,
+            correlation_type_id,
+            float(table.pressures[k]),
+            reference_temperature,
+            float(temperatures.min()),
+            float(temperatures.max()),
+            correlation_uncertainty,
+        )
+        )
+
+        cursor.executemany(
+        """
+        INSERT INTO fluid_property_correlation_coefficients( fluid_id,
+                                                             quantity_id,
+                                                             correlation_type_id,
+                                                             coefficient_number,
+                                                             coefficient_value )
+        VALUES( ?, ?, ?, ?, ? );
+        """,
+        [ ( fluid_id, quantity_id, correlation_type_id, i, float(coefficient), )
+          for i, coefficient in enumerate(coefficients) ]
+        )
+
+        uncertainties.setdefault( ( fluid_id, quantity_id ), [] ).append(
+            ( correlation_uncertainty, correlation_type_id )
+        )
+
+    # The correlation with the smallest uncertainty is preferred.
+    for fluid_id, quantity_id in uncertainties:
+        correlation_uncertainty, correlation_type_id = min(
+            uncertainties[fluid_id,quantity_id]
+        )
+        cursor.execute(
+        """
+        UPDATE fluid_property_correlations
+        SET preferred=TRUE
+        WHERE fluid_id=? AND quantity_id=? AND correlation_type_id=?;
+        """,
+        ( fluid_id, quantity_id, correlation_type_id, )
+        )
+
+if ( __name__ == "__main__" ):
+    db = sd.Database( sys.argv[1], build_mode=True )
+    main( db.cursor )
+    db.commit()
+    db.close()
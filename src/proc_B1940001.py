@@ -6,46 +6,48 @@
 
 import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
-
-flow_class   = sd.FC_BOUNDARY_LAYER
-year         = 1940
-study_number = 1
-
-study_id = sd.add_study(
-    cursor,
-    flow_class_id=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type_id=sd.ST_EXPERIMENT,
-)
-
-sd.add_study_source( cursor, study_id, "SchultzGrunowF+1940+deu+JOUR", sd.PRIMARY_SOURCE )
-
-conn.commit()
-conn.close()
-exit()
-
-reynolds_number_typo_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_reynolds_number_typo.tex".format( study_id ),
-)
-
-station_1_outlier_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_station_1_outlier.tex".format( study_id ),
-)
-
-velocity_method_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_velocity_measurement_technique.tex".format( study_id ),
-)
-
-conn.commit()
-conn.close()
+# The rest of this study, after its sources, is still being entered, so main()
+# stops there unless this is True.
+LOAD_UNFINISHED_DATA = False
+
+def main( cursor ):
+    flow_class   = sd.FC_BOUNDARY_LAYER
+    year         = 1940
+    study_number = 1
+
+    study_id = sd.add_study(
+        cursor,
+        flow_class_id=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type_id=sd.ST_EXPERIMENT,
+    )
+
+    sd.add_study_source( cursor, study_id, "SchultzGrunowF+1940+deu+JOUR", sd.PRIMARY_SOURCE )
+
+    if ( LOAD_UNFINISHED_DATA == False ):
+        return
+
+    reynolds_number_typo_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_reynolds_number_typo.tex".format( study_id ),
+    )
+
+    station_1_outlier_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_station_1_outlier.tex".format( study_id ),
+    )
+
+    velocity_method_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_velocity_measurement_technique.tex".format( study_id ),
+    )
+
+if ( __name__ == "__main__" ):
+    db = sd.Database( sys.argv[1], build_mode=True )
+    main( db.cursor )
+    db.commit()
+    db.close()
@@ -6,31 +6,28 @@
 
 import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
+def main( cursor ):
+    flow_class   = sd.FC_BOUNDARY_LAYER
+    year         = 2010
+    study_number = 2
 
-flow_class   = sd.FC_BOUNDARY_LAYER
-year         = 2010
-study_number = 2
+    study_id = sd.add_study(
+        cursor,
+        flow_class_id=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type_id=sd.ST_DIRECT_NUMERICAL_SIMULATION,
+    )
 
-study_id = sd.add_study(
-    cursor,
-    flow_class_id=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type_id=sd.ST_DIRECT_NUMERICAL_SIMULATION,
-)
+    sd.add_study_source( cursor, study_id, "SchlatterP+2010+eng+JOUR", sd.PRIMARY_SOURCE )
 
-sd.add_study_source( cursor, study_id, "SchlatterP+2010+eng+JOUR", sd.PRIMARY_SOURCE )
+    return
 
-conn.commit()
-conn.close()
-exit()
-
-conn.commit()
-conn.close()
+if ( __name__ == "__main__" ):
+    db = sd.Database( sys.argv[1], build_mode=True )
+    main( db.cursor )
+    db.commit()
+    db.close()
@@ -6,39 +6,36 @@
 
 import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
+def main( cursor ):
+    flow_class   = sd.FC_DUCT_FLOW
+    year         = 1999
+    study_number = 1
 
-flow_class   = sd.FC_DUCT_FLOW
-year         = 1999
-study_number = 1
+    study_id = sd.add_study(
+        cursor,
+        flow_class_id=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type_id=sd.ST_DIRECT_NUMERICAL_SIMULATION,
+    )
 
-study_id = sd.add_study(
-    cursor,
-    flow_class_id=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type_id=sd.ST_DIRECT_NUMERICAL_SIMULATION,
-)
+    sd.add_study_source( cursor, study_id, "MoserRD+1999+eng+JOUR", sd.PRIMARY_SOURCE )
 
-sd.add_study_source( cursor, study_id, "MoserRD+1999+eng+JOUR", sd.PRIMARY_SOURCE )
+    return
 
-conn.commit()
-conn.close()
-exit()
+    # The primary difficulty with this data is that only the friction Reynolds
+    # number is given.  The rest of the data is dimensionless profiles.  The trick
+    # is to manipulate some of the basic equations to be in terms of the bulk
+    # velocity.
 
-# The primary difficulty with this data is that only the friction Reynolds
-# number is given.  The rest of the data is dimensionless profiles.  The trick
-# is to manipulate some of the basic equations to be in terms of the bulk
-# velocity.
+    # bulk_reynolds_number    = 4.0 * bulk_velocity_plus * friction_reynolds_number
+    # fanning_friction_factor = 2.0 * ( bulk_velocity_plus )**(-2.0)
 
-# bulk_reynolds_number    = 4.0 * bulk_velocity_plus * friction_reynolds_number
-# fanning_friction_factor = 2.0 * ( bulk_velocity_plus )**(-2.0)
-
-conn.commit()
-conn.close()
+if ( __name__ == "__main__" ):
+    db = sd.Database( sys.argv[1], build_mode=True )
+    main( db.cursor )
+    db.commit()
+    db.close()
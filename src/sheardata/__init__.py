@@ -0,0 +1,2616 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2022 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import collections
+import math
+import sqlite3
+import sys
+import weakref
+
+# numpy and uncertainties take most of the time needed to import this module,
+# and many scripts (the lists of classifications and notes, for example) only
+# read text columns and never need them.  Both are imported on first use
+# instead.  The module-level names np and ufloat remain available to other
+# modules through __getattr__ below, as do the parts of the submodules that
+# need numpy.
+LAZY_ATTRIBUTES = {
+    "SDArray":                        "sheardata.sdarray",
+    "from_sdfloats":                  "sheardata.sdarray",
+    "FluidPropertyTable":             "sheardata.fluid_properties",
+    "get_fluid_property_table":       "sheardata.fluid_properties",
+    "evaluate_fluid_property":        "sheardata.fluid_properties",
+    "FluidPropertyCorrelation":       "sheardata.fluid_properties",
+    "get_fluid_property_correlation": "sheardata.fluid_properties",
+    "fit_fluid_property_correlation": "sheardata.fluid_properties",
+    "evaluate_correlation":           "sheardata.fluid_properties",
+    "encode_identifiers":             "sheardata.identifiers",
+    "decode_keys":                    "sheardata.identifiers",
+    "split_keys":                     "sheardata.identifiers",
+    "truncate_keys":                  "sheardata.identifiers",
+    "identifier_levels":              "sheardata.identifiers",
+    "truncate_identifiers":           "sheardata.identifiers",
+    "make_readable_identifiers":      "sheardata.identifiers",
+    "count_identifiers":              "sheardata.identifiers",
+    "count_studies":                  "sheardata.identifiers",
+    "stream_row_batches":             "sheardata.query",
+    "stream_rows":                    "sheardata.query",
+    "stream_values":                  "sheardata.query",
+    "stream_record_batches":          "sheardata.query",
+    "stream_points_at_station":       "sheardata.query",
+    "stream_series_components":       "sheardata.query",
+    "stream_point_batches":           "sheardata.query",
+    "load_station_profile":           "sheardata.profiles",
+    "StationFilter":                  "sheardata.filters",
+}
+
+def __getattr__( name ):
+    if ( name == "np" ):
+        import numpy
+        globals()["np"] = numpy
+        return numpy
+    elif ( name == "ufloat" ):
+        from uncertainties import ufloat
+        globals()["ufloat"] = ufloat
+        return ufloat
+    elif ( name in LAZY_ATTRIBUTES ):
+        import importlib
+        module = importlib.import_module( LAZY_ATTRIBUTES[name] )
+        return getattr( module, name )
+    raise AttributeError( "module {!r} has no attribute {!r}".format( __name__, name ) )
+
+# Physical constants
+ABSOLUTE_ZERO                       =    273.15
+STANDARD_ATMOSPHERIC_PRESSURE       = 101325.0
+STANDARD_GRAVITATIONAL_ACCELERATION =      9.80665
+
+AVOGADRO_CONSTANT  = 6.02214076e+23
+BOLTZMANN_CONSTANT = 1.38064900e-23
+MOLAR_GAS_CONSTANT = AVOGADRO_CONSTANT * BOLTZMANN_CONSTANT
+
+# Unit conversion factors
+INCHES_PER_FOOT         = 12.0
+KILOGRAM_PER_POUND_MASS =  0.45359237
+METERS_PER_INCH         =  2.54e-2
+SECONDS_PER_MINUTE      = 60.0
+
+METERS_PER_FOOT             = METERS_PER_INCH * INCHES_PER_FOOT
+NEWTONS_PER_POUND_FORCE     = 1.0 * KILOGRAM_PER_POUND_MASS * STANDARD_GRAVITATIONAL_ACCELERATION
+
+PASCALS_PER_INCH_OF_MERCURY = 3376.85
+PASCALS_PER_METER_OF_WATER  = 1000.0 * STANDARD_GRAVITATIONAL_ACCELERATION
+PASCALS_PER_INCH_OF_WATER   = PASCALS_PER_METER_OF_WATER * METERS_PER_INCH
+PASCALS_PER_PSI             = NEWTONS_PER_POUND_FORCE / METERS_PER_INCH**2.0
+PASCALS_PER_BAR             = 100000.0
+
+# Units, as the scale and offset that convert a value in that unit into SI
+# units,
+#
+#     SI value = scale * value + offset.
+#
+# Column labels in the data files give their units in brackets, like
+# "Pressure [bar]" or "Temperature [°C]" (see split_label).  New units only need
+# a new entry here.
+UNITS = {
+    "1":     (                           1.0,                           0.0 ),
+    "%":     (                          0.01,                           0.0 ),
+    "K":     (                           1.0,                           0.0 ),
+    "°C":    (                           1.0,                 ABSOLUTE_ZERO ),
+    "°R":    (                       5.0/9.0,                           0.0 ),
+    "°F":    (                       5.0/9.0, ABSOLUTE_ZERO - 32.0*5.0/9.0 ),
+    "Pa":    (                           1.0,                           0.0 ),
+    "kPa":   (                        1.0e+3,                           0.0 ),
+    "MPa":   (                        1.0e+6,                           0.0 ),
+    "bar":   (               PASCALS_PER_BAR,                           0.0 ),
+    "atm":   ( STANDARD_ATMOSPHERIC_PRESSURE,                           0.0 ),
+    "inHg":  (   PASCALS_PER_INCH_OF_MERCURY,                           0.0 ),
+    "inH2O": (     PASCALS_PER_INCH_OF_WATER,                           0.0 ),
+    "mH2O":  (    PASCALS_PER_METER_OF_WATER,                           0.0 ),
+    "psia":  (               PASCALS_PER_PSI,                           0.0 ),
+    "psig":  (               PASCALS_PER_PSI, STANDARD_ATMOSPHERIC_PRESSURE ),
+    "m":     (                           1.0,                           0.0 ),
+    "in":    (               METERS_PER_INCH,                           0.0 ),
+    "ft":    (               METERS_PER_FOOT,                           0.0 ),
+    "s":     (                           1.0,                           0.0 ),
+    "min":   (            SECONDS_PER_MINUTE,                           0.0 ),
+    "kg":    (                           1.0,                           0.0 ),
+    "lbm":   (       KILOGRAM_PER_POUND_MASS,                           0.0 ),
+    "N":     (                           1.0,                           0.0 ),
+    "lbf":   (       NEWTONS_PER_POUND_FORCE,                           0.0 ),
+}
+
+# Uncertainties
+UNKNOWN_UNCERTAINTY = None
+
+# Value types
+VT_ANY_AVERAGE              = "A"
+VT_BOTH_AVERAGES            = "B"
+VT_DENSITY_WEIGHTED_AVERAGE = "D"
+VT_MAXIMUM_VALUE            = "N"
+VT_MINIMUM_VALUE            = "M"
+VT_UNAVERAGED_VALUE         = "V"
+VT_UNWEIGHTED_AVERAGE       = "U"
+
+# Facility classes
+FT_FACILITY                   = "F"
+
+FT_EXPERIMENTAL_FACILITY      = "X"
+FT_TUNNEL                     = "T"
+FT_WIND_TUNNEL                = "W"
+FT_OPEN_CIRCUIT_WIND_TUNNEL   = "O"
+FT_CLOSED_CIRCUIT_WIND_TUNNEL = "C"
+FT_BLOWDOWN_WIND_TUNNEL       = "B"
+FT_LUDWIEG_TUBE               = "L"
+FT_SHOCK_TUBE                 = "S"
+FT_WATER_TUNNEL               = "H"
+FT_RANGE                      = "R"
+FT_TOWING_TANK                = "M"
+
+FT_NUMERICAL_FACILITY         = "N"
+FT_FINITE_DIFFERENCE_METHOD   = "D"
+FT_FINITE_ELEMENT_METHOD      = "E"
+FT_FINITE_VOLUME_METHOD       = "V"
+FT_SPECTRAL_METHOD            = "Z"
+
+# Flow classes
+FC_BOUNDARY_LAYER       = "B"
+FC_WALL_BOUNDED_FLOW    = "C"
+FC_DUCT_FLOW            = "D"
+FC_EXTERNAL_FLOW        = "E"
+FC_FREE_SHEAR_FLOW      = "F"
+FC_ISOTROPIC_FLOW       = "G"
+FC_HOMOGENEOUS_FLOW     = "H"
+FC_INTERNAL_FLOW        = "I"
+FC_FREE_JET             = "J"
+FC_WALL_JET             = "K"
+FC_MIXING_LAYER         = "M"
+FC_INHOMOGENEOUS_FLOW   = "N"
+FC_BOUNDARY_DRIVEN_FLOW = "R"
+FC_SHEAR_FLOW           = "S"
+FC_UNCLASSIFIED_FLOW    = "U"
+FC_WAKE                 = "W"
+
+# Flow regimes
+FR_LAMINAR      = "L"
+FR_TRANSITIONAL = "D"
+FR_TURBULENT    = "T"
+
+# Phases
+#
+# The multiphase global can be used for searching in Python functions, but it
+# MUST only be used for the mixture fluid in the fluids table.
+PH_GAS        = "g"
+PH_LIQUID     = "l"
+PH_SOLID      = "s"
+PH_MULTIPHASE = "m"
+
+# Fluids
+F_MIXTURE     = "_mixture"
+F_GASEOUS_AIR = "_gaseous_air"
+F_LIQUID_AIR  = "_liquid_air"
+F_GASEOUS_ARGON             = "Ar(g)"
+F_GASEOUS_CARBON_DIOXIDE    = "CO2(g)"
+F_GASEOUS_DIATOMIC_HYDROGEN = "H2(g)"
+F_GASEOUS_DIATOMIC_NITROGEN = "N2(g)"
+F_GASEOUS_DIATOMIC_OXYGEN   = "O2(g)"
+F_GASEOUS_HELIUM            = "He(g)"
+F_GASEOUS_KRYPTON           = "Kr(g)"
+F_GASEOUS_METHANE           = "CH4(g)"
+F_GASEOUS_NEON              = "Ne(g)"
+F_GASEOUS_NITROGEN_DIOXIDE  = "NO2(g)"
+F_GASEOUS_NITROUS_OXIDE     = "N2O(g)"
+F_GASEOUS_OZONE             = "O3(g)"
+F_GASEOUS_XENON             = "Xe(g)"
+F_LIQUID_WATER              = "H2O(l)"
+F_GASEOUS_WATER             = "H2O(g)"
+
+# Fluid property quantities
+Q_DYNAMIC_VISCOSITY    = "mu"
+Q_KINEMATIC_VISCOSITY  = "nu"
+Q_MASS_DENSITY         = "rho"
+Q_PRANDTL_NUMBER       = "Pr"
+Q_SPECIFIC_VOLUME      = "vbar"
+Q_SPEED_OF_SOUND       = "a"
+Q_THERMAL_CONDUCTIVITY = "lambda"
+Q_THERMAL_DIFFUSIVITY  = "alpha"
+
+# Fluid property correlation types
+CT_EXPONENTIAL_POLYNOMIAL = "E"
+CT_POLYNOMIAL             = "P"
+CT_POWER_LAW              = "W"
+CT_SUTHERLAND_LAW         = "S"
+
+# Classes for instruments and methods (and other sources of information)
+IC_APPROXIMATION                            = "APP"
+IC_ASSUMPTION                               = "ASM"
+IC_CALCULATION                              = "CLC"
+IC_CLAIM                                    = "CLM"
+IC_CLAUSER_METHOD                           = "TCC"
+IC_CONSTANT_CURRENT_HOT_WIRE_ANEMOMETER     = "HWC"
+IC_CONSTANT_TEMPERATURE_HOT_WIRE_ANEMOMETER = "HWT"
+IC_DIFFERENTIAL_PRESSURE_METHOD             = "PTA"
+IC_DIRECT_INJECTION_METHOD                  = "DIJ"
+IC_FLOATING_ELEMENT_BALANCE                 = "FEB"
+IC_FLOWMETER                                = "FQM"
+IC_HOT_WIRE_ANEMOMETER                      = "HWA"
+IC_IMPACT_TUBE                              = "PTI"
+IC_INDEX_OF_REFRACTION_METHOD               = "ORI"
+IC_LASER_DOPPLER_ANEMOMETER                 = "LDA"
+IC_MACH_ZEHNDER_INTERFEROMETER              = "MZI"
+IC_MOMENTUM_BALANCE                         = "TMB"
+IC_OBSERVATION                              = "OBS"
+IC_OPTICAL_SYSTEM                           = "OPT"
+IC_PARTICLE_IMAGE_VELOCIMETER               = "PIV"
+IC_PITOT_STATIC_TUBE                        = "PST"
+IC_PRESTON_TUBE                             = "TPT"
+IC_REASONING                                = "RSN"
+IC_INSTRUMENT                               = "INS"
+IC_SCHLIEREN_SYSTEM                         = "SCH"
+IC_SHADOWGRAPH_SYSTEM                       = "SHD"
+IC_SIMULATION                               = "SIM"
+IC_STANTON_TUBE                             = "TST"
+IC_THERMAL_ANEMOMETER                       = "TAN"
+IC_VELOCITY_PROFILE_METHOD                  = "TVP"
+IC_VISCOUS_SUBLAYER_SLOPE_METHOD            = "TVS"
+IC_WALL_SHEAR_STRESS_METHOD                 = "TWL"
+IC_WEIGHING_METHOD                          = "QWM"
+
+# Model classes
+MC_MODEL                                = "ML"
+MC_INTERIOR_MODEL                       = "IM"
+MC_INTERIOR_CONSTANT_CROSS_SECTION      = "IC"
+MC_INTERIOR_POLYGONAL_CROSS_SECTION     = "IP"
+MC_INTERIOR_RECTANGULAR_CROSS_SECTION   = "IR"
+MC_INTERIOR_ELLIPTICAL_CROSS_SECTION    = "IE"
+MC_INTERIOR_VARIABLE_CROSS_SECTION      = "IV"
+MC_EXTERIOR_MODEL                       = "XM"
+MC_EXTERIOR_BODY                        = "BD"
+MC_EXTERIOR_ELLIPSOID                   = "EL"
+MC_EXTERIOR_ELLIPTIC_CONE               = "EC"
+MC_EXTERIOR_WING                        = "WG"
+MC_EXTERIOR_CONSTANT_CROSS_SECTION_WING = "WC"
+MC_EXTERIOR_PLATE                       = "PL",
+MC_EXTERIOR_WEDGE                       = "WD"
+MC_EXTERIOR_CYLINDER                    = "CY"
+MC_EXTERIOR_DIAMOND_WING                = "DW"
+MC_EXTERIOR_VARIABLE_CROSS_SECTION_WING = "WV"
+
+# Point labels
+PL_CENTER_LINE = "C"
+PL_EDGE        = "E"
+PL_WALL        = "W"
+
+# These point labels are only used to get data.  They are not used inside the
+# database itself.  They distinguish between different situations where there
+# might be multiple walls or edges, with lower having lower point number and
+# upper having the higher point number.  See the method resolve_labeled_points()
+# for the implementation.
+PL_LOWER_EDGE = "LE"
+PL_LOWER_WALL = "LW"
+PL_UPPER_EDGE = "UE"
+PL_UPPER_WALL = "UW"
+
+PL_EDGES = [ PL_LOWER_EDGE, PL_UPPER_EDGE ]
+PL_WALLS = [ PL_LOWER_WALL, PL_UPPER_WALL ]
+
+PL_LOWER = [ PL_LOWER_EDGE, PL_LOWER_WALL ]
+PL_UPPER = [ PL_UPPER_EDGE, PL_UPPER_WALL ]
+
+PL_LOWER_UPPER = [ PL_LOWER_EDGE, PL_LOWER_WALL,
+                   PL_UPPER_EDGE, PL_UPPER_WALL, ]
+
+# Study types
+ST_DIRECT_NUMERICAL_SIMULATION = "DNS"
+ST_EXPERIMENT                  = "EXP"
+ST_LARGE_EDDY_SIMULATION       = "LES"
+
+# Compilations
+C_SELF         = 0 # Originator
+C_CH_1969      = 1 # Coles and Hirst
+C_BE_1973      = 2 # Birch and Eggers
+C_FF_1977      = 3 # Fernholz and Finley
+C_ERCOFTAC     = 4 # ERCOFTAC Classic Collection
+C_AGARD_AR_345 = 5 # AGARD-AR-345 (Test cases for LES)
+
+# Source classifications
+PRIMARY_SOURCE   = 1
+SECONDARY_SOURCE = 2
+TERTIARY_SOURCE  = 3
+
+def split_float( value ):
+    if ( isinstance( value, float ) ):
+        sql_value       = value
+        sql_uncertainty = UNKNOWN_UNCERTAINTY
+    else:
+        sql_value       = value.n
+        sql_uncertainty = value.s
+        if ( math.isnan(sql_uncertainty) ):
+            sql_uncertainty = UNKNOWN_UNCERTAINTY
+    return sql_value, sql_uncertainty
+
+def sdfloat( sql_value, sql_uncertainty=UNKNOWN_UNCERTAINTY ):
+    from uncertainties import ufloat
+    uncertainty = float(0.0)
+    if ( sql_uncertainty == UNKNOWN_UNCERTAINTY ):
+        uncertainty = float("nan")
+    else:
+        uncertainty = float(sql_uncertainty)
+    return ufloat( float(sql_value), uncertainty )
+
+def sdfloat_value( value ):
+    value, uncertainty = split_float(value)
+    return value
+
+def sdfloat_uncertainty( value ):
+    value, uncertainty = split_float(value)
+    return uncertainty
+
+def fetch_float( cursor ):
+    result = cursor.fetchone()
+    return sdfloat( result[0], result[1] )
+
+# Splits a column label like "Pressure [bar]" into its name and its unit.  The
+# unit is None for a label without one.
+def split_label( label ):
+    label = label.strip()
+    if ( label.endswith("]") and "[" in label ):
+        name, unit = label[:-1].rsplit( "[", 1 )
+        return name.strip(), unit.strip()
+    return label, None
+
+# Returns the scale and offset that convert values in the given unit into SI
+# units.
+def unit_conversion( unit ):
+    if ( unit not in UNITS ):
+        raise ValueError( "unknown unit {!r}".format( unit ) )
+    return UNITS[unit]
+
+# Converts values (a number or a NumPy array) in the given unit into SI units.
+def convert_to_si_units( values, unit ):
+    scale, offset = unit_conversion( unit )
+    return scale * values + offset
+
+def uniform_distribution_sdfloat( min_value, max_value ):
+    value = 0.5 * ( min_value + max_value )
+    uncertainty = ( max_value - min_value ) / 12.0**0.5
+    return sdfloat( value, uncertainty )
+
+def uniform_distribution_sdfloat_magnitude( value, uncertainty_magnitude ):
+    return uniform_distribution_sdfloat( value - uncertainty_magnitude,
+                                         value + uncertainty_magnitude )
+
+def uniform_distribution_sdfloat_percent( value, uncertainty_percent ):
+    return uniform_distribution_sdfloat_magnitude( value, value * uncertainty_percent / 100.0 )
+
+def pick_any_average_value_type( value_type_ids ):
+    assert( len(value_type_ids) != 0 )
+    if ( len(value_type_ids) == 1 ):
+        return value_type_ids[0]
+    else:
+        # Prefer density-weighted averages over unweighted averages.
+        if ( VT_DENSITY_WEIGHTED_AVERAGE in value_type_ids ):
+            return VT_DENSITY_WEIGHTED_AVERAGE
+        elif ( VT_UNWEIGHTED_AVERAGE in value_type_ids ):
+            return VT_UNWEIGHTED_AVERAGE
+        else:
+            return value_type_ids[0]
+
+# Fields of the identifiers, with the number of digits of each field in the
+# identifier and the number of bits of each field in a packed key.  A study
+# identifier has the first three fields, a series identifier the first four,
+# and so on.  The identifier levels are the numbers of fields.
+#
+# The tables that refer to points use a packed integer point key instead of the
+# 18-character point identifier, since points are by far the most numerous rows
+# and every value table repeats the key of each point.  The key packs the
+# fields into 63 bits, from the most significant bits to the least significant
+# bits, so the keys sort in the same order as the identifiers and either one
+# can be calculated from the other without a query.  The flow class is stored
+# as the offset of its letter from "A".
+IDENTIFIER_FIELDS = [
+    ( "flow_class_id",  1,  5 ),
+    ( "year",           4, 14 ),
+    ( "study_number",   3, 10 ),
+    ( "series_number",  3, 10 ),
+    ( "station_number", 3, 10 ),
+    ( "point_number",   4, 14 ),
+]
+
+IL_STUDY   = 3
+IL_SERIES  = 4
+IL_STATION = 5
+IL_POINT   = 6
+
+def format_identifier( fields, readable=False ):
+    separator = ""
+    if ( readable ):
+        separator = "-"
+
+    parts = [ str(fields[0]) ]
+    for field, ( name, digits, bits ) in zip( fields[1:], IDENTIFIER_FIELDS[1:] ):
+        parts.append( "{:0{:d}d}".format( int(field), digits ) )
+    return separator.join( parts )
+
+def identify_study( flow_class_id, year, study_number, readable=False ):
+    return format_identifier(
+        [ flow_class_id, year, study_number, ],
+        readable=readable,
+    )
+
+def identify_series( flow_class_id, year, study_number, series_number, \
+                     readable=False ):
+    return format_identifier(
+        [ flow_class_id, year, study_number, series_number, ],
+        readable=readable,
+    )
+
+def identify_station( flow_class_id, year, study_number, series_number, \
+                      station_number, readable=False ):
+    return format_identifier(
+        [ flow_class_id, year, study_number, series_number, station_number, ],
+        readable=readable,
+    )
+
+def identify_point( flow_class_id, year, study_number, series_number, \
+                    station_number, point_number, readable=False ):
+    return format_identifier(
+        [ flow_class_id, year, study_number, series_number, station_number,
+          point_number, ],
+        readable=readable,
+    )
+
+def identify_point_key( flow_class_id, year, study_number, series_number, \
+                        station_number, point_number ):
+    fields = [
+        ord(str(flow_class_id)) - ord("A"),
+        int(year),
+        int(study_number),
+        int(series_number),
+        int(station_number),
+        int(point_number),
+    ]
+
+    point_key = 0
+    for field, ( name, digits, bits ) in zip( fields, IDENTIFIER_FIELDS ):
+        if ( field < 0 or field >= 2**bits ):
+            raise ValueError( "{:s} out of range for a point key: {!r}".format(
+                name,
+                field,
+            ) )
+        point_key = ( point_key << bits ) | field
+    return point_key
+
+# Returns the flow class, year, study number, series number, station number,
+# and point number packed into a point key.
+def split_point_key( point_key ):
+    point_key = int(point_key)
+    fields = []
+    for name, digits, bits in reversed(IDENTIFIER_FIELDS):
+        fields.append( point_key & ( 2**bits - 1 ) )
+        point_key >>= bits
+    fields.reverse()
+    fields[0] = chr( fields[0] + ord("A") )
+    return tuple(fields)
+
+def point_id_to_key( point_id ):
+    sanitized_point_id = sanitize_identifier( point_id )
+    return identify_point_key(
+        sanitized_point_id[0:1],
+        sanitized_point_id[1:5],
+        sanitized_point_id[5:8],
+        sanitized_point_id[8:11],
+        sanitized_point_id[11:14],
+        sanitized_point_id[14:18],
+    )
+
+def point_key_to_id( point_key, readable=False ):
+    return identify_point( *split_point_key( point_key ), readable=readable )
+
+# Identifiers are strings, but a point key is accepted anywhere that a point
+# identifier is, so that the truncate_to_* functions also work on point keys.
+def sanitize_identifier( identifier ):
+    if ( isinstance( identifier, str ) == False ):
+        identifier = point_key_to_id( identifier )
+    return identifier.replace("-","")
+
+def make_readable_identifier( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    readable_identifier = sanitized_identifier[0:1] \
+                        + "-"                       \
+                        + sanitized_identifier[1:5] \
+                        + "-"                       \
+                        + sanitized_identifier[5:8]
+    if ( len(sanitized_identifier) > 8 ):
+        readable_identifier += "-" + sanitized_identifier[8:11]
+    if ( len(sanitized_identifier) > 11 ):
+        readable_identifier += "-" + sanitized_identifier[11:14]
+    if ( len(sanitized_identifier) > 14 ):
+        readable_identifier += "-" + sanitized_identifier[14:18]
+    return readable_identifier
+
+def truncate_to_study_id( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    return sanitized_identifier[0:8]
+
+def truncate_to_series_id( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    return sanitized_identifier[0:11]
+
+def truncate_to_station_id( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    return sanitized_identifier[0:14]
+
+def add_study( cursor, flow_class_id, year, study_number, study_type_id,
+               outlier=False, note_ids=[], study_external_ids={}, ):
+    study_id = identify_study( flow_class_id, year, study_number )
+    cursor.execute(
+    """
+    INSERT INTO studies( study_id, flow_class_id, year, study_number,
+                         study_type_id, outlier )
+    VALUES( ?, ?, ?, ?, ?, ? );
+    """,
+    (
+        study_id,
+        str(flow_class_id),
+        int(year),
+        int(study_number),
+        str(study_type_id),
+        int(outlier),
+    )
+    )
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO study_notes( study_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            study_id,
+            int(note_id),
+        )
+        )
+
+    for compilation_id in study_external_ids:
+        cursor.execute(
+        """
+        INSERT INTO study_external_ids( study_id, compilation_id,
+                                        study_external_id )
+        VALUES( ?, ?, ? );
+        """,
+        (
+            study_id,
+            int(compilation_id),
+            study_external_ids[compilation_id],
+        )
+        )
+
+    return study_id
+
+def update_study_description( cursor, study_id, study_description ):
+    cursor.execute(
+    """
+    UPDATE studies
+    SET study_description=?
+    WHERE study_id=?;
+    """,
+    (
+        study_description.strip(),
+        sanitize_identifier(study_id),
+    )
+    )
+
+def update_study_provenance( cursor, study_id, study_provenance ):
+    cursor.execute(
+    """
+    UPDATE studies
+    SET study_provenance=?
+    WHERE study_id=?:
+    """,
+    (
+        study_provenance.strip(),
+        sanitize_identifier(study_id),
+    )
+    )
+
+def create_value_types_list( value_type_id ):
+    if ( value_type_id == VT_BOTH_AVERAGES ):
+        return [ VT_DENSITY_WEIGHTED_AVERAGE,
+                       VT_UNWEIGHTED_AVERAGE, ]
+    else:
+        return [ value_type_id ]
+
+def add_study_source( cursor, study_id, citation_key,
+                      source_classification_id=PRIMARY_SOURCE ):
+    cursor.execute(
+    """
+    INSERT INTO study_sources( study_id, citation_key, source_classification_id )
+    VALUES( ?, ?, ? );
+    """,
+    (
+        sanitize_identifier(study_id),
+        str(citation_key),
+        int(source_classification_id),
+    )
+    )
+
+def add_series( cursor, flow_class_id, year, study_number, series_number,  \
+                number_of_dimensions, facility_id=None,
+                model_id=None, outlier=False, note_ids=[],
+                series_external_ids={}, ):
+    series_id = identify_series(
+        flow_class_id,
+        year,
+        study_number,
+        series_number,
+    )
+    study_id = identify_study(
+        flow_class_id,
+        year,
+        study_number,
+    )
+    cursor.execute(
+    """
+    INSERT INTO series( series_id, study_id, series_number,
+                        number_of_dimensions, facility_id, model_id, outlier )
+    VALUES( ?, ?, ?, ?, ?, ?, ? );
+    """,
+    (
+        series_id,
+        study_id,
+        int(series_number),
+        int(number_of_dimensions),
+        facility_id,
+        model_id,
+        int(outlier),
+    )
+    )
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO series_notes( series_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            series_id,
+            int(note_id),
+        )
+        )
+
+    for compilation_id in series_external_ids:
+        cursor.execute(
+        """
+        INSERT INTO series_external_ids( series_id, compilation_id,
+                                         series_external_id )
+        VALUES( ?, ?, ? );
+        """,
+        (
+            series_id,
+            int(compilation_id),
+            series_external_ids[compilation_id],
+        )
+        )
+
+    return series_id
+
+def update_series_description( cursor, series_id, series_description ):
+    cursor.execute(
+    """
+    UPDATE series
+    SET series_description=?
+    WHERE series_id=?;
+    """,
+    (
+        series_description.strip(),
+        sanitize_identifier(series_id),
+    )
+    )
+
+def add_series_component( cursor, series_id, fluid_id ):
+    cursor.execute(
+    """
+    INSERT INTO series_components( series_id, fluid_id )
+    VALUES( ?, ? );
+    """,
+    (
+        series_id,
+        fluid_id,
+    )
+    )
+
+def add_air_components_to_series( cursor, series_id ):
+    air_mixture = [
+        F_GASEOUS_ARGON,
+        F_GASEOUS_CARBON_DIOXIDE,
+        F_GASEOUS_DIATOMIC_NITROGEN,
+        F_GASEOUS_DIATOMIC_OXYGEN,
+        F_WATER_VAPOR,
+    ]
+    for fluid_id in air_mixture:
+        add_series_component( cursor, series_id, fluid_id )
+
+def get_series_components( cursor, series_id ):
+    cursor.execute(
+    """
+    SELECT fluid_id
+    FROM series_components
+    WHERE series_id=?;
+    """,
+    (
+        series_id,
+    )
+    )
+
+    fluid_ids = []
+    for result in cursor:
+        fluid_ids.append( result[0] )
+
+    return fluid_ids
+
+# TODO: There probably is a better way to do this.
+def is_air_working_fluid( cursor, series_id ):
+    fluid_ids = get_series_components( cursor, series_id )
+    minimum_air_components = [
+        GASEOUS_DIATOMIC_NITROGEN,
+        GASEOUS_DIATOMIC_OXYGEN,
+    ]
+    for fluid_id in minimum_air_components:
+        if ( fluid_id not in fluid_ids ):
+            return False
+    return True
+
+def add_station( cursor, flow_class_id, year, study_number, series_number,
+                 station_number, streamwise_periodic=False,
+                 spanwise_periodic=True, outlier=False, parent_station_id=None,
+                 note_ids=[], station_external_ids={}, ):
+    station_id = identify_station(
+        flow_class_id,
+        year,
+        study_number,
+        series_number,
+        station_number,
+    )
+    series_id = identify_series(
+        flow_class_id,
+        year,
+        study_number,
+        series_number,
+    )
+    cursor.execute(
+    """
+    INSERT INTO stations( station_id, series_id, station_number,
+                          streamwise_periodic, spanwise_periodic, outlier )
+    VALUES( ?, ?, ?, ?, ?, ? );
+    """,
+    (
+        station_id,
+        series_id,
+        int(station_number),
+        int(streamwise_periodic),
+        int(spanwise_periodic),
+        int(outlier),
+    )
+    )
+
+    if ( parent_station_id == None ):
+        cursor.execute(
+        """
+        INSERT INTO station_paths( station_ancestor_id,
+                                   station_descendant_id,
+                                   station_path_length )
+        VALUES( ?, ?, 0 );
+        """,
+        (
+            str(station_id),
+            str(station_id),
+        )
+        )
+    else:
+        cursor.execute(
+        """
+        INSERT INTO station_paths( station_ancestor_id,
+                                   station_descendant_id,
+                                   station_path_length )
+        SELECT ?, ?, 0
+        UNION ALL
+        SELECT tmp.station_ancestor_id, ?, tmp.station_path_length+1
+        FROM station_paths as tmp
+        WHERE tmp.station_descendant_id = ?;
+        """,
+        (
+            str(station_id),
+            str(station_id),
+            str(station_id),
+            str(parent_station_id),
+        )
+        )
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO station_notes( station_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            station_id,
+            int(note_id),
+        )
+        )
+
+    for compilation_id in station_external_ids:
+        cursor.execute(
+        """
+        INSERT INTO station_external_ids( station_id, compilation_id,
+                                          station_external_id )
+        VALUES( ?, ?, ? );
+        """,
+        (
+            station_id,
+            int(compilation_id),
+            station_external_ids[compilation_id],
+        )
+        )
+
+    return station_id
+
+def get_points_at_station( cursor, station_id ):
+    cursor.execute(
+    """
+    SELECT point_id
+    FROM points
+    WHERE station_id=?;
+    """,
+    (
+        station_id,
+    )
+    )
+
+    point_ids = []
+    for result in cursor:
+        point_ids.append( str(result[0]) )
+
+    return point_ids
+
+def add_point( cursor, flow_class_id, year, study_number, series_number,
+               station_number, point_number, point_label_id=None,
+               outlier=False, note_ids=[], point_external_ids={}, ):
+    point_ids = add_points(
+        cursor,
+        flow_class_id,
+        year,
+        study_number,
+        series_number,
+        station_number,
+        [ point_number ],
+        point_label_ids=[ point_label_id ],
+        outliers=[ outlier ],
+        note_ids=[ note_ids ],
+        point_external_ids=[ point_external_ids ],
+    )
+    return point_ids[0]
+
+# Bulk version of add_point() for a single station.  Every argument after the
+# point numbers is either None or a sequence with one entry per point: a label
+# (or None), an outlier flag, a list of note IDs, and a dictionary of external
+# IDs keyed by compilation.  All rows go in using one executemany() per table,
+# so they become part of the caller's current transaction like any other
+# insertion.
+def add_points( cursor, flow_class_id, year, study_number, series_number,
+                station_number, point_numbers, point_label_ids=None,
+                outliers=None, note_ids=None, point_external_ids=None, ):
+    number_of_points = len(point_numbers)
+    if ( point_label_ids == None ):
+        point_label_ids = [ None ] * number_of_points
+    if ( outliers == None ):
+        outliers = [ False ] * number_of_points
+    if ( note_ids == None ):
+        note_ids = [ [] ] * number_of_points
+    if ( point_external_ids == None ):
+        point_external_ids = [ {} ] * number_of_points
+
+    assert( len(point_label_ids)    == number_of_points )
+    assert( len(outliers)           == number_of_points )
+    assert( len(note_ids)           == number_of_points )
+    assert( len(point_external_ids) == number_of_points )
+
+    station_id = identify_station(
+        flow_class_id,
+        year,
+        study_number,
+        series_number,
+        station_number,
+    )
+
+    point_ids     = []
+    point_rows    = []
+    note_rows     = []
+    external_rows = []
+    for i in range(number_of_points):
+        point_id = identify_point(
+            flow_class_id,
+            year,
+            study_number,
+            series_number,
+            station_number,
+            point_numbers[i],
+        )
+        point_key = identify_point_key(
+            flow_class_id,
+            year,
+            study_number,
+            series_number,
+            station_number,
+            point_numbers[i],
+        )
+        point_ids.append( point_id )
+        point_rows.append( (
+            point_key,
+            point_id,
+            station_id,
+            int(point_numbers[i]),
+            point_label_ids[i],
+            int(outliers[i]),
+        ) )
+
+        for note_id in note_ids[i]:
+            note_rows.append( (
+                point_key,
+                int(note_id),
+            ) )
+
+        for compilation_id in point_external_ids[i]:
+            external_rows.append( (
+                point_key,
+                int(compilation_id),
+                point_external_ids[i][compilation_id],
+            ) )
+
+    cursor.executemany(
+    """
+    INSERT INTO points( point_key, point_id, station_id, point_number,
+                        point_label_id, outlier )
+    VALUES( ?, ?, ?, ?, ?, ? );
+    """,
+    point_rows
+    )
+
+    if ( len(note_rows) != 0 ):
+        cursor.executemany(
+        """
+        INSERT INTO point_notes( point_key, note_id )
+        VALUES( ?, ? );
+        """,
+        note_rows
+        )
+
+    if ( len(external_rows) != 0 ):
+        cursor.executemany(
+        """
+        INSERT INTO point_external_ids( point_key, compilation_id,
+                                        point_external_id )
+        VALUES( ?, ?, ? );
+        """,
+        external_rows
+        )
+
+    return point_ids
+
+def sanitize_point_label( point_label_id ):
+    sanitized_point_label_id = str(point_label_id)
+    if ( point_label_id in PL_EDGES ):
+        sanitized_point_label_id = PL_EDGE
+    elif ( point_label_id in PL_WALLS ):
+        sanitized_point_label_id = PL_WALL
+    return sanitized_point_label_id
+
+def locate_labeled_points( cursor, station_id, point_label_id ):
+    if ( point_label_id in PL_LOWER_UPPER ):
+        return [ locate_labeled_point( cursor, station_id, point_label_id ) ]
+
+    cursor.execute(
+    """
+    SELECT point_id
+    FROM points
+    WHERE station_id=? AND point_label_id=?
+    ORDER BY point_number;
+    """,
+    (
+        sanitize_identifier(station_id),
+        str(point_label_id),
+    )
+    )
+
+    point_ids = []
+    for result in cursor:
+        point_ids.append( str(result[0]) )
+
+    return point_ids
+
+# Returns a dictionary keyed by station ID of dictionaries keyed by point label.
+# Each lower or upper point label (see PL_LOWER_UPPER) gives the point ID of the
+# labeled point with the lowest or highest point number, or None if the station
+# has no such point, and every other point label gives a list of the point IDs
+# of all points with that label, in order of point number.  A list of station
+# IDs of None resolves the labels for every station.
+#
+# The station IDs go into a temporary table rather than a list of parameters,
+# so that there is no limit on their number.  The table is kept and emptied
+# between calls, since creating and dropping it changes the schema and costs
+# more than the query itself for a single station.  The lower and upper points
+# come from window functions over the points of each station and label.  A
+# temporary table has no statistics until it is analyzed, and without them the
+# query planner may build an automatic index over every point in the database
+# or scan every point, even when resolving a single station.  The CROSS JOIN
+# keeps the temporary table as the outer loop, so that each station is a
+# search of points_by_station.
+def resolve_labeled_points( cursor, station_ids, point_label_ids ):
+    sanitized_point_label_ids = []
+    for point_label_id in point_label_ids:
+        sanitized_point_label_id = sanitize_point_label( point_label_id )
+        if ( sanitized_point_label_id not in sanitized_point_label_ids ):
+            sanitized_point_label_ids.append( sanitized_point_label_id )
+
+    cursor.execute(
+    """
+    CREATE TEMP TABLE IF NOT EXISTS resolved_stations (
+        station_id TEXT PRIMARY KEY
+    );
+    """
+    )
+    cursor.execute( "DELETE FROM temp.resolved_stations;" )
+    if ( station_ids == None ):
+        cursor.execute(
+        """
+        INSERT INTO temp.resolved_stations
+        SELECT station_id
+        FROM stations;
+        """
+        )
+    else:
+        cursor.executemany(
+        """
+        INSERT OR IGNORE INTO temp.resolved_stations( station_id )
+        VALUES( ? );
+        """,
+        [ ( sanitize_identifier(station_id), ) for station_id in station_ids ]
+        )
+    cursor.execute( "ANALYZE temp.resolved_stations;" )
+
+    cursor.execute(
+    """
+    SELECT points.station_id, points.point_label_id, points.point_id,
+           points.point_number = MIN( points.point_number ) OVER labeled_points,
+           points.point_number = MAX( points.point_number ) OVER labeled_points
+    FROM temp.resolved_stations
+    CROSS JOIN points
+    ON points.station_id = resolved_stations.station_id
+    WHERE points.point_label_id IN ( {:s} )
+    WINDOW labeled_points AS (
+        PARTITION BY points.station_id, points.point_label_id
+    )
+    ORDER BY points.station_id, points.point_label_id, points.point_number;
+    """.format( ", ".join( "?" for point_label_id in sanitized_point_label_ids ) ),
+    sanitized_point_label_ids
+    )
+
+    lower_points = {}
+    upper_points = {}
+    labeled_points = {}
+    for station_id, point_label_id, point_id, is_lower, is_upper in cursor:
+        labeled_points.setdefault( ( station_id, point_label_id ), [] ).append(
+            str(point_id)
+        )
+        if ( is_lower ):
+            lower_points[station_id,point_label_id] = str(point_id)
+        if ( is_upper ):
+            upper_points[station_id,point_label_id] = str(point_id)
+
+    cursor.execute(
+    """
+    SELECT station_id
+    FROM temp.resolved_stations
+    ORDER BY station_id;
+    """
+    )
+    resolved_station_ids = [ str(result[0]) for result in cursor.fetchall() ]
+    cursor.execute( "DELETE FROM temp.resolved_stations;" )
+
+    resolved_points = {}
+    for station_id in resolved_station_ids:
+        resolved_points[station_id] = {}
+        for point_label_id in point_label_ids:
+            key = ( station_id, sanitize_point_label( point_label_id ) )
+            if ( point_label_id in PL_LOWER ):
+                resolved_points[station_id][point_label_id] = \
+                    lower_points.get( key )
+            elif ( point_label_id in PL_UPPER ):
+                resolved_points[station_id][point_label_id] = \
+                    upper_points.get( key )
+            else:
+                resolved_points[station_id][point_label_id] = \
+                    labeled_points.get( key, [] )
+
+    return resolved_points
+
+def locate_labeled_point( cursor, station_id, point_label_id ):
+    resolved_points = resolve_labeled_points(
+        cursor,
+        [ station_id ],
+        [ point_label_id ],
+    )
+    resolved_point = resolved_points[sanitize_identifier(station_id)][point_label_id]
+    if ( point_label_id in PL_LOWER_UPPER ):
+        return resolved_point
+
+    # An unqualified label gives the lower point.
+    if ( len(resolved_point) == 0 ):
+        return None
+    return resolved_point[0]
+
+def add_facility( cursor, facility_class_id, facility_name, iso_country_code,
+                  organization_name=None, start_year=None, end_year=None,
+                  predecessor_facility_id=None, successor_facility_id=None,
+                  note_ids=[] ):
+    cursor.execute(
+    """
+    INSERT INTO facilities( facility_class_id, facility_name, iso_country_code,
+                            organization_name, start_year, end_year,
+                            predecessor_facility_id, successor_facility_id )
+    VALUES( ?, ?, ?, ?, ?, ?, ?, ? );
+    """,
+    (
+        str(facility_class_id),
+        str(facility_name),
+        str(iso_country_code),
+        organization_name,
+        start_year,
+        end_year,
+        predecessor_facility_id,
+        successor_facility_id,
+    )
+    )
+
+    cursor.execute(
+    """
+    SELECT last_insert_rowid();
+    """
+    )
+    facility_id = int(cursor.fetchone()[0])
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO facility_notes( facility_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            int(facility_id),
+            int(note_id),
+        )
+        )
+
+    return facility_id
+
+def add_facility_source( cursor, facility_id, citation_key,
+                         source_classification_id=PRIMARY_SOURCE ):
+    cursor.execute(
+    """
+    INSERT INTO facility_sources( facility_id, citation_key,
+                                  source_classification_id )
+    VALUES( ?, ?, ? );
+    """,
+    (
+        int(facility_id),
+        str(citation_key),
+        int(source_classification_id),
+    )
+    )
+
+def add_instrument( cursor, instrument_class_id, instrument_name=None,
+                    note_ids=[] ):
+    cursor.execute(
+    """
+    INSERT INTO instruments( instrument_class_id, instrument_name )
+    VALUES( ?, ? );
+    """,
+    (
+        str(instrument_class_id),
+        instrument_name,
+    )
+    )
+
+    cursor.execute(
+    """
+    SELECT last_insert_rowid();
+    """
+    )
+    instrument_id = int(cursor.fetchone()[0])
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO instrument_notes( instrument_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            int(instrument_id),
+            int(note_id),
+        )
+        )
+
+    return instrument_id
+
+def add_instrument_source( cursor, instrument_id, citation_key,
+                           source_classification_id=PRIMARY_SOURCE ):
+    cursor.execute(
+    """
+    INSERT INTO instrument_sources( instrument_id, citation_key,
+                                    source_classification_id )
+    VALUES( ?, ?, ? );
+    """,
+    (
+        int(instrument_id),
+        str(citation_key),
+        int(source_classification_id),
+    )
+    )
+
+def add_model( cursor, model_class_id, model_name=None, note_ids=[] ):
+    cursor.execute(
+    """
+    INSERT INTO models( model_class_id, model_name )
+    VALUES( ?, ? );
+    """,
+    (
+        str(model_class_id),
+        model_name,
+    )
+    )
+
+    cursor.execute(
+    """
+    SELECT last_insert_rowid();
+    """
+    )
+    model_id = int(cursor.fetchone()[0])
+
+    for note_id in note_ids:
+        cursor.execute(
+        """
+        INSERT INTO model_notes( model_id, note_id )
+        VALUES( ?, ? );
+        """,
+        (
+            int(model_id),
+            int(note_id),
+        )
+        )
+
+    return model_id
+
+def add_model_source( cursor, model_id, citation_key,
+                      source_classification_id=PRIMARY_SOURCE ):
+    cursor.execute(
+    """
+    INSERT INTO model_sources( model_id, citation_key, source_classification_id )
+    VALUES( ?, ?, ? );
+    """,
+    (
+        int(model_id),
+        str(citation_key),
+        int(source_classification_id),
+    )
+    )
+
+def integrate_using_trapezoid_rule( x, f, F0=None ):
+    if ( F0 == None ):
+        F0 = sdfloat(0.0,0.0)
+    F = F0
+    for i in range(len(x)-1):
+        F += 0.5 * ( x[i+1] - x[i] ) * ( f[i+1] + f[i] )
+    return F
+
+def extract_element_counts( formula ):
+    element_counts = {}
+
+    fragments = []
+    i_start = 0
+    i_end   = 0
+    for i_end in range(len(formula)):
+        if ( formula[i_end].isupper() and i_end != 0 ):
+            fragments.append( formula[i_start:i_end] )
+            i_start = i_end
+    fragments.append( formula[i_start:i_end+1] )
+
+    for fragment in fragments:
+        i = 0
+        while ( i < len(fragment) and fragment[i].isdigit() == False ):
+            i += 1
+        if ( i == len(fragment) ):
+            element = fragment
+            count   = 1
+        else:
+            element = str(fragment[:i])
+            count   = int(fragment[i:])
+        element_counts[element] = count
+
+    return element_counts
+
+def count_total_atoms( formula ):
+    element_counts = extract_element_counts( formula )
+    total_atoms = 0
+    for element in element_counts:
+        total_atoms += element_counts[element]
+    assert( total_atoms > 0 )
+    return total_atoms
+
+def get_degrees_of_freedom_for_element( formula ):
+    total_atoms = count_total_atoms( formula )
+    if ( total_atoms == 1 ):
+        return 3
+    elif ( total_atoms == 2 ):
+        return 5
+    # TODO: Develop a better method for this.
+    assert( total_atoms < 3 )
+    return 0
+
+# In-memory copy of the elements and fluids tables, along with the parsed
+# molecular formulas and molar masses calculated from them.  The mixture
+# functions below ask for the same few molar masses many times for every
+# station, so they use one Chemistry object per connection (see get_chemistry)
+# rather than querying the database each time.  The object is replaced after
+# this connection changes either table (see get_connection_cache).
+class Chemistry:
+    atomic_weights      = None
+    molecular_formulas  = None
+    element_counts      = None
+    molar_masses        = None
+    mixture_properties  = None
+
+    def __init__( self, cursor ):
+        self.atomic_weights     = {}
+        self.molecular_formulas = {}
+        self.element_counts     = {}
+        self.molar_masses       = {}
+        self.mixture_properties = collections.OrderedDict()
+
+        cursor.execute(
+        """
+        SELECT element_symbol, conventional_atomic_weight
+        FROM elements;
+        """
+        )
+        for element_symbol, conventional_atomic_weight in cursor.fetchall():
+            self.atomic_weights[element_symbol] = conventional_atomic_weight
+
+        cursor.execute(
+        """
+        SELECT fluid_id, molecular_formula
+        FROM fluids;
+        """
+        )
+        for fluid_id, molecular_formula in cursor.fetchall():
+            self.molecular_formulas[fluid_id] = molecular_formula
+
+    def get_element_counts( self, formula ):
+        if ( formula not in self.element_counts ):
+            self.element_counts[formula] = extract_element_counts( formula )
+        return self.element_counts[formula]
+
+    def get_molecular_formula( self, fluid_id ):
+        return str(self.molecular_formulas[fluid_id])
+
+    def calculate_molar_mass_of_molecular_formula( self, formula ):
+        element_counts = self.get_element_counts( formula )
+        molar_mass      = sdfloat(0.0,0.0)
+        for element in element_counts:
+            count = element_counts[element]
+            atomic_weight = sdfloat(self.atomic_weights[element],0.0)
+            molar_mass += count * 1.0e-3 * atomic_weight
+        return molar_mass
+
+    def calculate_molar_mass_of_component( self, fluid_id ):
+        if ( fluid_id not in self.molar_masses ):
+            self.molar_masses[fluid_id] = self.calculate_molar_mass_of_molecular_formula(
+                self.get_molecular_formula( fluid_id )
+            )
+        return self.molar_masses[fluid_id]
+
+# Caches of data read from the database, such as the Chemistry objects, kept
+# separately for every open connection.
+#
+# The sqlite3 connections themselves cannot be weakly referenced, but instances
+# of a subclass can, so Database opens its connections as Connection objects,
+# and their caches go away along with them.  The caches of any other
+# connection are kept by id(connection), along with the connection itself so
+# that the id cannot be reused while the entry exists.  Those entries are
+# dropped once their connection is closed, and at most
+# PLAIN_CONNECTION_CACHE_LIMIT of them are kept, dropping the least recently
+# used one first.  Call drop_connection_caches before closing such a
+# connection to release it at once.
+class Connection( sqlite3.Connection ):
+    pass
+
+PLAIN_CONNECTION_CACHE_LIMIT = 8
+
+connection_caches       = weakref.WeakKeyDictionary()
+plain_connection_caches = collections.OrderedDict()
+
+def is_open_connection( connection ):
+    try:
+        connection.total_changes
+    except sqlite3.ProgrammingError:
+        return False
+    return True
+
+def get_connection_caches( connection ):
+    try:
+        return connection_caches.setdefault( connection, {} )
+    except TypeError:
+        pass
+
+    key = id(connection)
+    if ( key in plain_connection_caches ):
+        plain_connection_caches.move_to_end( key )
+        return plain_connection_caches[key][1]
+
+    for other_key, ( other_connection, caches ) in list( plain_connection_caches.items() ):
+        if ( is_open_connection( other_connection ) == False ):
+            del plain_connection_caches[other_key]
+    while ( len(plain_connection_caches) >= PLAIN_CONNECTION_CACHE_LIMIT ):
+        plain_connection_caches.popitem( last=False )
+
+    caches = {}
+    plain_connection_caches[key] = ( connection, caches )
+    return caches
+
+def drop_connection_caches( connection ):
+    try:
+        connection_caches.pop( connection, None )
+    except TypeError:
+        plain_connection_caches.pop( id(connection), None )
+
+# The version of each cached table counts the changes to its rows (see
+# create_table_version_triggers), so a cache built from some tables is out of
+# date once the sum of their versions changes.  The version is read using a new
+# cursor, so that the caller's cursor can still be iterated over.
+def read_table_version( cursor, tables ):
+    result = cursor.connection.execute(
+        "SELECT SUM(version) FROM table_versions WHERE table_name IN ( {:s} );".format(
+            ", ".join( [ "?" ] * len(tables) )
+        ),
+        tuple(tables),
+    ).fetchone()
+    return int(result[0])
+
+# Returns the cache with the given name, creating it when needed.  A cache of
+# the rows of some tables is created again once those tables change.  Their
+# versions are only read again after this connection has changed some rows, as
+# counted by its total_changes, so using a cache otherwise runs no query at
+# all.  Changes made through other connections are only seen after
+# invalidate_connection_caches.
+def get_connection_cache( cursor, name, create_cache, tables=() ):
+    connection = cursor.connection
+    caches = get_connection_caches( connection )
+    if ( name in caches ):
+        changes, version, cache = caches[name]
+        if ( len(tables) == 0 or changes == connection.total_changes ):
+            return cache
+        if ( read_table_version( cursor, tables ) == version ):
+            caches[name] = ( connection.total_changes, version, cache )
+            return cache
+
+    version = None
+    if ( len(tables) != 0 ):
+        version = read_table_version( cursor, tables )
+    cache = create_cache()
+    caches[name] = ( connection.total_changes, version, cache )
+    return cache
+
+def invalidate_connection_cache( cursor, name ):
+    get_connection_caches( cursor.connection ).pop( name, None )
+
+# Drops every cache of the connection, for example after another connection or
+# process changed the tables that they hold.
+def invalidate_connection_caches( cursor ):
+    get_connection_caches( cursor.connection ).clear()
+
+# Tables that are kept in memory by the caches above, along with the triggers
+# that count the changes to each of them in table_versions.  The triggers are
+# generated here so that they cannot drift apart from the list of tables.
+CACHED_TABLES = [
+    "elements",
+    "fluids",
+    "fluid_property_values",
+    "fluid_property_correlations",
+    "fluid_property_correlation_coefficients",
+]
+
+def table_version_triggers_sql():
+    statements = []
+    for table in CACHED_TABLES:
+        for event in [ "INSERT", "UPDATE", "DELETE" ]:
+            statements.append( """
+            CREATE TRIGGER {0:s}_{1:s}_version AFTER {2:s} ON {0:s}
+            BEGIN
+                UPDATE table_versions
+                SET version = version + 1
+                WHERE table_name = '{0:s}';
+            END;
+            """.format( table, event.lower(), event ) )
+    return statements
+
+def create_table_version_triggers( cursor ):
+    for table in CACHED_TABLES:
+        cursor.execute(
+        """
+        INSERT INTO table_versions( table_name )
+        VALUES( ? );
+        """,
+        (
+            table,
+        )
+        )
+    for statement in table_version_triggers_sql():
+        cursor.execute( statement )
+
+def get_chemistry( cursor ):
+    return get_connection_cache( cursor, "chemistry", lambda: Chemistry( cursor ),
+                                 [ "elements", "fluids" ] )
+
+def invalidate_chemistry( cursor ):
+    invalidate_connection_cache( cursor, "chemistry" )
+
+# See sheardata.fluid_properties.
+def invalidate_fluid_property_tables( cursor ):
+    invalidate_connection_cache( cursor, "fluid_property_tables" )
+
+def invalidate_fluid_property_correlations( cursor ):
+    invalidate_connection_cache( cursor, "fluid_property_correlations" )
+
+# See sheardata.profiles.  The profiles are already cleared after any change to
+# the rows of the database, so this is only needed after changing the schema.
+def invalidate_station_profiles( cursor ):
+    invalidate_connection_cache( cursor, "station_profiles" )
+
+def calculate_molar_mass_of_molecular_formula( cursor, formula ):
+    return get_chemistry( cursor ).calculate_molar_mass_of_molecular_formula( formula )
+
+def calculate_molar_mass_of_component( cursor, fluid_id ):
+    return get_chemistry( cursor ).calculate_molar_mass_of_component( fluid_id )
+
+def get_molecular_formula_for_component( cursor, fluid_id ):
+    return get_chemistry( cursor ).get_molecular_formula( fluid_id )
+
+# Properties of an ideal-gas mixture with a given composition.  Every station
+# in a study usually has the same mixture (dry air, for example), so the
+# properties are calculated once per composition and kept in a small
+# least-recently-used cache in the connection's Chemistry object (see
+# get_mixture_properties_from_mass_fractions).
+class MixtureProperties:
+    mass_fractions                   = None
+    molar_mass                       = None
+    specific_gas_constant            = None
+    specific_isochoric_heat_capacity = None
+    specific_isobaric_heat_capacity  = None
+    heat_capacity_ratio              = None
+
+    def __init__( self, chemistry, mass_fractions, molar_mass=None ):
+        self.mass_fractions = mass_fractions
+
+        self.specific_gas_constant            = sdfloat(0.0,0.0)
+        self.specific_isochoric_heat_capacity = 0.0
+        self.specific_isobaric_heat_capacity  = 0.0
+        for fluid_id in mass_fractions:
+            formula = chemistry.get_molecular_formula( fluid_id )
+            degrees_of_freedom = get_degrees_of_freedom_for_element( formula )
+            specific_gas_constant = MOLAR_GAS_CONSTANT / chemistry.calculate_molar_mass_of_component( fluid_id )
+            c_v = 0.5 * degrees_of_freedom * specific_gas_constant
+            c_P = 0.5 * ( degrees_of_freedom + 2 ) * specific_gas_constant
+
+            self.specific_gas_constant            += mass_fractions[fluid_id] * specific_gas_constant
+            self.specific_isochoric_heat_capacity += mass_fractions[fluid_id] * c_v
+            self.specific_isobaric_heat_capacity  += mass_fractions[fluid_id] * c_P
+
+        self.heat_capacity_ratio = self.specific_isobaric_heat_capacity / self.specific_isochoric_heat_capacity
+
+        if ( molar_mass == None ):
+            self.molar_mass = MOLAR_GAS_CONSTANT / self.specific_gas_constant
+        else:
+            self.molar_mass = molar_mass
+
+MIXTURE_CACHE_SIZE = 64
+
+# Returns a hashable key for a composition.  Unknown uncertainties are NaN,
+# which never equals itself, so they become None instead.
+def freeze_composition( fractions ):
+    key = []
+    for fluid_id in sorted(fractions):
+        fraction = fractions[fluid_id]
+        if ( isinstance( fraction, ( int, float ) ) ):
+            value, uncertainty = float(fraction), 0.0
+        else:
+            value, uncertainty = fraction.n, fraction.s
+        if ( math.isnan(uncertainty) ):
+            uncertainty = None
+        key.append( ( fluid_id, value, uncertainty ) )
+    return tuple(key)
+
+def get_mixture_properties( chemistry, key, calculate_mixture_properties ):
+    mixtures = chemistry.mixture_properties
+    if ( key in mixtures ):
+        mixtures.move_to_end( key )
+    else:
+        mixtures[key] = calculate_mixture_properties()
+        if ( len(mixtures) > MIXTURE_CACHE_SIZE ):
+            mixtures.popitem( last=False )
+    return mixtures[key]
+
+def get_mixture_properties_from_mass_fractions( cursor, mass_fractions ):
+    chemistry = get_chemistry( cursor )
+
+    def calculate_mixture_properties():
+        return MixtureProperties( chemistry, dict(mass_fractions) )
+
+    return get_mixture_properties(
+        chemistry,
+        ( "mass", freeze_composition( mass_fractions ) ),
+        calculate_mixture_properties,
+    )
+
+def get_mixture_properties_from_amount_fractions( cursor, amount_fractions ):
+    chemistry = get_chemistry( cursor )
+
+    def calculate_mixture_properties():
+        mixture_amount_fraction = sdfloat(0.0,0.0)
+        mixture_molar_mass      = sdfloat(0.0,0.0)
+        for fluid_id in amount_fractions:
+            molar_mass      = chemistry.calculate_molar_mass_of_component( fluid_id )
+            amount_fraction = amount_fractions[fluid_id]
+
+            mixture_amount_fraction += amount_fraction
+            mixture_molar_mass      += amount_fraction * molar_mass
+
+        assert( math.fabs( sdfloat_value(mixture_amount_fraction) - 1.0 ) < sys.float_info.epsilon )
+
+        mixture_mass_fraction = sdfloat(0.0,0.0)
+        mass_fractions = {}
+        for fluid_id in amount_fractions:
+            molar_mass = chemistry.calculate_molar_mass_of_component( fluid_id )
+            mass_fraction = molar_mass * amount_fractions[fluid_id] / mixture_molar_mass
+
+            mixture_mass_fraction   += mass_fraction
+            mass_fractions[fluid_id] = mass_fraction
+
+        assert( math.fabs( sdfloat_value(mixture_mass_fraction) - 1.0 ) < sys.float_info.epsilon )
+
+        return MixtureProperties( chemistry, mass_fractions, mixture_molar_mass )
+
+    return get_mixture_properties(
+        chemistry,
+        ( "amount", freeze_composition( amount_fractions ) ),
+        calculate_mixture_properties,
+    )
+
+def calculate_molar_mass_from_amount_fractions( cursor, amount_fractions ):
+    return get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).molar_mass
+
+def calculate_mass_fractions_from_amount_fractions( cursor, amount_fractions ):
+    return dict( get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).mass_fractions )
+
+def calculate_specific_gas_constant_of_component( cursor, fluid_id ):
+    molar_mass = calculate_molar_mass_of_component( cursor, fluid_id )
+    return MOLAR_GAS_CONSTANT / molar_mass
+
+def calculate_specific_gas_constant_from_mass_fractions( cursor, mass_fractions ):
+    return get_mixture_properties_from_mass_fractions( cursor, mass_fractions ).specific_gas_constant
+
+def calculate_specific_gas_constant_from_amount_fractions( cursor, amount_fractions ):
+    return get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).specific_gas_constant
+
+def calculate_ideal_gas_specific_isochoric_heat_capacity_of_component( cursor, fluid_id ):
+    formula = get_molecular_formula_for_component( cursor, fluid_id )
+    degrees_of_freedom = get_degrees_of_freedom_for_element( formula )
+    specific_gas_constant = calculate_specific_gas_constant_of_component( cursor, fluid_id )
+    c_v = 0.5 * degrees_of_freedom * specific_gas_constant
+    return c_v
+
+def calculate_ideal_gas_specific_isobaric_heat_capacity_of_component( cursor, fluid_id ):
+    formula = get_molecular_formula_for_component( cursor, fluid_id )
+    degrees_of_freedom = get_degrees_of_freedom_for_element( formula )
+    specific_gas_constant = calculate_specific_gas_constant_of_component( cursor, fluid_id )
+    c_P = 0.5 * ( degrees_of_freedom + 2 ) * specific_gas_constant
+    return c_P
+
+def calculate_ideal_gas_heat_capacity_ratio_of_component( cursor, fluid_id ):
+    c_v = calculate_ideal_gas_specific_isochoric_heat_capacity_of_component( cursor, fluid_id )
+    c_P = calculate_ideal_gas_specific_isobaric_heat_capacity_of_component( cursor, fluid_id )
+    gamma = c_P / c_v
+    return gamma
+
+def calculate_ideal_gas_specific_isochoric_heat_capacity_from_mass_fractions( cursor, mass_fractions ):
+    return get_mixture_properties_from_mass_fractions( cursor, mass_fractions ).specific_isochoric_heat_capacity
+
+def calculate_ideal_gas_specific_isobaric_heat_capacity_from_mass_fractions( cursor, mass_fractions ):
+    return get_mixture_properties_from_mass_fractions( cursor, mass_fractions ).specific_isobaric_heat_capacity
+
+def calculate_ideal_gas_heat_capacity_ratio_from_mass_fractions( cursor, mass_fractions ):
+    return get_mixture_properties_from_mass_fractions( cursor, mass_fractions ).heat_capacity_ratio
+
+def calculate_ideal_gas_specific_isochoric_heat_capacity_from_amount_fractions( cursor, amount_fractions ):
+    return get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).specific_isochoric_heat_capacity
+
+def calculate_ideal_gas_specific_isobaric_heat_capacity_from_amount_fractions( cursor, amount_fractions ):
+    return get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).specific_isobaric_heat_capacity
+
+def calculate_ideal_gas_heat_capacity_ratio_from_amount_fractions( cursor, amount_fractions ):
+    return get_mixture_properties_from_amount_fractions( cursor, amount_fractions ).heat_capacity_ratio
+
+# TODO: Add more components.  Note that for the specific heats, I need to
+# include additional information about the degrees of freedom for triatomic and
+# polyatomic molecules to return correct answers.
+def dry_air_amount_fractions():
+    return {
+        F_GASEOUS_DIATOMIC_NITROGEN: sdfloat(0.78,0.0),
+        F_GASEOUS_DIATOMIC_OXYGEN:   sdfloat(0.21,0.0),
+        F_GASEOUS_ARGON:             sdfloat(0.01,0.0),
+    }
+
+def calculate_ideal_gas_mass_density_from_mass_fractions( cursor, pressure, temperature, mass_fractions ):
+    specific_gas_constant = calculate_specific_gas_constant_from_mass_fractions( cursor, mass_fractions )
+    return pressure / ( specific_gas_constant * temperature )
+
+def calculate_ideal_gas_mass_density_from_amount_fractions( cursor, pressure, temperature, amount_fractions ):
+    specific_gas_constant = calculate_specific_gas_constant_from_amount_fractions( cursor, amount_fractions )
+    return pressure / ( specific_gas_constant * temperature )
+
+def calculate_ideal_gas_speed_of_sound_from_mass_fractions( cursor, temperature, mass_fractions ):
+    mixture = get_mixture_properties_from_mass_fractions( cursor, mass_fractions )
+    return ( mixture.heat_capacity_ratio * mixture.specific_gas_constant * temperature )**0.5
+
+def calculate_ideal_gas_speed_of_sound_from_amount_fractions( cursor, temperature, amount_fractions ):
+    mixture = get_mixture_properties_from_amount_fractions( cursor, amount_fractions )
+    return ( mixture.heat_capacity_ratio * mixture.specific_gas_constant * temperature )**0.5
+
+# Profile versions of the ideal-gas functions, which work on whole arrays of
+# pressures, temperatures, and velocities at once.  SDArrays give SDArrays, with
+# the uncertainties of the profiles and of the mixture properties propagated to
+# first order.  Plain NumPy arrays give plain NumPy arrays of the nominal
+# values.
+def mixture_property_for_profile( value, profile ):
+    from sheardata.sdarray import SDArray
+    if ( isinstance( profile, SDArray ) ):
+        return value
+    return sdfloat_value( value )
+
+def calculate_ideal_gas_mass_density_profile( mixture, pressure, temperature ):
+    specific_gas_constant = mixture_property_for_profile( mixture.specific_gas_constant, temperature )
+    return pressure / ( specific_gas_constant * temperature )
+
+def calculate_ideal_gas_speed_of_sound_profile( mixture, temperature ):
+    gamma_R = mixture_property_for_profile( mixture.heat_capacity_ratio * mixture.specific_gas_constant, temperature )
+    return ( gamma_R * temperature )**0.5
+
+def calculate_ideal_gas_mach_number_profile( mixture, velocity, temperature ):
+    return velocity / calculate_ideal_gas_speed_of_sound_profile( mixture, temperature )
+
+def calculate_ideal_gas_mass_density_profile_from_mass_fractions( cursor, pressure, temperature, mass_fractions ):
+    mixture = get_mixture_properties_from_mass_fractions( cursor, mass_fractions )
+    return calculate_ideal_gas_mass_density_profile( mixture, pressure, temperature )
+
+def calculate_ideal_gas_mass_density_profile_from_amount_fractions( cursor, pressure, temperature, amount_fractions ):
+    mixture = get_mixture_properties_from_amount_fractions( cursor, amount_fractions )
+    return calculate_ideal_gas_mass_density_profile( mixture, pressure, temperature )
+
+def calculate_ideal_gas_speed_of_sound_profile_from_mass_fractions( cursor, temperature, mass_fractions ):
+    mixture = get_mixture_properties_from_mass_fractions( cursor, mass_fractions )
+    return calculate_ideal_gas_speed_of_sound_profile( mixture, temperature )
+
+def calculate_ideal_gas_speed_of_sound_profile_from_amount_fractions( cursor, temperature, amount_fractions ):
+    mixture = get_mixture_properties_from_amount_fractions( cursor, amount_fractions )
+    return calculate_ideal_gas_speed_of_sound_profile( mixture, temperature )
+
+def calculate_ideal_gas_mach_number_profile_from_mass_fractions( cursor, velocity, temperature, mass_fractions ):
+    mixture = get_mixture_properties_from_mass_fractions( cursor, mass_fractions )
+    return calculate_ideal_gas_mach_number_profile( mixture, velocity, temperature )
+
+def calculate_ideal_gas_mach_number_profile_from_amount_fractions( cursor, velocity, temperature, amount_fractions ):
+    mixture = get_mixture_properties_from_amount_fractions( cursor, amount_fractions )
+    return calculate_ideal_gas_mach_number_profile( mixture, velocity, temperature )
+
+def fahrenheit_to_kelvin( fahrenheit ):
+    return ( fahrenheit - 32.0 ) / 1.8 + ABSOLUTE_ZERO
+
+def add_note( cursor, filename ):
+    contents = None
+    with open( filename, "r" ) as f:
+        contents = f.read().strip()
+
+    cursor.execute(
+    """
+    INSERT INTO notes( note_contents )
+    VALUES( ? );
+    """,
+    (
+        str(contents),
+    )
+    )
+
+    cursor.execute(
+    """
+    SELECT last_insert_rowid();
+    """
+    )
+    return int(cursor.fetchone()[0])
+
+# Temporary tables that hold the rows to remove during a deletion.
+DELETED_ROW_TABLES = [
+    ( "deleted_series",      "series_id     TEXT"    ),
+    ( "deleted_stations",    "station_id    TEXT"    ),
+    ( "deleted_points",      "point_key     INTEGER" ),
+    ( "deleted_times",       "time_id       INTEGER" ),
+    ( "deleted_facilities",  "facility_id   INTEGER" ),
+    ( "deleted_instruments", "instrument_id INTEGER" ),
+    ( "deleted_models",      "model_id      INTEGER" ),
+    ( "deleted_notes",       "note_id       INTEGER" ),
+]
+
+def create_deleted_row_tables( cursor ):
+    for table, column in DELETED_ROW_TABLES:
+        cursor.execute( "DROP TABLE IF EXISTS temp.{:s};".format( table ) )
+        cursor.execute(
+            "CREATE TEMP TABLE {:s} ( {:s} PRIMARY KEY );".format( table, column )
+        )
+
+def drop_deleted_row_tables( cursor ):
+    for table, column in DELETED_ROW_TABLES:
+        cursor.execute( "DROP TABLE temp.{:s};".format( table ) )
+
+# Removes every series listed in temp.deleted_series and everything that
+# belongs to those series: their stations, station paths, points, times,
+# coordinates, notes links, external IDs, and components.  The facilities,
+# instruments, models, and notes that the series referred to are also removed
+# once nothing else refers to them, so that the series can be added again
+# without violating their uniqueness constraints.  Any notes already listed in
+# temp.deleted_notes are removed under the same condition.
+#
+# The schema has no ON DELETE CASCADE clauses, so the rows to remove are first
+# collected into the temporary tables and then deleted one table at a time,
+# with every table deleted before the tables that it refers to.  Each step is a
+# single set-based statement, so the time taken does not depend on the number
+# of rows removed from any one table.
+def delete_series_subtrees( cursor ):
+    for statement in [
+        """
+        INSERT INTO temp.deleted_stations
+        SELECT station_id
+        FROM stations
+        WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );
+        """,
+        """
+        INSERT INTO temp.deleted_points
+        SELECT point_key
+        FROM points
+        WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations );
+        """,
+        """
+        INSERT INTO temp.deleted_times
+        SELECT time_id
+        FROM times
+        WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );
+        """,
+        """
+        INSERT INTO temp.deleted_facilities
+        SELECT DISTINCT facility_id
+        FROM series
+        WHERE series_id IN ( SELECT series_id FROM temp.deleted_series )
+          AND facility_id IS NOT NULL;
+        """,
+        """
+        INSERT INTO temp.deleted_models
+        SELECT DISTINCT model_id
+        FROM series
+        WHERE series_id IN ( SELECT series_id FROM temp.deleted_series )
+          AND model_id IS NOT NULL;
+        """,
+        """
+        INSERT INTO temp.deleted_instruments
+              SELECT instrument_id FROM times
+               WHERE time_id IN ( SELECT time_id FROM temp.deleted_times )
+                 AND instrument_id IS NOT NULL
+        UNION SELECT instrument_id FROM streamwise_coordinate
+               WHERE point_key IN ( SELECT point_key FROM temp.deleted_points )
+                 AND instrument_id IS NOT NULL
+        UNION SELECT instrument_id FROM transverse_coordinate
+               WHERE point_key IN ( SELECT point_key FROM temp.deleted_points )
+                 AND instrument_id IS NOT NULL
+        UNION SELECT instrument_id FROM spanwise_coordinate
+               WHERE point_key IN ( SELECT point_key FROM temp.deleted_points )
+                 AND instrument_id IS NOT NULL;
+        """,
+        """
+        INSERT OR IGNORE INTO temp.deleted_notes
+              SELECT note_id FROM series_notes
+               WHERE series_id IN ( SELECT series_id FROM temp.deleted_series )
+        UNION SELECT note_id FROM station_notes
+               WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations )
+        UNION SELECT note_id FROM point_notes
+               WHERE point_key IN ( SELECT point_key FROM temp.deleted_points );
+        """,
+        "DELETE FROM point_notes           WHERE point_key IN ( SELECT point_key FROM temp.deleted_points );",
+        "DELETE FROM point_external_ids    WHERE point_key IN ( SELECT point_key FROM temp.deleted_points );",
+        "DELETE FROM streamwise_coordinate WHERE point_key IN ( SELECT point_key FROM temp.deleted_points ) OR time_id IN ( SELECT time_id FROM temp.deleted_times );",
+        "DELETE FROM transverse_coordinate WHERE point_key IN ( SELECT point_key FROM temp.deleted_points ) OR time_id IN ( SELECT time_id FROM temp.deleted_times );",
+        "DELETE FROM spanwise_coordinate   WHERE point_key IN ( SELECT point_key FROM temp.deleted_points ) OR time_id IN ( SELECT time_id FROM temp.deleted_times );",
+        "DELETE FROM wall_distance_mat     WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations );",
+        "DELETE FROM points                WHERE point_key IN ( SELECT point_key FROM temp.deleted_points );",
+        "DELETE FROM station_notes         WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations );",
+        "DELETE FROM station_external_ids  WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations );",
+        "DELETE FROM station_paths         WHERE station_descendant_id IN ( SELECT station_id FROM temp.deleted_stations ) OR station_ancestor_id IN ( SELECT station_id FROM temp.deleted_stations );",
+        "DELETE FROM stations              WHERE station_id IN ( SELECT station_id FROM temp.deleted_stations );",
+        "DELETE FROM times                 WHERE time_id IN ( SELECT time_id FROM temp.deleted_times );",
+        "DELETE FROM series_notes          WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );",
+        "DELETE FROM series_external_ids   WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );",
+        "DELETE FROM series_components     WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );",
+        "DELETE FROM series                WHERE series_id IN ( SELECT series_id FROM temp.deleted_series );",
+    ]:
+        cursor.execute( statement )
+
+def delete_unreferenced_rows( cursor ):
+    # Keep only the facilities, instruments, and models that nothing else
+    # refers to any longer, and then remove them along with their notes links
+    # and sources.
+    for statement in [
+        """
+        DELETE FROM temp.deleted_facilities
+        WHERE facility_id IN ( SELECT facility_id FROM series )
+           OR facility_id IN ( SELECT predecessor_facility_id FROM facilities )
+           OR facility_id IN ( SELECT successor_facility_id   FROM facilities );
+        """,
+        """
+        DELETE FROM temp.deleted_models
+        WHERE model_id IN ( SELECT model_id FROM series );
+        """,
+        """
+        DELETE FROM temp.deleted_instruments
+        WHERE instrument_id IN ( SELECT instrument_id FROM times                 )
+           OR instrument_id IN ( SELECT instrument_id FROM streamwise_coordinate )
+           OR instrument_id IN ( SELECT instrument_id FROM transverse_coordinate )
+           OR instrument_id IN ( SELECT instrument_id FROM spanwise_coordinate   );
+        """,
+        """
+        INSERT OR IGNORE INTO temp.deleted_notes
+              SELECT note_id FROM facility_notes
+               WHERE facility_id IN ( SELECT facility_id FROM temp.deleted_facilities )
+        UNION SELECT note_id FROM instrument_notes
+               WHERE instrument_id IN ( SELECT instrument_id FROM temp.deleted_instruments )
+        UNION SELECT note_id FROM model_notes
+               WHERE model_id IN ( SELECT model_id FROM temp.deleted_models );
+        """,
+        "DELETE FROM facility_notes     WHERE facility_id   IN ( SELECT facility_id   FROM temp.deleted_facilities  );",
+        "DELETE FROM facility_sources   WHERE facility_id   IN ( SELECT facility_id   FROM temp.deleted_facilities  );",
+        "DELETE FROM facilities         WHERE facility_id   IN ( SELECT facility_id   FROM temp.deleted_facilities  );",
+        "DELETE FROM instrument_notes   WHERE instrument_id IN ( SELECT instrument_id FROM temp.deleted_instruments );",
+        "DELETE FROM instrument_sources WHERE instrument_id IN ( SELECT instrument_id FROM temp.deleted_instruments );",
+        "DELETE FROM instruments        WHERE instrument_id IN ( SELECT instrument_id FROM temp.deleted_instruments );",
+        "DELETE FROM model_notes        WHERE model_id      IN ( SELECT model_id      FROM temp.deleted_models      );",
+        "DELETE FROM model_sources      WHERE model_id      IN ( SELECT model_id      FROM temp.deleted_models      );",
+        "DELETE FROM models             WHERE model_id      IN ( SELECT model_id      FROM temp.deleted_models      );",
+        """
+        DELETE FROM notes
+        WHERE note_id IN ( SELECT note_id FROM temp.deleted_notes )
+          AND note_id NOT IN ( SELECT note_id FROM study_notes      )
+          AND note_id NOT IN ( SELECT note_id FROM series_notes     )
+          AND note_id NOT IN ( SELECT note_id FROM station_notes    )
+          AND note_id NOT IN ( SELECT note_id FROM point_notes      )
+          AND note_id NOT IN ( SELECT note_id FROM facility_notes   )
+          AND note_id NOT IN ( SELECT note_id FROM instrument_notes )
+          AND note_id NOT IN ( SELECT note_id FROM model_notes      );
+        """,
+    ]:
+        cursor.execute( statement )
+
+# Removes a study, all of its series (see delete_series_subtrees), and its own
+# notes links, external IDs, and sources.
+def delete_study( cursor, study_id ):
+    study_id = sanitize_identifier(study_id)
+    create_deleted_row_tables( cursor )
+
+    cursor.execute(
+    """
+    INSERT INTO temp.deleted_series
+    SELECT series_id
+    FROM series
+    WHERE study_id=?;
+    """,
+    (
+        study_id,
+    )
+    )
+
+    cursor.execute(
+    """
+    INSERT INTO temp.deleted_notes
+    SELECT note_id
+    FROM study_notes
+    WHERE study_id=?;
+    """,
+    (
+        study_id,
+    )
+    )
+
+    delete_series_subtrees( cursor )
+
+    for table in [ "study_notes", "study_external_ids", "study_sources",
+                   "study_summary_mat", "studies", ]:
+        cursor.execute(
+            "DELETE FROM {:s} WHERE study_id=?;".format( table ),
+            ( study_id, )
+        )
+
+    delete_unreferenced_rows( cursor )
+    drop_deleted_row_tables( cursor )
+
+# Removes a single series and everything that belongs to it (see
+# delete_series_subtrees).  The study itself is left in place, and its summary
+# is refreshed to no longer count the series.
+def delete_series( cursor, series_id ):
+    series_id = sanitize_identifier(series_id)
+    create_deleted_row_tables( cursor )
+
+    cursor.execute(
+    """
+    INSERT INTO temp.deleted_series( series_id )
+    VALUES( ? );
+    """,
+    (
+        series_id,
+    )
+    )
+
+    delete_series_subtrees( cursor )
+    delete_unreferenced_rows( cursor )
+    drop_deleted_row_tables( cursor )
+    refresh_study_summaries( cursor, [ truncate_to_study_id( series_id ) ] )
+
+# Coordinate directions and the aliases used for their coordinate tables in the
+# wall distance views.  The first direction's times and instruments are the
+# ones that the other directions are matched against.
+COORDINATE_DIRECTIONS = [
+    ( "streamwise", "x" ),
+    ( "transverse", "y" ),
+    ( "spanwise",   "z" ),
+]
+
+# Point quantities and the tables that store them.  Every table has the
+# point_key, time_id, instrument_id, value, uncertainty, and outlier columns.
+POINT_QUANTITY_TABLES = {
+    "{:s}_coordinate".format( direction ): "{:s}_coordinate".format( direction )
+    for direction, alias in COORDINATE_DIRECTIONS
+}
+POINT_QUANTITY_TABLES["wall_distance"] = "wall_distance_mat"
+
+# Tables whose primary key starts with the station ID rather than the point key.
+STATION_KEYED_TABLES = [ "wall_distance_mat" ]
+
+# The views of the wall coordinates and of the distances from the wall are
+# generated here rather than written out in prep_create_tables.sql, so that the
+# three directions cannot drift apart.
+#
+# Coordinates are matched on ( point_key, time_id, instrument_id ), the primary
+# key of each coordinate table, so every join is a lookup on that key's index.
+# The instrument_id column is NULL for coordinates that were not measured with
+# a particular instrument, so it is compared with IS rather than with an
+# expression like ( a = b ) OR ( a IS NULL AND b IS NULL ), since SQLite cannot
+# use an index for that OR.
+def wall_coordinate_view_sql( direction ):
+    return """
+    CREATE VIEW wall_{0:s}_coordinate AS
+    SELECT points.station_id    AS station_id,
+           points.point_key     AS point_key,
+           points.point_id      AS point_id,
+           wall_c.time_id       AS time_id,
+           wall_c.instrument_id AS instrument_id,
+           wall_c.value         AS value,
+           wall_c.uncertainty   AS uncertainty,
+           wall_c.outlier       AS outlier
+    FROM points
+    INNER JOIN {0:s}_coordinate AS wall_c
+            ON wall_c.point_key = points.point_key
+    WHERE points.point_label_id = '{1:s}';
+    """.format( direction, PL_WALL )
+
+# The distances from the wall pair every point of a station with every wall
+# point of that station, matching their coordinates on the time and the
+# instrument.  The coordinates of the first required direction set the time and
+# instrument that the other directions must match.  Starting from the wall
+# points lets SQLite look them up once per station instead of once per point.
+#
+# A station may have more than one wall point, as in a channel.  The views then
+# measure each point from its nearest wall, so that each point has one distance
+# from the wall at each time and from each instrument (and so one row in
+# wall_distance_mat).  The nearest wall is the one with the smallest distance
+# in all three directions, chosen explicitly by ROW_NUMBER() over the walls of
+# each point, with ties going to the wall with the smallest point key.  Every
+# view ranks the walls the same way, so the distances in one direction are
+# always the components of the total distance.  A view of one direction only
+# requires coordinates in that direction, though, so the other directions are
+# left joined and a missing coordinate counts as no distance in that direction.
+def nearest_wall_view_sql( name, columns, required_aliases ):
+    first_alias = required_aliases[0]
+    wall_joins  = []
+    point_joins = []
+    squares     = []
+    # The required directions come first, since the left joins refer to them.
+    directions = sorted( COORDINATE_DIRECTIONS,
+                         key=lambda direction: direction[1] not in required_aliases )
+    for direction, alias in directions:
+        join = "INNER" if ( alias in required_aliases ) else "LEFT"
+        wall_condition  = ""
+        point_condition = """
+           AND {0:s}.time_id = wall_{0:s}.time_id
+           AND {0:s}.instrument_id IS wall_{0:s}.instrument_id""".format( alias )
+        if ( alias != first_alias ):
+            wall_condition = """
+           AND wall_{0:s}.time_id = wall_{1:s}.time_id
+           AND wall_{0:s}.instrument_id IS wall_{1:s}.instrument_id""".format(
+                alias,
+                first_alias,
+            )
+            point_condition = """
+           AND {0:s}.time_id = {1:s}.time_id
+           AND {0:s}.instrument_id IS {1:s}.instrument_id""".format(
+                alias,
+                first_alias,
+            )
+        wall_joins.append( """
+    {0:s} JOIN {1:s}_coordinate AS wall_{2:s}
+            ON wall_{2:s}.point_key = wall.point_key{3:s}""".format(
+            join,
+            direction,
+            alias,
+            wall_condition,
+        ) )
+        point_joins.append( """
+    {0:s} JOIN {1:s}_coordinate AS {2:s}
+            ON {2:s}.point_key = points.point_key{3:s}""".format(
+            join,
+            direction,
+            alias,
+            point_condition,
+        ) )
+        d = "( {0:s}.value - wall_{0:s}.value )".format( alias )
+        if ( join == "LEFT" ):
+            d = "COALESCE( {0:s}.value - wall_{0:s}.value, 0.0 )".format( alias )
+        squares.append( "{0:s} * {0:s}".format( d ) )
+    return """
+    CREATE VIEW {0:s} AS
+    SELECT {1:s}
+    FROM (
+    SELECT {2:s},
+           ROW_NUMBER() OVER (
+               PARTITION BY points.station_id, points.point_key, {3:s}.time_id,
+                            {3:s}.instrument_id
+               ORDER BY {4:s},
+                        wall.point_key
+           ) AS wall_rank
+    FROM points AS wall{5:s}
+    INNER JOIN points
+            ON points.station_id = wall.station_id{6:s}
+    WHERE wall.point_label_id = '{7:s}'
+    )
+    WHERE wall_rank = 1;
+    """.format(
+        name,
+        ",\n           ".join( [ column for column, expression in columns ] ),
+        ",\n           ".join( [ "{:s} AS {:s}".format( expression, column )
+                                 for column, expression in columns ] ),
+        first_alias,
+        "\n                      + ".join( squares ),
+        "".join( wall_joins ),
+        "".join( point_joins ),
+        PL_WALL,
+    )
+
+def wall_distance_view_sql( direction, alias ):
+    return nearest_wall_view_sql(
+        "{:s}_wall_distance".format( direction ),
+        [
+            ( "station_id",    "points.station_id" ),
+            ( "point_key",     "points.point_key" ),
+            ( "point_id",      "points.point_id" ),
+            ( "time_id",       "{:s}.time_id".format( alias ) ),
+            ( "instrument_id", "{:s}.instrument_id".format( alias ) ),
+            ( "value",         "{0:s}.value - wall_{0:s}.value".format( alias ) ),
+            ( "uncertainty",   "SQRT( {0:s}.uncertainty * {0:s}.uncertainty"
+                               " + wall_{0:s}.uncertainty * wall_{0:s}.uncertainty )".format( alias ) ),
+            ( "outlier",       "( {0:s}.outlier = TRUE ) OR ( wall_{0:s}.outlier = TRUE )".format( alias ) ),
+        ],
+        [ alias ],
+    )
+
+# The distance from the wall is the magnitude of the vector of the distances
+# in each direction, d = sqrt( d_x^2 + d_y^2 + d_z^2 ), and so
+#
+#     s_d = sqrt( d_x^2 s_x^2 + d_y^2 s_y^2 + d_z^2 s_z^2 ) / d
+#
+# where s_x^2 is the sum of the variances of the point's coordinate and the
+# wall's coordinate.  That is 0/0 at the wall itself, where the uncertainty is
+# zero by definition.
+def wall_distance_total_view_sql():
+    squares   = []
+    variances = []
+    outliers  = []
+    for direction, alias in COORDINATE_DIRECTIONS:
+        d = "( {0:s}.value - wall_{0:s}.value )".format( alias )
+        squares.append( "{0:s} * {0:s}".format( d ) )
+        variances.append(
+            "{0:s} * {0:s} * ( {1:s}.uncertainty * {1:s}.uncertainty"
+            " + wall_{1:s}.uncertainty * wall_{1:s}.uncertainty )".format(
+                d,
+                alias,
+            )
+        )
+        outliers.append(
+            "( {0:s}.outlier = TRUE ) OR ( wall_{0:s}.outlier = TRUE )".format( alias )
+        )
+    first_alias = COORDINATE_DIRECTIONS[0][1]
+    separator = "\n                 + "
+    return nearest_wall_view_sql(
+        "wall_distance",
+        [
+            ( "station_id",    "points.station_id" ),
+            ( "point_key",     "points.point_key" ),
+            ( "point_id",      "points.point_id" ),
+            ( "time_id",       "{:s}.time_id".format( first_alias ) ),
+            ( "instrument_id", "{:s}.instrument_id".format( first_alias ) ),
+            ( "value",         "SQRT( {:s} )".format( separator.join( squares ) ) ),
+            ( "uncertainty",   """CASE WHEN points.point_label_id = '{0:s}' THEN 0.0
+           ELSE SQRT( {1:s} )
+              / SQRT( {2:s} )
+           END""".format(
+                PL_WALL,
+                separator.join( variances ),
+                separator.join( squares ),
+            ) ),
+            ( "outlier",       "\n        OR ".join( outliers ) ),
+        ],
+        [ alias for direction, alias in COORDINATE_DIRECTIONS ],
+    )
+
+def wall_distance_views_sql():
+    statements = []
+    for direction, alias in COORDINATE_DIRECTIONS:
+        statements.append( wall_coordinate_view_sql( direction ) )
+    for direction, alias in COORDINATE_DIRECTIONS:
+        statements.append( wall_distance_view_sql( direction, alias ) )
+    statements.append( wall_distance_total_view_sql() )
+    return statements
+
+def create_wall_distance_views( cursor ):
+    for statement in wall_distance_views_sql():
+        cursor.execute( statement )
+
+# Rebuilds the rows of wall_distance_mat from the wall_distance view, either
+# for every station or only for the given stations.
+def refresh_wall_distances( cursor, station_ids=None ):
+    if ( station_ids == None ):
+        cursor.execute( "DELETE FROM wall_distance_mat;" )
+        cursor.execute(
+        """
+        INSERT INTO wall_distance_mat( station_id, point_key, time_id,
+                                       instrument_id, value, uncertainty,
+                                       outlier )
+        SELECT station_id, point_key, time_id, instrument_id, value,
+               uncertainty, outlier
+        FROM wall_distance;
+        """
+        )
+        return
+
+    for station_id in station_ids:
+        station_id = sanitize_identifier( station_id )
+        cursor.execute(
+        """
+        DELETE FROM wall_distance_mat
+        WHERE station_id=?;
+        """,
+        (
+            station_id,
+        )
+        )
+        cursor.execute(
+        """
+        INSERT INTO wall_distance_mat( station_id, point_key, time_id,
+                                       instrument_id, value, uncertainty,
+                                       outlier )
+        SELECT station_id, point_key, time_id, instrument_id, value,
+               uncertainty, outlier
+        FROM wall_distance
+        WHERE station_id=?;
+        """,
+        (
+            station_id,
+        )
+        )
+
+# Counts of the series, stations, and points of every study, along with its
+# type and its primary sources, from one aggregate query rather than several
+# queries for every study.  The primary sources are a comma-separated list of
+# citation keys, which study_summary() splits and sorts.
+#
+# The aggregates are correlated subqueries rather than joins on subqueries
+# grouped by study.  Each one is then a search of series_by_study,
+# stations_by_series, and points_by_station, and refreshing a single study only
+# counts the rows of that study, since SQLite does not push a condition on the
+# view into the grouped subqueries on the right side of a LEFT JOIN.
+def study_summary_view_sql():
+    return """
+    CREATE VIEW study_summary AS
+    SELECT studies.study_id,
+           studies.study_type_id,
+           COALESCE( (
+               SELECT group_concat( citation_key, ',' )
+               FROM study_sources
+               WHERE study_sources.study_id = studies.study_id
+                 AND study_sources.source_classification_id={:d}
+           ), '' ) AS primary_sources,
+           (
+               SELECT COUNT(*)
+               FROM series
+               WHERE series.study_id = studies.study_id
+           ) AS number_of_series,
+           (
+               SELECT COUNT(*)
+               FROM series
+               JOIN stations ON stations.series_id = series.series_id
+               WHERE series.study_id = studies.study_id
+           ) AS number_of_stations,
+           (
+               SELECT COUNT(*)
+               FROM series
+               JOIN stations ON stations.series_id = series.series_id
+               JOIN points   ON points.station_id  = stations.station_id
+               WHERE series.study_id = studies.study_id
+           ) AS number_of_points
+    FROM studies;
+    """.format( PRIMARY_SOURCE )
+
+def create_study_summary_view( cursor ):
+    cursor.execute( study_summary_view_sql() )
+
+# Rebuilds the rows of study_summary_mat from the study_summary view, either
+# for every study or only for the given studies.
+def refresh_study_summaries( cursor, study_ids=None ):
+    if ( study_ids == None ):
+        cursor.execute( "DELETE FROM study_summary_mat;" )
+        cursor.execute(
+        """
+        INSERT INTO study_summary_mat( study_id, study_type_id,
+                                       primary_sources, number_of_series,
+                                       number_of_stations, number_of_points )
+        SELECT study_id, study_type_id, primary_sources, number_of_series,
+               number_of_stations, number_of_points
+        FROM study_summary;
+        """
+        )
+        return
+
+    for study_id in study_ids:
+        study_id = sanitize_identifier( study_id )
+        cursor.execute(
+        """
+        DELETE FROM study_summary_mat
+        WHERE study_id=?;
+        """,
+        (
+            study_id,
+        )
+        )
+        cursor.execute(
+        """
+        INSERT INTO study_summary_mat( study_id, study_type_id,
+                                       primary_sources, number_of_series,
+                                       number_of_stations, number_of_points )
+        SELECT study_id, study_type_id, primary_sources, number_of_series,
+               number_of_stations, number_of_points
+        FROM study_summary
+        WHERE study_id=?;
+        """,
+        (
+            study_id,
+        )
+        )
+
+class StudySummary:
+    study_id           = None
+    study_type_id      = None
+    primary_sources    = None
+    number_of_series   = None
+    number_of_stations = None
+    number_of_points   = None
+
+    def __init__( self, study_id, study_type_id, primary_sources,
+                  number_of_series, number_of_stations, number_of_points ):
+        self.study_id           = str(study_id)
+        self.study_type_id      = str(study_type_id)
+        self.primary_sources    = sorted(
+            [ citation_key for citation_key in str(primary_sources).split( "," )
+              if ( citation_key != "" ) ],
+            key=str.lower,
+        )
+        self.number_of_series   = int(number_of_series)
+        self.number_of_stations = int(number_of_stations)
+        self.number_of_points   = int(number_of_points)
+
+# Returns the summary of every study, in order of study ID, from
+# study_summary_mat.  The build refreshes that table after loading the data
+# (see sheardata.build), so reading it takes a single query.
+def study_summary( cursor ):
+    cursor.execute(
+    """
+    SELECT study_id, study_type_id, primary_sources, number_of_series,
+           number_of_stations, number_of_points
+    FROM study_summary_mat
+    ORDER BY study_id;
+    """
+    )
+
+    summaries = []
+    for result in cursor:
+        summaries.append( StudySummary( *result ) )
+
+    return summaries
+
+# PRAGMA settings for Database sessions.  The build-mode settings trade
+# durability for speed during ingest, since a failed build is simply rerun from
+# scratch.  The safe settings are restored afterwards so that the finished
+# database file is a single, self-contained file in the default rollback
+# journal mode.
+BUILD_MODE_PRAGMAS = [
+    ( "journal_mode", "WAL"     ),
+    ( "synchronous",  "OFF"     ),
+    ( "cache_size",   "-262144" ),
+    ( "temp_store",   "MEMORY"  ),
+]
+
+SAFE_MODE_PRAGMAS = [
+    ( "journal_mode", "DELETE"  ),
+    ( "synchronous",  "FULL"    ),
+    ( "cache_size",   "-2000"   ),
+    ( "temp_store",   "DEFAULT" ),
+]
+
+# The sqlite3 module reuses prepared statements keyed on their SQL text, so
+# every function in this module reuses its statements as long as the
+# connection's statement cache can hold all of them.
+CACHED_STATEMENTS = 512
+
+class Database:
+    filename   = None
+    connection = None
+    cursor     = None
+    build_mode = False
+
+    def __init__( self, filename, build_mode=False ):
+        self.filename   = str(filename)
+        self.connection = sqlite3.connect(
+            self.filename,
+            cached_statements=CACHED_STATEMENTS,
+            factory=Connection,
+        )
+        self.cursor = self.connection.cursor()
+        self.cursor.execute( "PRAGMA foreign_keys = ON;" )
+        if ( build_mode ):
+            self.enable_build_mode()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exception_type, exception_value, traceback ):
+        if ( exception_type == None ):
+            self.commit()
+        else:
+            self.rollback()
+        self.close()
+        return False
+
+    def set_pragmas( self, pragmas ):
+        # Neither the journal mode nor the synchronous flag can change inside
+        # of a transaction.
+        self.commit()
+        for name, value in pragmas:
+            self.cursor.execute( "PRAGMA {:s} = {:s};".format( name, value ) )
+            self.cursor.fetchall()
+
+    def enable_build_mode( self ):
+        self.set_pragmas( BUILD_MODE_PRAGMAS )
+        self.build_mode = True
+
+    def disable_build_mode( self ):
+        self.set_pragmas( SAFE_MODE_PRAGMAS )
+        self.build_mode = False
+
+    def commit( self ):
+        self.connection.commit()
+
+    def rollback( self ):
+        self.connection.rollback()
+
+    def close( self ):
+        if ( self.connection == None ):
+            return
+        # Closing discards any uncommitted changes, just like closing the
+        # connection itself.  Roll them back first, since restoring the
+        # PRAGMAs would otherwise commit them.
+        self.rollback()
+        if ( self.build_mode ):
+            self.disable_build_mode()
+        drop_connection_caches( self.connection )
+        self.connection.close()
+        self.connection = None
+        self.cursor     = None
+
+    def add_study( self, *args, **kwargs ):
+        return add_study( self.cursor, *args, **kwargs )
+
+    def update_study_description( self, *args, **kwargs ):
+        return update_study_description( self.cursor, *args, **kwargs )
+
+    def update_study_provenance( self, *args, **kwargs ):
+        return update_study_provenance( self.cursor, *args, **kwargs )
+
+    def add_study_source( self, *args, **kwargs ):
+        return add_study_source( self.cursor, *args, **kwargs )
+
+    def add_series( self, *args, **kwargs ):
+        return add_series( self.cursor, *args, **kwargs )
+
+    def update_series_description( self, *args, **kwargs ):
+        return update_series_description( self.cursor, *args, **kwargs )
+
+    def add_series_component( self, *args, **kwargs ):
+        return add_series_component( self.cursor, *args, **kwargs )
+
+    def add_air_components_to_series( self, *args, **kwargs ):
+        return add_air_components_to_series( self.cursor, *args, **kwargs )
+
+    def add_station( self, *args, **kwargs ):
+        return add_station( self.cursor, *args, **kwargs )
+
+    def add_point( self, *args, **kwargs ):
+        return add_point( self.cursor, *args, **kwargs )
+
+    def add_points( self, *args, **kwargs ):
+        return add_points( self.cursor, *args, **kwargs )
+
+    def add_facility( self, *args, **kwargs ):
+        return add_facility( self.cursor, *args, **kwargs )
+
+    def add_facility_source( self, *args, **kwargs ):
+        return add_facility_source( self.cursor, *args, **kwargs )
+
+    def add_instrument( self, *args, **kwargs ):
+        return add_instrument( self.cursor, *args, **kwargs )
+
+    def add_instrument_source( self, *args, **kwargs ):
+        return add_instrument_source( self.cursor, *args, **kwargs )
+
+    def add_model( self, *args, **kwargs ):
+        return add_model( self.cursor, *args, **kwargs )
+
+    def add_model_source( self, *args, **kwargs ):
+        return add_model_source( self.cursor, *args, **kwargs )
+
+    def add_note( self, *args, **kwargs ):
+        return add_note( self.cursor, *args, **kwargs )
+
+    def delete_study( self, *args, **kwargs ):
+        return delete_study( self.cursor, *args, **kwargs )
+
+    def delete_series( self, *args, **kwargs ):
+        return delete_series( self.cursor, *args, **kwargs )
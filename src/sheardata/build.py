@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Build driver that runs every prep_ and proc_ stage in a single interpreter
+# against a single connection.  Run it from the source directory, since the
+# stages use paths relative to it:
+#
+#     python3 -B -m sheardata.build sheardata.db
+#
+# Each stage is a module with a main( cursor ) function.  Every stage runs in
+# its own transaction, so a failed stage rolls back only its own changes before
+# the build stops.
+#
+# Every stage records a fingerprint of its inputs in the build_fingerprints
+# table.  With --incremental, only the studies whose proc_ script, data
+# directory, or the sheardata package itself changed are deleted and loaded
+# again.  Any change to the prep_ stages still rebuilds the whole database.
+#
+# With --jobs, the proc_ stages instead run in a process pool.  The prep_
+# stages build a template database once, every proc_ stage writes into its own
+# copy of the template (a shard), and the shards are then merged into the final
+# database one at a time.
+#
+# The indexes in prep_create_indexes.sql are only created once every proc_
+# stage has loaded its data, followed by ANALYZE, since building each index
+# once is faster than updating it for every inserted row.  The materialized
+# tables (wall_distance_mat and study_summary_mat) are then refreshed.  An
+# incremental update only refreshes the stations and studies that it reloaded.
+# With --refresh, only these last steps run, on an existing database.
+
+import argparse
+import glob
+import hashlib
+import importlib
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+import sheardata as sd
+
+SCHEMA_FILENAME = "prep_create_tables.sql"
+INDEX_FILENAME  = "prep_create_indexes.sql"
+
+DATA_DIRECTORY = os.path.join( "..", "data" )
+
+# The fingerprint of all of the prep_ stages is stored under this name.
+PREP_STAGE_NAME = "prep"
+
+PREP_STAGES = [
+    "prep_create_views",
+    "prep_load_basic_data",
+    "prep_load_fluid_property_values",
+    "prep_fit_fluid_property_correlations",
+]
+
+# Tables whose integer primary keys are assigned by SQLite.  Every shard starts
+# numbering these keys from the same template, so the merge shifts the keys
+# added by each shard (and every column that refers to them) past the keys
+# already in the final database.
+AUTOINCREMENT_KEYS = {
+    "facilities":  "facility_id",
+    "instruments": "instrument_id",
+    "models":      "model_id",
+    "notes":       "note_id",
+    "times":       "time_id",
+}
+
+def list_proc_stages():
+    proc_stages = []
+    for filename in sorted( glob.glob( "proc_*.py" ) ):
+        proc_stages.append( os.path.splitext( filename )[0] )
+    return proc_stages
+
+def study_id_of_stage( module_name ):
+    return module_name[len("proc_"):]
+
+def hash_files( hasher, filenames, start ):
+    for filename in filenames:
+        hasher.update( os.path.relpath( filename, start ).encode( "utf-8" ) )
+        hasher.update( b"\0" )
+        with open( filename, "rb" ) as f:
+            hasher.update( f.read() )
+        hasher.update( b"\0" )
+
+def list_library_files():
+    return sorted( glob.glob( os.path.join( os.path.dirname( sd.__file__ ), "*.py" ) ) )
+
+def fingerprint_prep_stages():
+    hasher = hashlib.sha256()
+    filenames = [ SCHEMA_FILENAME, INDEX_FILENAME ]
+    for module_name in PREP_STAGES:
+        filenames.append( module_name+".py" )
+    hash_files( hasher, filenames, "." )
+    hash_files( hasher, list_library_files(), os.path.dirname( sd.__file__ ) )
+    return hasher.hexdigest()
+
+def fingerprint_proc_stage( module_name ):
+    hasher = hashlib.sha256()
+    hash_files( hasher, [ module_name+".py" ], "." )
+    hash_files( hasher, list_library_files(), os.path.dirname( sd.__file__ ) )
+
+    data_directory = os.path.join( DATA_DIRECTORY, study_id_of_stage( module_name ) )
+    data_filenames = []
+    for root, directories, filenames in os.walk( data_directory ):
+        for filename in filenames:
+            data_filenames.append( os.path.join( root, filename ) )
+    hash_files( hasher, sorted( data_filenames ), data_directory )
+    return hasher.hexdigest()
+
+def record_fingerprint( cursor, stage_name, fingerprint ):
+    cursor.execute(
+    """
+    INSERT OR REPLACE INTO build_fingerprints( stage_name, fingerprint )
+    VALUES( ?, ? );
+    """,
+    (
+        str(stage_name),
+        str(fingerprint),
+    )
+    )
+
+def read_fingerprints( cursor ):
+    cursor.execute(
+    """
+    SELECT stage_name, fingerprint
+    FROM build_fingerprints;
+    """
+    )
+    fingerprints = {}
+    for result in cursor.fetchall():
+        fingerprints[str(result[0])] = str(result[1])
+    return fingerprints
+
+def remove_database( filename ):
+    for suffix in [ "", "-journal", "-wal", "-shm" ]:
+        if ( os.path.exists( filename+suffix ) ):
+            os.remove( filename+suffix )
+
+def create_tables( cursor ):
+    with open( SCHEMA_FILENAME, "r" ) as f:
+        cursor.executescript( f.read() )
+
+def create_indexes( cursor ):
+    with open( INDEX_FILENAME, "r" ) as f:
+        cursor.executescript( f.read() )
+
+def list_stations_of_study( cursor, study_id ):
+    cursor.execute(
+    """
+    SELECT station_id
+    FROM stations
+    WHERE series_id IN ( SELECT series_id FROM series WHERE study_id=? );
+    """,
+    (
+        study_id,
+    )
+    )
+    station_ids = []
+    for result in cursor.fetchall():
+        station_ids.append( str(result[0]) )
+    return station_ids
+
+def run_stage( db, stage_name, stage_function ):
+    start_time = time.perf_counter()
+    try:
+        stage_function( db.cursor )
+        db.commit()
+    except Exception:
+        db.rollback()
+        print( "{:40s} failed".format( stage_name ), file=sys.stderr )
+        raise
+    elapsed_time = time.perf_counter() - start_time
+    print( "{:40s} {:8.3f} s".format( stage_name, elapsed_time ) )
+    return elapsed_time
+
+def run_module_stage( db, module_name ):
+    module = importlib.import_module( module_name )
+    fingerprint = fingerprint_proc_stage( module_name )
+
+    def stage_function( cursor ):
+        module.main( cursor )
+        record_fingerprint( cursor, module_name, fingerprint )
+
+    return run_stage( db, module_name, stage_function )
+
+def reload_module_stage( db, module_name ):
+    module = importlib.import_module( module_name )
+    fingerprint = fingerprint_proc_stage( module_name )
+
+    def stage_function( cursor ):
+        study_id = study_id_of_stage( module_name )
+        sd.delete_study( cursor, study_id )
+        module.main( cursor )
+        sd.refresh_wall_distances( cursor, list_stations_of_study( cursor, study_id ) )
+        sd.refresh_study_summaries( cursor, [ study_id ] )
+        record_fingerprint( cursor, module_name, fingerprint )
+
+    return run_stage( db, module_name, stage_function )
+
+def unload_module_stage( db, module_name ):
+    def stage_function( cursor ):
+        sd.delete_study( cursor, study_id_of_stage( module_name ) )
+        cursor.execute(
+        """
+        DELETE FROM build_fingerprints
+        WHERE stage_name=?;
+        """,
+        (
+            module_name,
+        )
+        )
+
+    return run_stage( db, module_name+" (removed)", stage_function )
+
+def run_prep_stages( db ):
+    fingerprint = fingerprint_prep_stages()
+    total_time = run_stage( db, SCHEMA_FILENAME, create_tables )
+    for module_name in PREP_STAGES:
+        module = importlib.import_module( module_name )
+        total_time += run_stage( db, module_name, module.main )
+    record_fingerprint( db.cursor, PREP_STAGE_NAME, fingerprint )
+    db.commit()
+    return total_time
+
+def run_final_stages( db ):
+    total_time  = run_stage( db, INDEX_FILENAME, create_indexes )
+    total_time += run_stage( db, "refresh_wall_distances", sd.refresh_wall_distances )
+    total_time += run_stage( db, "refresh_study_summaries", sd.refresh_study_summaries )
+    return total_time
+
+def refresh( filename ):
+    db = sd.Database( filename, build_mode=True )
+    try:
+        total_time = run_final_stages( db )
+    finally:
+        db.close()
+    return total_time
+
+def build_serially( filename, proc_stages ):
+    total_time = 0.0
+    remove_database( filename )
+    db = sd.Database( filename, build_mode=True )
+    try:
+        total_time += run_prep_stages( db )
+        for module_name in proc_stages:
+            total_time += run_module_stage( db, module_name )
+        total_time += run_final_stages( db )
+    finally:
+        db.close()
+    return total_time
+
+def build_incrementally( filename, proc_stages ):
+    if ( os.path.exists( filename ) == False ):
+        return build_serially( filename, proc_stages )
+
+    db = sd.Database( filename, build_mode=True )
+    try:
+        fingerprints = read_fingerprints( db.cursor )
+    except sqlite3.OperationalError:
+        fingerprints = {}
+    if ( fingerprints.get( PREP_STAGE_NAME ) != fingerprint_prep_stages() ):
+        db.close()
+        return build_serially( filename, proc_stages )
+
+    total_time = 0.0
+    changed = False
+    try:
+        for module_name in proc_stages:
+            if ( fingerprints.get( module_name ) == fingerprint_proc_stage( module_name ) ):
+                print( "{:40s} unchanged".format( module_name ) )
+            else:
+                total_time += reload_module_stage( db, module_name )
+                changed = True
+
+        for module_name in sorted( fingerprints ):
+            if ( module_name != PREP_STAGE_NAME and
+                 os.path.exists( module_name+".py" ) == False ):
+                total_time += unload_module_stage( db, module_name )
+                changed = True
+
+        # The indexes already exist, but the statistics are out of date.
+        if ( changed ):
+            total_time += run_stage( db, INDEX_FILENAME, create_indexes )
+    finally:
+        db.close()
+    return total_time
+
+def build_shard( shard ):
+    module_name, shard_filename = shard
+    db = sd.Database( shard_filename, build_mode=True )
+    try:
+        module = importlib.import_module( module_name )
+        fingerprint = fingerprint_proc_stage( module_name )
+        start_time = time.perf_counter()
+        module.main( db.cursor )
+        record_fingerprint( db.cursor, module_name, fingerprint )
+        db.commit()
+        elapsed_time = time.perf_counter() - start_time
+    finally:
+        db.close()
+    return elapsed_time
+
+def list_tables( cursor, schema="main" ):
+    cursor.execute(
+    """
+    SELECT name
+    FROM {:s}.sqlite_master
+    WHERE type='table' AND name NOT LIKE 'sqlite_%'
+    ORDER BY rowid;
+    """.format( schema )
+    )
+    tables = []
+    for result in cursor.fetchall():
+        tables.append( str(result[0]) )
+    return tables
+
+def find_maximum_keys( cursor, schema="main" ):
+    maximum_keys = {}
+    for table in AUTOINCREMENT_KEYS:
+        cursor.execute(
+        """
+        SELECT COALESCE( MAX({:s}), 0 )
+        FROM {:s}.{:s};
+        """.format( AUTOINCREMENT_KEYS[table], schema, table )
+        )
+        maximum_keys[table] = int(cursor.fetchone()[0])
+    return maximum_keys
+
+# Returns the expression that moves a key added by the shard (any key greater
+# than the template's maximum key) past the keys already in the database.
+def shift_key_expression( column, template_maximum_key, offset ):
+    return "CASE WHEN {:s} > {:d} THEN {:s} + {:d} ELSE {:s} END".format(
+        column,
+        template_maximum_key,
+        column,
+        offset,
+        column,
+    )
+
+# Returns the condition that a row of one table matches a row of another on the
+# given columns.  The columns are compared with IS, since some primary keys
+# include columns that may be NULL.
+def match_columns_condition( columns, alias, other_alias ):
+    conditions = []
+    for column in columns:
+        conditions.append( "{1:s}.{0:s} IS {2:s}.{0:s}".format(
+            column,
+            alias,
+            other_alias,
+        ) )
+    return " AND ".join( conditions )
+
+# A proc_ stage may only add rows to the tables that the template filled.  If it
+# changed or deleted a row from the template instead, its shard cannot be
+# merged, since the other shards still have the original row.
+def check_template_rows( cursor, shard_filename, table, columns ):
+    cursor.execute(
+    """
+    SELECT COUNT(*)
+    FROM template.{0:s} AS template_row
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM shard.{0:s} AS shard_row
+        WHERE {1:s}
+    );
+    """.format(
+        table,
+        match_columns_condition( columns, "shard_row", "template_row" ),
+    )
+    )
+    number_of_rows = int(cursor.fetchone()[0])
+    if ( number_of_rows != 0 ):
+        raise sqlite3.IntegrityError(
+            "{:s} changed or deleted {:d} rows of {:s} from the template, so "
+            "it cannot be built in parallel".format(
+                os.path.basename( shard_filename ),
+                number_of_rows,
+                table,
+            )
+        )
+
+def merge_shard( db, shard_filename, template_maximum_keys, empty_tables ):
+    cursor = db.cursor
+    db.commit()
+    cursor.execute( "ATTACH DATABASE ? AS shard;", ( shard_filename, ) )
+
+    offsets = {}
+    maximum_keys = find_maximum_keys( cursor )
+    for table in AUTOINCREMENT_KEYS:
+        offsets[table] = maximum_keys[table] - template_maximum_keys[table]
+
+    for table in list_tables( cursor, schema="shard" ):
+        cursor.execute( "PRAGMA shard.table_info({:s});".format( table ) )
+        columns     = []
+        key_columns = []
+        for result in cursor.fetchall():
+            columns.append( str(result[1]) )
+            if ( int(result[5]) != 0 ):
+                key_columns.append( str(result[1]) )
+        if ( len(key_columns) == 0 ):
+            key_columns = columns
+
+        referenced_tables = {}
+        if ( table in AUTOINCREMENT_KEYS ):
+            referenced_tables[AUTOINCREMENT_KEYS[table]] = table
+        cursor.execute( "PRAGMA shard.foreign_key_list({:s});".format( table ) )
+        for result in cursor.fetchall():
+            referenced_table = str(result[2])
+            if ( referenced_table in AUTOINCREMENT_KEYS ):
+                referenced_tables[str(result[3])] = referenced_table
+
+        expressions = []
+        for column in columns:
+            if ( column in referenced_tables ):
+                referenced_table = referenced_tables[column]
+                expressions.append( shift_key_expression(
+                    column,
+                    template_maximum_keys[referenced_table],
+                    offsets[referenced_table],
+                ) )
+            else:
+                expressions.append( column )
+
+        # Only copy the rows that the proc_ stage added to the template, which
+        # are the rows whose primary keys are not in the template.
+        if ( table in empty_tables ):
+            condition = ""
+        else:
+            check_template_rows( cursor, shard_filename, table, columns )
+            if ( table in AUTOINCREMENT_KEYS ):
+                condition = "WHERE {:s} > {:d}".format(
+                    AUTOINCREMENT_KEYS[table],
+                    template_maximum_keys[table],
+                )
+            else:
+                condition = """WHERE NOT EXISTS (
+            SELECT 1
+            FROM template.{:s} AS template_row
+            WHERE {:s}
+        )""".format(
+                    table,
+                    match_columns_condition( key_columns, "template_row",
+                                             "shard_row" ),
+                )
+
+        cursor.execute(
+        """
+        INSERT INTO main.{:s}( {:s} )
+        SELECT {:s}
+        FROM shard.{:s} AS shard_row
+        {:s};
+        """.format(
+            table,
+            ", ".join( columns ),
+            ", ".join( expressions ),
+            table,
+            condition,
+        )
+        )
+
+    db.commit()
+    cursor.execute( "DETACH DATABASE shard;" )
+
+def merge_shards( filename, template_filename, shard_filenames ):
+    shutil.copyfile( template_filename, filename )
+    db = sd.Database( filename, build_mode=True )
+    cursor = db.cursor
+    try:
+        # The shards were all checked while they were built, and every table
+        # is merged in the order that it was created, so turn off the checks
+        # while merging and check the whole database once at the end instead.
+        cursor.execute( "PRAGMA foreign_keys = OFF;" )
+        template_maximum_keys = find_maximum_keys( cursor )
+        empty_tables = []
+        for table in list_tables( cursor ):
+            cursor.execute( "SELECT COUNT(*) FROM (SELECT 1 FROM {:s} LIMIT 1);".format( table ) )
+            if ( int(cursor.fetchone()[0]) == 0 ):
+                empty_tables.append( table )
+
+        cursor.execute( "ATTACH DATABASE ? AS template;", ( template_filename, ) )
+        for shard_filename in shard_filenames:
+            merge_shard( db, shard_filename, template_maximum_keys, empty_tables )
+        cursor.execute( "DETACH DATABASE template;" )
+
+        cursor.execute( "PRAGMA foreign_key_check;" )
+        violations = cursor.fetchall()
+        if ( len(violations) != 0 ):
+            raise sqlite3.IntegrityError(
+                "merged database has {:d} foreign key violations".format(
+                    len(violations)
+                )
+            )
+        cursor.execute( "PRAGMA foreign_keys = ON;" )
+    finally:
+        db.close()
+
+def build_in_parallel( filename, proc_stages, jobs ):
+    total_time = 0.0
+    remove_database( filename )
+    directory = os.path.dirname( os.path.abspath( filename ) )
+    with tempfile.TemporaryDirectory( dir=directory ) as shard_directory:
+        template_filename = os.path.join( shard_directory, "template.db" )
+        db = sd.Database( template_filename, build_mode=True )
+        try:
+            total_time += run_prep_stages( db )
+        finally:
+            db.close()
+
+        shards = []
+        for module_name in proc_stages:
+            shard_filename = os.path.join(
+                shard_directory,
+                "{:s}.db".format( module_name ),
+            )
+            shutil.copyfile( template_filename, shard_filename )
+            shards.append( ( module_name, shard_filename ) )
+
+        start_time = time.perf_counter()
+        with multiprocessing.Pool( jobs ) as pool:
+            elapsed_times = pool.map( build_shard, shards, chunksize=1 )
+        for i in range(len(shards)):
+            print( "{:40s} {:8.3f} s".format( shards[i][0], elapsed_times[i] ) )
+        total_time += time.perf_counter() - start_time
+
+        shard_filenames = []
+        for module_name, shard_filename in shards:
+            shard_filenames.append( shard_filename )
+
+        start_time = time.perf_counter()
+        merge_shards( filename, template_filename, shard_filenames )
+        elapsed_time = time.perf_counter() - start_time
+        print( "{:40s} {:8.3f} s".format( "merge", elapsed_time ) )
+        total_time += elapsed_time
+
+    total_time += refresh( filename )
+    return total_time
+
+def build( filename, proc_stages=None, jobs=1, incremental=False,
+           refresh_only=False ):
+    if ( proc_stages == None ):
+        proc_stages = list_proc_stages()
+
+    if ( refresh_only ):
+        total_time = refresh( filename )
+    elif ( incremental ):
+        total_time = build_incrementally( filename, proc_stages )
+    elif ( jobs == 1 ):
+        total_time = build_serially( filename, proc_stages )
+    else:
+        total_time = build_in_parallel( filename, proc_stages, jobs )
+
+    print( "{:40s} {:8.3f} s".format( "total", total_time ) )
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser(
+        prog="sheardata.build",
+        description="Build the database in a single process.",
+    )
+    parser.add_argument(
+        "database",
+        help="database file to create",
+    )
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        help="proc_ stages to run (default: all of them)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes for the proc_ stages (0 for one per CPU)",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="only load the studies whose inputs changed since the last build",
+    )
+    parser.add_argument(
+        "-r",
+        "--refresh",
+        action="store_true",
+        help="only create the indexes and refresh the materialized tables",
+    )
+    args = parser.parse_args( argv )
+
+    jobs = args.jobs
+    if ( jobs == 0 ):
+        jobs = os.cpu_count()
+
+    proc_stages = None
+    if ( len(args.stages) != 0 ):
+        proc_stages = []
+        for stage in args.stages:
+            proc_stages.append( os.path.splitext( stage )[0] )
+
+    build(
+        args.database,
+        proc_stages=proc_stages,
+        jobs=jobs,
+        incremental=args.incremental,
+        refresh_only=args.refresh,
+    )
+
+if ( __name__ == "__main__" ):
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Selection of stations.  A StationFilter collects conditions on the stations
+# and on the series, studies, and models that they belong to, and compiles them
+# into one query that joins only the tables that the conditions refer to, with
+# every value as a bound parameter.  Each method adds a condition and returns
+# the filter itself, so that the conditions chain:
+#
+#     station_ids = sd.StationFilter().flow_class( sd.FC_DUCT_FLOW ) \
+#                                     .study_type( sd.ST_EXPERIMENT ) \
+#                                     .quantity_between( "wall_distance",
+#                                                        maximum=1.0e-3 ) \
+#                                     .station_ids( cursor )
+#
+# The conditions on point quantities are EXISTS subqueries rather than joins,
+# so that a station appears only once however many of its points match, and so
+# that SQLite can stop at the first matching point.  Classes match their
+# descendants in the classification too, unless descendants=False.  Use
+# explain() to see the query plan.
+
+import sheardata as sd
+
+# The joins from the stations to each table that the conditions may refer to,
+# along with the tables that each join needs first.
+STATION_FILTER_JOINS = [
+    ( "series",  [],           "JOIN series  ON series.series_id = stations.series_id" ),
+    ( "studies", [ "series" ], "JOIN studies ON studies.study_id = series.study_id"    ),
+    ( "models",  [ "series" ], "JOIN models  ON models.model_id  = series.model_id"    ),
+]
+
+class StationFilter:
+    tables     = None
+    conditions = None
+    parameters = None
+
+    def __init__( self ):
+        self.tables     = []
+        self.conditions = []
+        self.parameters = []
+
+    def add_condition( self, tables, condition, parameters=() ):
+        for table, required_tables, join in STATION_FILTER_JOINS:
+            if ( table in tables ):
+                for required_table in required_tables + [ table ]:
+                    if ( required_table not in self.tables ):
+                        self.tables.append( required_table )
+        self.conditions.append( condition )
+        self.parameters.extend( parameters )
+        return self
+
+    def flow_class( self, flow_class_id, descendants=True ):
+        if ( descendants ):
+            return self.add_condition(
+                [ "studies" ],
+                "studies.flow_class_id IN ( SELECT flow_class_descendant_id "
+                "FROM flow_class_paths WHERE flow_class_ancestor_id=? )",
+                [ str(flow_class_id) ],
+            )
+        return self.add_condition(
+            [ "studies" ],
+            "studies.flow_class_id=?",
+            [ str(flow_class_id) ],
+        )
+
+    def study_type( self, study_type_id ):
+        return self.add_condition(
+            [ "studies" ],
+            "studies.study_type_id=?",
+            [ str(study_type_id) ],
+        )
+
+    def study( self, study_id ):
+        return self.add_condition(
+            [ "series" ],
+            "series.study_id=?",
+            [ sd.sanitize_identifier(study_id) ],
+        )
+
+    def number_of_dimensions( self, number_of_dimensions ):
+        return self.add_condition(
+            [ "series" ],
+            "series.number_of_dimensions=?",
+            [ int(number_of_dimensions) ],
+        )
+
+    def model_class( self, model_class_id, descendants=True ):
+        if ( descendants ):
+            return self.add_condition(
+                [ "models" ],
+                "models.model_class_id IN ( SELECT model_class_descendant_id "
+                "FROM model_class_paths WHERE model_class_ancestor_id=? )",
+                [ str(model_class_id) ],
+            )
+        return self.add_condition(
+            [ "models" ],
+            "models.model_class_id=?",
+            [ str(model_class_id) ],
+        )
+
+    def flow_regime( self, flow_regime_id ):
+        return self.add_condition(
+            [],
+            "stations.flow_regime_id=?",
+            [ str(flow_regime_id) ],
+        )
+
+    def streamwise_periodic( self, periodic=True ):
+        return self.add_condition(
+            [],
+            "stations.streamwise_periodic=?",
+            [ int(bool(periodic)) ],
+        )
+
+    def spanwise_periodic( self, periodic=True ):
+        return self.add_condition(
+            [],
+            "stations.spanwise_periodic=?",
+            [ int(bool(periodic)) ],
+        )
+
+    def exclude_outliers( self ):
+        return self.add_condition(
+            [ "studies" ],
+            "stations.outlier=FALSE AND series.outlier=FALSE "
+            "AND studies.outlier=FALSE",
+        )
+
+    # Stations with at least one point (or, given a point label, one labeled
+    # point) where the quantity is between the minimum and maximum, inclusive.
+    # Either bound may be None, and values marked as outliers never match.  The
+    # lower and upper point labels match any point with that label.
+    def quantity_between( self, quantity, minimum=None, maximum=None,
+                          point_label_id=None ):
+        if ( quantity not in sd.POINT_QUANTITY_TABLES ):
+            raise ValueError( "{!r} is not a point quantity".format( quantity ) )
+        table = sd.POINT_QUANTITY_TABLES[quantity]
+
+        conditions = []
+        parameters = []
+        if ( table in sd.STATION_KEYED_TABLES ):
+            source = "{:s} AS quantity_values".format( table )
+            conditions.append( "quantity_values.station_id = stations.station_id" )
+            if ( point_label_id != None ):
+                source += \
+                    " JOIN points ON points.point_key = quantity_values.point_key"
+        else:
+            source = "points JOIN {:s} AS quantity_values " \
+                     "ON quantity_values.point_key = points.point_key".format( table )
+            conditions.append( "points.station_id = stations.station_id" )
+
+        if ( point_label_id != None ):
+            conditions.append( "points.point_label_id=?" )
+            parameters.append( sd.sanitize_point_label( point_label_id ) )
+        if ( minimum != None ):
+            conditions.append( "quantity_values.value>=?" )
+            parameters.append( float(minimum) )
+        if ( maximum != None ):
+            conditions.append( "quantity_values.value<=?" )
+            parameters.append( float(maximum) )
+        conditions.append( "quantity_values.outlier=FALSE" )
+
+        return self.add_condition(
+            [],
+            "EXISTS ( SELECT 1 FROM {:s} WHERE {:s} )".format(
+                source,
+                " AND ".join( conditions ),
+            ),
+            parameters,
+        )
+
+    # Returns the query and its parameters.
+    def sql( self ):
+        query = "SELECT stations.station_id\nFROM stations"
+        for table, required_tables, join in STATION_FILTER_JOINS:
+            if ( table in self.tables ):
+                query += "\n" + join
+        if ( len(self.conditions) != 0 ):
+            query += "\nWHERE " + "\n  AND ".join( self.conditions )
+        query += "\nORDER BY stations.station_id;"
+        return query, tuple(self.parameters)
+
+    def station_ids( self, cursor ):
+        query, parameters = self.sql()
+        cursor.execute( query, parameters )
+
+        station_ids = []
+        for result in cursor:
+            station_ids.append( str(result[0]) )
+
+        return station_ids
+
+    # Returns the lines of EXPLAIN QUERY PLAN for the query.
+    def explain( self, cursor ):
+        query, parameters = self.sql()
+        cursor.execute( "EXPLAIN QUERY PLAN " + query, parameters )
+
+        plan = []
+        for result in cursor:
+            plan.append( str(result[3]) )
+
+        return plan
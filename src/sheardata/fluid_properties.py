@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Interpolation of the tabulated fluid properties in the fluid_property_values
+# table.
+#
+# A FluidPropertyTable holds the values of one property of one fluid, from one
+# source (or from every source), as a sorted grid.  By default only the
+# preferred values are used; preferred=False uses only the others, and
+# preferred=None uses every value.  The grid has one or more pressure levels,
+# and each level has its own sorted temperatures, since the tables in the
+# literature rarely cover the same temperatures at every pressure.  Properties
+# are interpolated linearly in temperature along the pressure levels, and then,
+# when a pressure is given, linearly in pressure between the two levels around
+# it.
+#
+# The tabulated uncertainties are propagated to first order, treating every
+# tabulated value as uncorrelated with every other, along with the
+# uncertainties of the temperatures and pressures when those are SDArrays or
+# sdfloats.  Points outside of the grid give NaN, since the tables are never
+# extrapolated.
+#
+# The grids are built when first needed and then kept for every connection
+# (see get_fluid_property_table) until the fluid_property_values table changes
+# through that connection.
+#
+# A FluidPropertyCorrelation instead holds a closed-form correlation fitted to
+# the same values (see fit_fluid_property_correlation and the
+# fluid_property_correlations table).  Correlations are smooth, so they give
+# better derivatives than the tables, and they are faster to evaluate on whole
+# profiles.
+
+import numpy as np
+
+import sheardata as sd
+from sheardata.sdarray import SDArray, split_operand
+
+class FluidPropertyTable:
+    fluid_id      = None
+    quantity_id   = None
+    citation_key  = None
+    preferred     = None
+    pressures     = None
+    offsets       = None
+    temperatures  = None
+    values        = None
+    uncertainties = None
+
+    def __init__( self, cursor, fluid_id, quantity_id, citation_key=None,
+                  preferred=True ):
+        self.fluid_id     = fluid_id
+        self.quantity_id  = quantity_id
+        self.citation_key = citation_key
+        self.preferred    = preferred
+
+        cursor.execute(
+        """
+        SELECT pressure, temperature, fluid_property_value,
+               fluid_property_uncertainty
+        FROM fluid_property_values
+        WHERE fluid_id=?1
+          AND quantity_id=?2
+          AND ( ?3 IS NULL OR citation_key=?3 )
+          AND ( ?4 IS NULL OR preferred=?4 )
+        ORDER BY pressure, temperature, citation_key;
+        """,
+        (
+            fluid_id,
+            quantity_id,
+            citation_key,
+            None if preferred == None else int(preferred),
+        )
+        )
+        rows = cursor.fetchall()
+        if ( len(rows) == 0 ):
+            raise ValueError(
+                "no fluid property values for {!r} and {!r}".format(
+                    fluid_id, quantity_id
+                )
+            )
+
+        grid = np.array( rows, dtype=np.float64 )
+
+        # Several sources may give a value at the same pressure and
+        # temperature.  Only the first one (by citation key) is kept.
+        keep = np.ones( len(grid), dtype=bool )
+        keep[1:] = ( grid[1:,0] != grid[:-1,0] ) | ( grid[1:,1] != grid[:-1,1] )
+        grid = grid[keep]
+
+        self.pressures, starts = np.unique( grid[:,0], return_index=True )
+        self.offsets       = np.append( starts, len(grid) )
+        self.temperatures  = grid[:,1]
+        self.values        = grid[:,2]
+        self.uncertainties = grid[:,3]
+
+    # Returns the index of the pressure level closest to the given pressure.
+    def nearest_level( self, pressure=sd.STANDARD_ATMOSPHERIC_PRESSURE ):
+        return int( np.argmin( np.abs( self.pressures - pressure ) ) )
+
+    # Interpolates linearly in temperature along pressure level k.  Returns the
+    # values, the variances from the tabulated uncertainties, and the
+    # derivatives with respect to temperature.
+    def interpolate_level( self, k, temperature ):
+        begin, end = self.offsets[k], self.offsets[k+1]
+        T = self.temperatures[begin:end]
+        v = self.values[begin:end]
+        s = self.uncertainties[begin:end]
+
+        if ( len(T) == 1 ):
+            inside = temperature == T[0]
+            return np.where( inside, v[0], np.nan ), \
+                   np.where( inside, s[0]**2, np.nan ), \
+                   np.zeros_like(temperature)
+
+        j = np.clip( np.searchsorted( T, temperature, side="right" ), 1, len(T) - 1 )
+        i = j - 1
+        w = ( temperature - T[i] ) / ( T[j] - T[i] )
+        inside = ( temperature >= T[0] ) & ( temperature <= T[-1] )
+
+        value    = ( 1.0 - w ) * v[i] + w * v[j]
+        variance = ( ( 1.0 - w ) * s[i] )**2 + ( w * s[j] )**2
+        slope    = ( v[j] - v[i] ) / ( T[j] - T[i] )
+        return np.where( inside, value,    np.nan ), \
+               np.where( inside, variance, np.nan ), \
+               slope
+
+    # Returns the property at the given temperatures, and optionally at the
+    # given pressures.  Without pressures, the property is interpolated along
+    # the pressure level closest to standard atmospheric pressure.  Arrays and
+    # SDArrays give SDArrays, and scalars give sdfloats.
+    def evaluate( self, temperature, pressure=None ):
+        T, s_T = split_operand( temperature )
+        scalar = np.ndim(T) == 0
+        T   = np.atleast_1d( np.asarray( T, dtype=np.float64 ) )
+        s_T = np.broadcast_to( s_T, T.shape )
+
+        if ( pressure is None or len(self.pressures) == 1 ):
+            value, variance, slope = self.interpolate_level( self.nearest_level(), T )
+            variance = variance + ( slope * s_T )**2
+        else:
+            p, s_p = split_operand( pressure )
+            p   = np.broadcast_to( np.asarray( p, dtype=np.float64 ), T.shape )
+            s_p = np.broadcast_to( s_p, T.shape )
+
+            b = np.clip( np.searchsorted( self.pressures, p, side="right" ),
+                         1, len(self.pressures) - 1 )
+            a = b - 1
+            u = ( p - self.pressures[a] ) / ( self.pressures[b] - self.pressures[a] )
+            inside = ( p >= self.pressures[0] ) & ( p <= self.pressures[-1] )
+
+            value_a, variance_a, slope_a = np.zeros_like(T), np.zeros_like(T), np.zeros_like(T)
+            value_b, variance_b, slope_b = np.zeros_like(T), np.zeros_like(T), np.zeros_like(T)
+            for k in np.unique( np.concatenate( [ a, b ] ) ):
+                for level, level_value, level_variance, level_slope in [
+                    ( a, value_a, variance_a, slope_a ),
+                    ( b, value_b, variance_b, slope_b ),
+                ]:
+                    on_level = level == k
+                    if ( np.any(on_level) ):
+                        level_value[on_level], level_variance[on_level], \
+                            level_slope[on_level] = self.interpolate_level(
+                                k, T[on_level]
+                            )
+
+            value     = ( 1.0 - u ) * value_a + u * value_b
+            slope     = ( 1.0 - u ) * slope_a + u * slope_b
+            dvalue_dp = ( value_b - value_a ) / ( self.pressures[b] - self.pressures[a] )
+            variance  = ( 1.0 - u )**2 * variance_a + u**2 * variance_b \
+                      + ( slope * s_T )**2 + ( dvalue_dp * s_p )**2
+            value    = np.where( inside, value,    np.nan )
+            variance = np.where( inside, variance, np.nan )
+
+        if ( scalar ):
+            return sd.sdfloat( value[0], np.sqrt(variance[0]) )
+        return SDArray( value, np.sqrt(variance) )
+
+def get_fluid_property_table( cursor, fluid_id, quantity_id, citation_key=None,
+                              preferred=True ):
+    tables = sd.get_connection_cache( cursor, "fluid_property_tables", dict,
+                                      [ "fluid_property_values" ] )
+    key = ( fluid_id, quantity_id, citation_key, preferred )
+    if ( key not in tables ):
+        tables[key] = FluidPropertyTable( cursor, fluid_id, quantity_id,
+                                          citation_key, preferred )
+    return tables[key]
+
+def evaluate_fluid_property( cursor, fluid_id, quantity_id, temperature,
+                             pressure=None, citation_key=None, preferred=True ):
+    return get_fluid_property_table(
+        cursor, fluid_id, quantity_id, citation_key, preferred
+    ).evaluate( temperature, pressure )
+
+# Correlations.  Each function returns the property and its derivative with
+# respect to temperature, given the coefficients c and the reference
+# temperature T_r.
+
+# Sutherland's law,
+#
+#     q = c_0 ( T / T_r )^(3/2) ( T_r + c_1 ) / ( T + c_1 ),
+#
+# where c_0 is the property at T_r and c_1 is Sutherland's constant.
+def sutherland_law( c, reference_temperature, temperature ):
+    value = c[0] * ( temperature / reference_temperature )**1.5 \
+          * ( reference_temperature + c[1] ) / ( temperature + c[1] )
+    return value, value * ( 1.5 / temperature - 1.0 / ( temperature + c[1] ) )
+
+# q = c_0 ( T / T_r )^c_1
+def power_law( c, reference_temperature, temperature ):
+    value = c[0] * ( temperature / reference_temperature )**c[1]
+    return value, value * c[1] / temperature
+
+# q = sum_k c_k x^k, where x = T / T_r - 1
+def polynomial( c, reference_temperature, temperature ):
+    x = temperature / reference_temperature - 1.0
+    return np.polynomial.polynomial.polyval( x, c ), \
+           np.polynomial.polynomial.polyval(
+               x, np.polynomial.polynomial.polyder( c )
+           ) / reference_temperature
+
+# q = exp( sum_k c_k x^k ), where x = T / T_r - 1
+def exponential_polynomial( c, reference_temperature, temperature ):
+    exponent, slope = polynomial( c, reference_temperature, temperature )
+    value = np.exp( exponent )
+    return value, value * slope
+
+CORRELATION_FUNCTIONS = {
+    sd.CT_EXPONENTIAL_POLYNOMIAL: exponential_polynomial,
+    sd.CT_POLYNOMIAL:             polynomial,
+    sd.CT_POWER_LAW:              power_law,
+    sd.CT_SUTHERLAND_LAW:         sutherland_law,
+}
+
+# Fits a correlation to tabulated values by linear least squares, minimizing
+# the relative residuals (or the residuals of the logarithm, which are nearly
+# the same thing).  Sutherland's law becomes linear after rearranging it as
+#
+#     T^(3/2) / q = a T + b,
+#
+# so that c_1 = b / a.  The degree only applies to the polynomials.
+#
+# Returns the coefficients and a relative standard uncertainty, which combines
+# the standard deviation of the relative residuals with the root mean square of
+# the relative uncertainties of the tabulated values (when any are known).
+def fit_fluid_property_correlation( correlation_type_id, temperatures, values,
+                                    uncertainties, reference_temperature,
+                                    degree=None ):
+    T = np.asarray( temperatures,  dtype=np.float64 )
+    v = np.asarray( values,        dtype=np.float64 )
+    s = np.asarray( uncertainties, dtype=np.float64 )
+
+    if ( correlation_type_id == sd.CT_SUTHERLAND_LAW ):
+        a, b = np.linalg.lstsq(
+            np.stack( [ T, np.ones_like(T) ], axis=1 ) * ( v / T**1.5 )[:,np.newaxis],
+            np.ones_like(T),
+            rcond=None,
+        )[0]
+        c = np.array( [ reference_temperature**1.5 / ( a * reference_temperature + b ), b / a ] )
+    elif ( correlation_type_id == sd.CT_POWER_LAW ):
+        c = np.polynomial.polynomial.polyfit( np.log( T / reference_temperature ), np.log(v), 1 )
+        c = np.array( [ np.exp(c[0]), c[1] ] )
+    elif ( correlation_type_id == sd.CT_POLYNOMIAL ):
+        x = T / reference_temperature - 1.0
+        c = np.linalg.lstsq(
+            np.polynomial.polynomial.polyvander( x, degree ) / v[:,np.newaxis],
+            np.ones_like(x),
+            rcond=None,
+        )[0]
+    elif ( correlation_type_id == sd.CT_EXPONENTIAL_POLYNOMIAL ):
+        c = np.polynomial.polynomial.polyfit( T / reference_temperature - 1.0, np.log(v), degree )
+    else:
+        raise ValueError( "unknown correlation type {!r}".format( correlation_type_id ) )
+
+    if ( len(T) <= len(c) ):
+        raise ValueError( "too few values to fit {:d} coefficients".format( len(c) ) )
+
+    fit, _ = CORRELATION_FUNCTIONS[correlation_type_id]( c, reference_temperature, T )
+    residuals = fit / v - 1.0
+    relative_uncertainty = np.sqrt( np.sum( residuals**2 ) / ( len(T) - len(c) ) )
+
+    known = np.isfinite(s)
+    if ( np.any(known) ):
+        relative_uncertainty = np.hypot(
+            relative_uncertainty,
+            np.sqrt( np.mean( ( s[known] / v[known] )**2 ) ),
+        )
+
+    return c, float(relative_uncertainty)
+
+class FluidPropertyCorrelation:
+    fluid_id                = None
+    quantity_id             = None
+    correlation_type_id     = None
+    reference_temperature   = None
+    minimum_temperature     = None
+    maximum_temperature     = None
+    correlation_uncertainty = None
+    coefficients            = None
+
+    # Without a correlation type, the preferred correlation is used.
+    def __init__( self, cursor, fluid_id, quantity_id, correlation_type_id=None ):
+        cursor.execute(
+        """
+        SELECT correlation_type_id, reference_temperature, minimum_temperature,
+               maximum_temperature, correlation_uncertainty
+        FROM fluid_property_correlations
+        WHERE fluid_id=?1
+          AND quantity_id=?2
+          AND ( ( ?3 IS NULL AND preferred=TRUE ) OR correlation_type_id=?3 );
+        """,
+        ( fluid_id, quantity_id, correlation_type_id, )
+        )
+        result = cursor.fetchone()
+        if ( result == None ):
+            raise ValueError(
+                "no fluid property correlation for {!r} and {!r}".format(
+                    fluid_id, quantity_id
+                )
+            )
+
+        self.fluid_id                = fluid_id
+        self.quantity_id             = quantity_id
+        self.correlation_type_id     = str(result[0])
+        self.reference_temperature   = float(result[1])
+        self.minimum_temperature     = float(result[2])
+        self.maximum_temperature     = float(result[3])
+        self.correlation_uncertainty = float(result[4])
+
+        cursor.execute(
+        """
+        SELECT coefficient_value
+        FROM fluid_property_correlation_coefficients
+        WHERE fluid_id=? AND quantity_id=? AND correlation_type_id=?
+        ORDER BY coefficient_number;
+        """,
+        ( fluid_id, quantity_id, self.correlation_type_id, )
+        )
+        self.coefficients = np.array( [ row[0] for row in cursor.fetchall() ] )
+
+    # Returns the property at the given temperatures, with the same conventions
+    # as FluidPropertyTable.evaluate.
+    def evaluate( self, temperature ):
+        T, s_T = split_operand( temperature )
+        scalar = np.ndim(T) == 0
+        T = np.atleast_1d( np.asarray( T, dtype=np.float64 ) )
+
+        value, slope = CORRELATION_FUNCTIONS[self.correlation_type_id](
+            self.coefficients, self.reference_temperature, T
+        )
+        uncertainty = np.hypot( self.correlation_uncertainty * value, slope * s_T )
+
+        inside = ( T >= self.minimum_temperature ) & ( T <= self.maximum_temperature )
+        value       = np.where( inside, value,       np.nan )
+        uncertainty = np.where( inside, uncertainty, np.nan )
+
+        if ( scalar ):
+            return sd.sdfloat( value[0], uncertainty[0] )
+        return SDArray( value, uncertainty )
+
+def get_fluid_property_correlation( cursor, fluid_id, quantity_id,
+                                    correlation_type_id=None ):
+    correlations = sd.get_connection_cache(
+        cursor,
+        "fluid_property_correlations",
+        dict,
+        [ "fluid_property_correlations", "fluid_property_correlation_coefficients" ],
+    )
+    key = ( fluid_id, quantity_id, correlation_type_id )
+    if ( key not in correlations ):
+        correlations[key] = FluidPropertyCorrelation( cursor, fluid_id,
+                                                      quantity_id,
+                                                      correlation_type_id )
+    return correlations[key]
+
+def evaluate_correlation( cursor, fluid_id, quantity_id, temperature,
+                          correlation_type_id=None ):
+    return get_fluid_property_correlation(
+        cursor, fluid_id, quantity_id, correlation_type_id
+    ).evaluate( temperature )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Array versions of the identifier functions.  These encode whole arrays of
+# identifiers into packed keys (see sd.IDENTIFIER_FIELDS), and decode, truncate,
+# and group the keys, using NumPy operations instead of one string operation
+# per identifier.  A key of a study, series, or station has zeros in the fields
+# below its level, so truncating a point key to a level gives the key of the
+# study, series, or station that the point belongs to.
+#
+# Every function that takes identifiers also takes point keys, since those are
+# already encoded.
+
+import itertools
+import numpy as np
+
+import sheardata as sd
+
+IDENTIFIER_LENGTH = sum( digits for name, digits, bits in sd.IDENTIFIER_FIELDS )
+
+READABLE_IDENTIFIER_LENGTH = IDENTIFIER_LENGTH + len(sd.IDENTIFIER_FIELDS) - 1
+
+# Levels of the sanitized identifiers of each length, from studies to points.
+IDENTIFIER_LEVELS = {
+    length: level for level, length in enumerate(
+        itertools.accumulate(
+            digits for name, digits, bits in sd.IDENTIFIER_FIELDS
+        ),
+        start=1,
+    ) if level >= sd.IL_STUDY
+}
+
+# Converts a sequence of identifiers or point keys to an array.  A list of
+# identifiers goes straight to an array of bytes, since making a Unicode array
+# first takes longer than encoding the identifiers does.
+def identifier_array( identifiers ):
+    if ( isinstance( identifiers, np.ndarray ) ):
+        return identifiers
+    identifiers = list(identifiers)
+    if ( len(identifiers) != 0 and isinstance( identifiers[0], str ) ):
+        return np.asarray( identifiers, dtype=np.bytes_ )
+    return np.asarray( identifiers, dtype=np.int64 )
+
+# Returns the character codes of the sanitized identifiers as a two-dimensional
+# array with one row per identifier, padded with zeros after the end of each
+# identifier.  The dashes of any readable identifiers are moved to the end of
+# each row and cleared, rather than removed with a string operation.
+def identifier_characters( identifiers ):
+    identifiers = np.asarray( identifiers, dtype=np.bytes_ ).ravel()
+    width = max( identifiers.dtype.itemsize, IDENTIFIER_LENGTH )
+    characters = np.zeros( ( len(identifiers), width ), dtype=np.uint8 )
+    characters[:,:identifiers.dtype.itemsize] = identifiers.view(
+        np.uint8
+    ).reshape( len(identifiers), -1 )
+
+    dashes = ( characters == ord("-") )
+    if ( np.any( dashes ) ):
+        order = np.argsort( dashes, axis=1, kind="stable" )
+        characters = np.take_along_axis( characters, order, axis=1 )
+        characters[np.take_along_axis( dashes, order, axis=1 )] = 0
+
+    if ( np.any( characters[:,IDENTIFIER_LENGTH:] != 0 ) ):
+        raise ValueError( "identifiers must be at most {:d} characters long".format(
+            IDENTIFIER_LENGTH,
+        ) )
+    return characters[:,:IDENTIFIER_LENGTH]
+
+# The flow class is the offset of the first character from "A", and the other
+# fields are decimal numbers.  The padding after shorter identifiers counts as
+# zeros.
+def encode_characters( characters ):
+    digits = characters.astype( np.int64 )
+    digits[digits == 0] = ord("0")
+    digits -= ord("0")
+    digits[:,0] += ord("0") - ord("A")
+
+    invalid_columns = np.nonzero( np.any( digits[:,1:] > 9, axis=0 ) |
+                                  np.any( digits[:,1:] < 0, axis=0 ) )[0]
+    if ( len(invalid_columns) != 0 ):
+        raise ValueError( "invalid digit in column {:d} of an identifier".format(
+            int(invalid_columns[0]) + 1,
+        ) )
+
+    keys = np.zeros( len(characters), dtype=np.int64 )
+    offset = 0
+    for name, width, bits in sd.IDENTIFIER_FIELDS:
+        columns = digits[:,offset:offset+width]
+        fields = columns[:,0]
+        for i in range( 1, width ):
+            fields = 10 * fields + columns[:,i]
+        if ( np.any( ( fields < 0 ) | ( fields >= 2**bits ) ) ):
+            raise ValueError( "{:s} out of range for a point key".format( name ) )
+        keys = ( keys << bits ) | fields
+        offset += width
+    return keys
+
+def levels_of_characters( characters ):
+    lengths = np.count_nonzero( characters, axis=1 )
+    levels = np.zeros( len(lengths), dtype=np.int64 )
+    for length in IDENTIFIER_LEVELS:
+        levels[lengths == length] = IDENTIFIER_LEVELS[length]
+    if ( np.any( levels == 0 ) ):
+        raise ValueError( "identifiers must have one of the lengths {!r}".format(
+            sorted(IDENTIFIER_LEVELS),
+        ) )
+    return levels
+
+# Identifiers of any level may be mixed, but each one must have the length of a
+# study, series, station, or point identifier, since the padding of a shorter
+# identifier would otherwise be read as zeros.
+def encode_identifiers( identifiers ):
+    identifiers = identifier_array( identifiers )
+    if ( identifiers.dtype.kind in "iu" or identifiers.size == 0 ):
+        return identifiers.astype( np.int64 ).ravel()
+    characters = identifier_characters( identifiers )
+    levels_of_characters( characters )
+    return encode_characters( characters )
+
+# Returns a list of arrays of the fields of each key, from the flow class (as
+# the offset of its letter from "A") to the point number.
+def split_keys( keys ):
+    keys = encode_identifiers( keys )
+    fields = []
+    for name, digits, bits in reversed(sd.IDENTIFIER_FIELDS):
+        fields.append( keys & ( 2**bits - 1 ) )
+        keys = keys >> bits
+    fields.reverse()
+    return fields
+
+def truncate_keys( keys, level ):
+    keys = encode_identifiers( keys )
+    bits_below_level = sum(
+        bits for name, digits, bits in sd.IDENTIFIER_FIELDS[level:]
+    )
+    return ( keys >> bits_below_level ) << bits_below_level
+
+def decode_keys( keys, level=sd.IL_POINT, readable=False ):
+    fields = split_keys( keys )
+    width = sum( digits for name, digits, bits in sd.IDENTIFIER_FIELDS[:level] )
+    if ( readable ):
+        width += level - 1
+
+    characters = np.zeros( ( len(fields[0]), width ), dtype=np.uint8 )
+    characters[:,0] = fields[0] + ord("A")
+    column = 1
+    for field, ( name, digits, bits ) in zip( fields[1:level],
+                                              sd.IDENTIFIER_FIELDS[1:level] ):
+        if ( readable ):
+            characters[:,column] = ord("-")
+            column += 1
+        for i in range( digits-1, -1, -1 ):
+            characters[:,column+i] = field % 10 + ord("0")
+            field = field // 10
+        column += digits
+    return characters.view( "S{:d}".format( width ) ).ravel().astype( np.str_ )
+
+# Returns the level of each identifier, or IL_POINT for point keys.
+def identifier_levels( identifiers ):
+    identifiers = identifier_array( identifiers )
+    if ( identifiers.dtype.kind in "iu" or identifiers.size == 0 ):
+        return np.full( identifiers.size, sd.IL_POINT )
+    return levels_of_characters( identifier_characters( identifiers ) )
+
+def truncate_identifiers( identifiers, level ):
+    return decode_keys( truncate_keys( identifiers, level ), level )
+
+def make_readable_identifiers( identifiers ):
+    identifiers = identifier_array( identifiers )
+    if ( identifiers.dtype.kind in "iu" or identifiers.size == 0 ):
+        return decode_keys( identifiers, readable=True )
+
+    characters = identifier_characters( identifiers )
+    keys   = encode_characters( characters )
+    levels = levels_of_characters( characters )
+    readable_identifiers = np.zeros( len(keys), dtype="U{:d}".format(
+        READABLE_IDENTIFIER_LENGTH,
+    ) )
+    for level in np.unique( levels ):
+        at_level = ( levels == level )
+        readable_identifiers[at_level] = decode_keys(
+            keys[at_level],
+            int(level),
+            readable=True,
+        )
+    return readable_identifiers
+
+# Returns a dictionary of the number of identifiers that belong to each
+# identifier at the given level.
+def count_identifiers( identifiers, level ):
+    keys, counts = np.unique(
+        truncate_keys( identifiers, level ),
+        return_counts=True,
+    )
+    return dict( zip(
+        decode_keys( keys, level ).tolist(),
+        counts.tolist(),
+    ) )
+
+def count_studies( identifiers ):
+    return count_identifiers( identifiers, sd.IL_STUDY )
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Batched numerical integration of profiles with uncertainty propagation.
+#
+# The abscissas x and integrands f of many profiles (one per station, say) are
+# concatenated into single arrays, and an offsets array marks where each
+# profile (segment) begins and ends, so that segment s is
+#
+#     x[offsets[s]:offsets[s+1]]
+#
+# Each segment is integrated separately.  x and f may be SDArrays or exact
+# arrays.
+#
+# Every rule here is written as a sum of the integrals c_j over each interval
+# [x_j, x_{j+1}], and each c_j depends on at most the four points j-1 through
+# j+2.  Each rule returns c_j along with its derivatives
+#
+#     G[j,m] = d c_j / d f_{j+m-1}
+#     X[j,m] = d c_j / d x_{j+m-1}
+#
+# for m = 0 to 3, which are found analytically in one pass.  The uncertainties
+# are propagated to first order from those derivatives, assuming that every
+# value is uncorrelated with every other.  Since the derivatives are local, all
+# of this is O(n), including the cumulative integrals.
+
+import numpy as np
+
+import sheardata as sd
+from sheardata.sdarray import SDArray, split_operand
+
+# Integration rules
+IR_TRAPEZOID_RULE   = "T"
+IR_SIMPSONS_RULE    = "S"
+IR_MONOTONE_SPLINE  = "M"
+
+# Returns b with b[i] = a[i+shift] along the first axis, and zeros where i+shift
+# falls outside of the array.
+def shifted( a, shift ):
+    b = np.zeros_like(a)
+    n = a.shape[0]
+    if ( shift >= 0 ):
+        b[:n-shift] = a[shift:]
+    else:
+        b[-shift:] = a[:n+shift]
+    return b
+
+# Whether point i+shift belongs to the same segment as point i.
+def inside_segment( local, length, shift ):
+    return ( local + shift >= 0 ) & ( local + shift < length )
+
+def split_values( values ):
+    values, uncertainties = split_operand( values )
+    return np.asarray( values, dtype=np.float64 ), \
+           np.broadcast_to( uncertainties, np.shape(values) ).astype(np.float64)
+
+# Trapezoid rule: each interval contributes c_j = h_j ( f_j + f_{j+1} ) / 2.
+def trapezoid_rule_intervals( h, f, has_next, local, length ):
+    n = len(f)
+    mean = np.where( has_next, 0.5 * ( f + shifted( f, 1 ) ), 0.0 )
+    c = h * mean
+    G = np.zeros( ( n, 4 ) )
+    X = np.zeros( ( n, 4 ) )
+    G[:,1] = np.where( has_next, 0.5 * h, 0.0 )
+    G[:,2] = G[:,1]
+    X[:,1] = -mean
+    X[:,2] =  mean
+    return c, G, X
+
+# Simpson's rule: each interval contributes the integral of the parabola
+# through three neighboring points.  Pairs of intervals share a parabola, so
+# that the total is the composite Simpson's rule when a segment has an even
+# number of intervals.  The last interval of a segment with an odd number of
+# intervals uses the parabola through its two points and the point before
+# them.  Segments with only one interval use the trapezoid rule.
+#
+# For an interval of width a next to an interval of width b on the same
+# parabola, with H = a + b, the weights of the interval's outer point, its
+# point shared with the other interval, and the far point of the other
+# interval are
+#
+#     a / 2 - a^2 / ( 6 H )
+#     a / 2 + a^2 / ( 6 b )
+#     -a^3 / ( 6 b H )
+def simpsons_rule_intervals( h, f, has_next, local, length ):
+    c, G, X = trapezoid_rule_intervals( h, f, has_next, local, length )
+
+    forward  = has_next & ( local % 2 == 0 ) & ( local + 2 <= length - 1 )
+    backward = has_next & ( local >= 1 ) & ~forward
+    one = np.ones_like(h)
+
+    for parabola, neighbor, outer, shared, far in [
+        ( forward,  1, 1, 2, 3 ),
+        ( backward, -1, 2, 1, 0 ),
+    ]:
+        a = np.where( parabola, h,                      one )
+        b = np.where( parabola, shifted( h, neighbor ), one )
+        H = a + b
+        f_outer  = shifted( f, outer  - 1 )
+        f_shared = shifted( f, shared - 1 )
+        f_far    = shifted( f, far    - 1 )
+
+        G[:,outer]  = np.where( parabola, 0.5 * a - a**2 / ( 6.0 * H ), G[:,outer]  )
+        G[:,shared] = np.where( parabola, 0.5 * a + a**2 / ( 6.0 * b ), G[:,shared] )
+        G[:,far]    = np.where( parabola, -a**3 / ( 6.0 * b * H ),     G[:,far]    )
+
+        dc_da = f_outer  * ( 0.5 - a * ( a + 2.0 * b ) / ( 6.0 * H**2 ) ) \
+              + f_shared * ( 0.5 + a / ( 3.0 * b ) ) \
+              - f_far    * a**2 * ( 2.0 * a + 3.0 * b ) / ( 6.0 * b * H**2 )
+        dc_db = f_outer  * a**2 / ( 6.0 * H**2 ) \
+              - f_shared * a**2 / ( 6.0 * b**2 ) \
+              + f_far    * a**3 * ( a + 2.0 * b ) / ( 6.0 * b**2 * H**2 )
+
+        # a runs from the outer point to the shared point, and b runs from the
+        # shared point to the far point.
+        s = neighbor
+        X[:,outer]  = np.where( parabola, -s * dc_da,                X[:,outer]  )
+        X[:,shared] = np.where( parabola,  s * dc_da - s * dc_db,    X[:,shared] )
+        X[:,far]    = np.where( parabola,  s * dc_db,                X[:,far]    )
+
+    c = np.zeros_like(f)
+    for m in range(4):
+        c += np.where( inside_segment( local, length, m - 1 ),
+                       G[:,m] * shifted( f, m - 1 ), 0.0 )
+    return c, G, X
+
+# Slopes of the monotone piecewise cubic Hermite interpolant (Fritsch and
+# Carlson), using the weighted harmonic mean at interior points and the
+# shape-preserving three-point formula at the ends, as in SciPy's
+# PchipInterpolator.  Returns the slopes d and their derivatives D[i,m] and
+# E[i,m] with respect to f_{i+m-2} and x_{i+m-2}.
+def monotone_spline_slopes( h, f, has_next, local, length ):
+    n = len(f)
+    one = np.ones_like(h)
+    h_safe = np.where( has_next, h, one )
+    delta = np.where( has_next, ( shifted( f, 1 ) - f ) / h_safe, 0.0 )
+
+    d = np.zeros(n)
+    D = np.zeros( ( n, 5 ) )
+    E = np.zeros( ( n, 5 ) )
+
+    # Interior points, where ha and delta_a belong to the interval before the
+    # point and hb and delta_b to the interval after it.  The slope is zero
+    # unless delta_a and delta_b have the same sign.
+    interior = ( local > 0 ) & ( local < length - 1 )
+    ha = np.where( interior, shifted( h_safe, -1 ), one )
+    hb = np.where( interior, h_safe,               one )
+    da = np.where( interior, shifted( delta, -1 ), 0.0 )
+    db = np.where( interior, delta,               0.0 )
+    w1 = 2.0 * hb + ha
+    w2 = hb + 2.0 * ha
+    same_sign = interior & ( da * db > 0.0 )
+    denominator = np.where( same_sign, w1 * db + w2 * da, 1.0 )
+    d = np.where( same_sign, ( w1 + w2 ) * da * db / denominator, d )
+
+    # Partial derivatives with respect to delta_a and delta_b, and then the
+    # total derivatives with respect to ha and hb, since delta_a = ( f_i -
+    # f_{i-1} ) / ha and delta_b = ( f_{i+1} - f_i ) / hb.
+    A = np.where( same_sign, ( w1 + w2 ) * w1 * db**2 / denominator**2, 0.0 )
+    B = np.where( same_sign, ( w1 + w2 ) * w2 * da**2 / denominator**2, 0.0 )
+    dd_dha = np.where( same_sign,
+                       3.0 * hb * da * db * ( db - da ) / denominator**2, 0.0 ) \
+           - A * da / ha
+    dd_dhb = np.where( same_sign,
+                       3.0 * ha * da * db * ( da - db ) / denominator**2, 0.0 ) \
+           - B * db / hb
+
+    D[:,1] = np.where( interior, -A / ha,          D[:,1] )
+    D[:,2] = np.where( interior,  A / ha - B / hb, D[:,2] )
+    D[:,3] = np.where( interior,  B / hb,          D[:,3] )
+    E[:,1] = np.where( interior, -dd_dha,          E[:,1] )
+    E[:,2] = np.where( interior,  dd_dha - dd_dhb, E[:,2] )
+    E[:,3] = np.where( interior,  dd_dhb,          E[:,3] )
+
+    # End points, where h0 and delta0 belong to the interval at the end and h1
+    # and delta1 to the one next to it.  Segments with only two points are
+    # linear.  The direction s points into the segment.
+    for end, s in [ ( ( local == 0 ),          1 ),
+                    ( ( local == length - 1 ), -1 ), ]:
+        long_end  = end & ( length >= 3 )
+        short_end = end & ( length == 2 )
+        if ( s == 1 ):
+            h0, h1         = h_safe, shifted( h_safe, 1 )
+            delta0, delta1 = delta, shifted( delta, 1 )
+        else:
+            h0, h1         = shifted( h_safe, -1 ), shifted( h_safe, -2 )
+            delta0, delta1 = shifted( delta, -1 ), shifted( delta, -2 )
+        h0 = np.where( long_end | short_end, h0, one )
+        h1 = np.where( long_end, h1, one )
+        H  = h0 + h1
+
+        d_end = ( ( 2.0 * h0 + h1 ) * delta0 - h0 * delta1 ) / H
+        P = ( 2.0 * h0 + h1 ) / H
+        Q = -h0 / H
+        dd_dh0 = h1 * ( delta0 - delta1 ) / H**2
+        dd_dh1 = h0 * ( delta1 - delta0 ) / H**2
+
+        flat    = np.sign(d_end) != np.sign(delta0)
+        limited = ~flat & ( np.sign(delta0) != np.sign(delta1) ) \
+                        & ( np.abs(d_end) > 3.0 * np.abs(delta0) )
+        d_end  = np.where( flat, 0.0, np.where( limited, 3.0 * delta0, d_end ) )
+        P      = np.where( flat, 0.0, np.where( limited, 3.0,          P     ) )
+        Q      = np.where( flat | limited, 0.0, Q      )
+        dd_dh0 = np.where( flat | limited, 0.0, dd_dh0 ) - P * delta0 / h0
+        dd_dh1 = np.where( flat | limited, 0.0, dd_dh1 ) - Q * delta1 / h1
+
+        d = np.where( long_end,  d_end,  d )
+        d = np.where( short_end, delta0, d )
+
+        # h0 runs from the end point inwards, and h1 continues from there.
+        D[:,2]     = np.where( long_end,  -s * P / h0,              D[:,2]     )
+        D[:,2+s]   = np.where( long_end,   s * P / h0 - s * Q / h1, D[:,2+s]   )
+        D[:,2+2*s] = np.where( long_end,   s * Q / h1,              D[:,2+2*s] )
+        E[:,2]     = np.where( long_end,  -s * dd_dh0,              E[:,2]     )
+        E[:,2+s]   = np.where( long_end,   s * dd_dh0 - s * dd_dh1, E[:,2+s]   )
+        E[:,2+2*s] = np.where( long_end,   s * dd_dh1,              E[:,2+2*s] )
+
+        D[:,2]     = np.where( short_end, -s / h0,                  D[:,2]     )
+        D[:,2+s]   = np.where( short_end,  s / h0,                  D[:,2+s]   )
+        E[:,2]     = np.where( short_end,  s * delta0 / h0,         E[:,2]     )
+        E[:,2+s]   = np.where( short_end, -s * delta0 / h0,         E[:,2+s]   )
+
+    return d, D, E
+
+# Monotone spline: each interval contributes the integral of the cubic Hermite
+# interpolant,
+#
+#     c_j = h_j ( f_j + f_{j+1} ) / 2 + h_j^2 ( d_j - d_{j+1} ) / 12,
+#
+# where d_j are the slopes from monotone_spline_slopes.
+def monotone_spline_intervals( h, f, has_next, local, length ):
+    c, G, X = trapezoid_rule_intervals( h, f, has_next, local, length )
+    d, D, E = monotone_spline_slopes( h, f, has_next, local, length )
+
+    k = np.where( has_next, h**2 / 12.0, 0.0 )
+    difference = np.where( has_next, d - shifted( d, 1 ), 0.0 )
+    c += k * difference
+    X[:,1] -= h * difference / 6.0
+    X[:,2] += h * difference / 6.0
+
+    D_next = shifted( D, 1 )
+    E_next = shifted( E, 1 )
+    for m in range(4):
+        G[:,m] += k * ( D[:,m+1] - D_next[:,m] )
+        X[:,m] += k * ( E[:,m+1] - E_next[:,m] )
+    return c, G, X
+
+INTEGRATION_RULES = {
+    IR_TRAPEZOID_RULE:  trapezoid_rule_intervals,
+    IR_SIMPSONS_RULE:   simpsons_rule_intervals,
+    IR_MONOTONE_SPLINE: monotone_spline_intervals,
+}
+
+# Returns the derivatives of the cumulative integrals C_k with respect to the
+# values at points k-1, k, and k+1, given the derivatives of the intervals.
+# Those are the only points whose derivatives are partial, since the intervals
+# that contribute to them are not all before k.  Every point i <= k-2 already
+# has its full derivative (see point_derivatives).
+def partial_derivatives( G ):
+    G_prev  = shifted( G, -1 )
+    G_prev2 = shifted( G, -2 )
+    G_prev3 = shifted( G, -3 )
+    return [
+        ( -1, G_prev3[:,3] + G_prev2[:,2] + G_prev[:,1] ),
+        (  0, G_prev2[:,3] + G_prev[:,2] ),
+        (  1, G_prev[:,3] ),
+    ]
+
+def point_derivatives( G ):
+    return shifted( G[:,0], 1 ) + G[:,1] + shifted( G[:,2], -1 ) + shifted( G[:,3], -2 )
+
+# Returns the sums of values[start:k] for every point k, where start is the
+# beginning of the segment of point k.  Each segment is summed on its own, so
+# that neither a NaN nor a large value in one segment changes the sums of any
+# other.
+def segment_sums( values, offsets ):
+    sums = np.zeros_like(values)
+    for start, end in zip( offsets[:-1], offsets[1:] ):
+        if ( end - start > 1 ):
+            np.cumsum( values[start:end-1], out=sums[start+1:end] )
+    return sums
+
+# Integrates f over x for every segment.  Returns an SDArray with one integral
+# per segment, or with the cumulative integral at every point (starting from
+# zero at the beginning of each segment) when cumulative is true.  Without
+# offsets, x and f form a single segment and the integral is returned as an
+# sdfloat.
+def integrate( x, f, offsets=None, rule=IR_TRAPEZOID_RULE, cumulative=False ):
+    x, s_x = split_values( x )
+    f, s_f = split_values( f )
+    n = len(x)
+    assert( len(f) == n )
+
+    single_segment = offsets is None
+    if ( single_segment ):
+        offsets = [ 0, n ]
+    offsets = np.asarray( offsets, dtype=np.intp )
+    assert( offsets[0] == 0 and offsets[-1] == n )
+    assert( np.all( np.diff(offsets) >= 0 ) )
+
+    lengths = np.diff(offsets)
+    segment = np.repeat( np.arange(len(lengths)), lengths )
+    start   = offsets[segment]
+    length  = lengths[segment]
+    local   = np.arange(n) - start
+
+    has_next = local < length - 1
+    h = np.where( has_next, shifted( x, 1 ) - x, 0.0 )
+
+    c, G, X = INTEGRATION_RULES[rule]( h, f, has_next, local, length )
+
+    # Drop the derivatives with respect to points in other segments, which are
+    # zero, but which may be NaN when they were found from NaN values there.
+    for m in range(4):
+        inside = inside_segment( local, length, m - 1 )
+        G[:,m] = np.where( inside, G[:,m], 0.0 )
+        X[:,m] = np.where( inside, X[:,m], 0.0 )
+
+    # Cumulative integrals C_k, the sums of c_j over the intervals j < k.
+    C = segment_sums( c, offsets )
+
+    # Variances of C_k, summing the full contributions of points i <= k-2 with
+    # a running sum, and adding the partial contributions of the rest.
+    full = ( point_derivatives(G) * s_f )**2 + ( point_derivatives(X) * s_x )**2
+    variance = segment_sums( full, offsets )[np.maximum( np.arange(n) - 1, start )]
+
+    for ( i, G_i ), ( _, X_i ) in zip( partial_derivatives(G),
+                                       partial_derivatives(X) ):
+        inside = ( local + i >= 0 ) & ( local + i < length ) & ( local > 0 )
+        variance += np.where(
+            inside,
+            ( G_i * shifted( s_f, i ) )**2 + ( X_i * shifted( s_x, i ) )**2,
+            0.0
+        )
+
+    if ( cumulative ):
+        return SDArray( C, np.sqrt(variance) )
+
+    # Empty segments integrate to zero.
+    last = offsets[1:] - 1
+    nonempty = lengths > 0
+    integrals     = np.zeros(len(lengths))
+    uncertainties = np.zeros(len(lengths))
+    integrals[nonempty]     = C[last[nonempty]]
+    uncertainties[nonempty] = np.sqrt(variance[last[nonempty]])
+    if ( single_segment ):
+        return sd.sdfloat( integrals[0], uncertainties[0] )
+    return SDArray( integrals, uncertainties )
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Profiles of point quantities along a station.  load_station_profile returns a
+# NumPy structured array with one row per point of the station, in order of
+# point number, and with the value, uncertainty, and outlier flag of every
+# requested quantity as columns.  Each point quantity is stored in its own
+# table (see sd.POINT_QUANTITY_TABLES), and each table is read with one query
+# over the range of point keys of the station, which is a range of its primary
+# key.
+#
+# A point without a value of a quantity gets NaN as its value, and an unknown
+# uncertainty is NaN as well, as in SDArray.
+#
+# The profiles are kept in a cache for every connection, holding the
+# PROFILE_CACHE_SIZE most recently used profiles.  The cache is cleared
+# whenever the database changes, either through this connection or through any
+# other, so a profile is never out of date.  The cached arrays are read-only;
+# copy one before changing it.
+
+import collections
+import numpy as np
+
+import sheardata as sd
+
+PROFILE_CACHE_SIZE = 256
+
+POINT_NUMBER_BITS = sd.IDENTIFIER_FIELDS[-1][2]
+
+def profile_dtype( quantities ):
+    dtype = [
+        ( "point_key",    np.int64 ),
+        ( "point_number", np.int64 ),
+    ]
+    for quantity in quantities:
+        dtype.append( ( quantity,                              np.float64 ) )
+        dtype.append( ( "{:s}_uncertainty".format( quantity ), np.float64 ) )
+        dtype.append( ( "{:s}_outlier".format( quantity ),     np.bool_   ) )
+    return dtype
+
+def read_station_profile( cursor, station_id, quantities ):
+    for quantity in quantities:
+        if ( quantity not in sd.POINT_QUANTITY_TABLES ):
+            raise ValueError( "{!r} is not a point quantity".format( quantity ) )
+
+    station_id = sd.sanitize_identifier( station_id )
+    first_point_key = sd.identify_point_key(
+        station_id[0:1],
+        station_id[1:5],
+        station_id[5:8],
+        station_id[8:11],
+        station_id[11:14],
+        0,
+    )
+    last_point_key = first_point_key + 2**POINT_NUMBER_BITS - 1
+
+    cursor.execute(
+    """
+    SELECT point_key, point_number
+    FROM points
+    WHERE point_key BETWEEN ? AND ?
+    ORDER BY point_key;
+    """,
+    (
+        first_point_key,
+        last_point_key,
+    )
+    )
+    points = np.array( cursor.fetchall(), dtype=np.int64 ).reshape( -1, 2 )
+
+    profile = np.zeros( len(points), dtype=profile_dtype( quantities ) )
+    profile["point_key"]    = points[:,0]
+    profile["point_number"] = points[:,1]
+
+    for quantity in quantities:
+        table = sd.POINT_QUANTITY_TABLES[quantity]
+        station_condition = ""
+        if ( table in sd.STATION_KEYED_TABLES ):
+            station_condition = "station_id=:station_id AND"
+
+        cursor.execute(
+        """
+        SELECT point_key, value, uncertainty, outlier
+        FROM {:s}
+        WHERE {:s} point_key BETWEEN :first_point_key AND :last_point_key
+        ORDER BY point_key;
+        """.format( table, station_condition ),
+        {
+            "station_id":      station_id,
+            "first_point_key": first_point_key,
+            "last_point_key":  last_point_key,
+        }
+        )
+        values = np.array( cursor.fetchall(), dtype=[
+            ( "point_key",   np.int64   ),
+            ( "value",       np.float64 ),
+            ( "uncertainty", np.float64 ),
+            ( "outlier",     np.bool_   ),
+        ] )
+        if ( np.any( values["point_key"][1:] == values["point_key"][:-1] ) ):
+            raise ValueError(
+                "more than one {:s} for a point at station {:s}".format(
+                    quantity, station_id
+                )
+            )
+
+        rows = np.searchsorted( profile["point_key"], values["point_key"] )
+        uncertainty = "{:s}_uncertainty".format( quantity )
+        outlier     = "{:s}_outlier".format( quantity )
+
+        profile[quantity]    = np.nan
+        profile[uncertainty] = np.nan
+        profile[quantity][rows]    = values["value"]
+        profile[uncertainty][rows] = values["uncertainty"]
+        profile[outlier][rows]     = values["outlier"]
+
+    profile.flags.writeable = False
+    return profile
+
+# PRAGMA data_version changes when another connection commits a change, and
+# the total number of changes counts the changes made by this one.
+def database_version( cursor ):
+    cursor.execute( "PRAGMA data_version;" )
+    return ( int(cursor.fetchone()[0]), cursor.connection.total_changes )
+
+class ProfileCache:
+    version  = None
+    profiles = None
+
+    def __init__( self ):
+        self.profiles = collections.OrderedDict()
+
+def load_station_profile( cursor, station_id, quantities ):
+    cache = sd.get_connection_cache( cursor, "station_profiles", ProfileCache )
+    version = database_version( cursor )
+    if ( version != cache.version ):
+        cache.profiles.clear()
+        cache.version = version
+
+    key = ( sd.sanitize_identifier( station_id ), tuple(quantities) )
+    if ( key in cache.profiles ):
+        cache.profiles.move_to_end( key )
+        return cache.profiles[key]
+
+    profile = read_station_profile( cursor, station_id, quantities )
+    cache.profiles[key] = profile
+    if ( len(cache.profiles) > PROFILE_CACHE_SIZE ):
+        cache.profiles.popitem( last=False )
+    return profile
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Streaming queries.  These run a query and return its results a few rows at a
+# time, using fetchmany() instead of fetchall(), so that the memory used does
+# not grow with the number of rows.  Use them for queries that may return every
+# point in the database, and for loops that would otherwise copy the rows into
+# a list only to iterate over it once.
+#
+# Each stream runs its query on a new cursor of the same connection, so the
+# cursor passed in can still be used for other queries while iterating over the
+# stream.  The rows come from the database as the stream is iterated over, so
+# anything written to the tables during that time may or may not appear in the
+# results.
+#
+# Only the record batches need NumPy, so it is imported there, and streaming
+# plain rows does not load it (see sheardata.LAZY_ATTRIBUTES).
+
+import sheardata as sd
+
+QUERY_BATCH_SIZE = 4096
+
+# Yields lists of up to batch_size rows.
+def stream_row_batches( cursor, query, parameters=(),
+                        batch_size=QUERY_BATCH_SIZE ):
+    stream_cursor = cursor.connection.cursor()
+    try:
+        stream_cursor.execute( query, parameters )
+        while ( True ):
+            rows = stream_cursor.fetchmany( batch_size )
+            if ( len(rows) == 0 ):
+                break
+            yield rows
+    finally:
+        stream_cursor.close()
+
+def stream_rows( cursor, query, parameters=(), batch_size=QUERY_BATCH_SIZE ):
+    for rows in stream_row_batches( cursor, query, parameters, batch_size ):
+        for row in rows:
+            yield row
+
+# Yields the first column of each row.
+def stream_values( cursor, query, parameters=(), batch_size=QUERY_BATCH_SIZE ):
+    for row in stream_rows( cursor, query, parameters, batch_size ):
+        yield row[0]
+
+# Yields NumPy structured arrays of up to batch_size rows, with one field for
+# each column of the query, in order.  NULL becomes NaN in floating-point
+# fields, but there is no such value for the other types, so use COALESCE() in
+# the query for any other column that may be NULL.
+def stream_record_batches( cursor, query, dtype, parameters=(),
+                           batch_size=QUERY_BATCH_SIZE ):
+    import numpy as np
+    for rows in stream_row_batches( cursor, query, parameters, batch_size ):
+        yield np.array( rows, dtype=dtype )
+
+def stream_points_at_station( cursor, station_id ):
+    for point_id in stream_values(
+        cursor,
+        """
+        SELECT point_id
+        FROM points
+        WHERE station_id=?
+        ORDER BY point_number;
+        """,
+        (
+            sd.sanitize_identifier(station_id),
+        ),
+    ):
+        yield str(point_id)
+
+def stream_series_components( cursor, series_id ):
+    for fluid_id in stream_values(
+        cursor,
+        """
+        SELECT fluid_id
+        FROM series_components
+        WHERE series_id=?;
+        """,
+        (
+            series_id,
+        ),
+    ):
+        yield str(fluid_id)
+
+# Points are identified by their point keys, which give the keys of their
+# stations through truncate_keys( point_keys, IL_STATION ).  An unlabeled point
+# has an empty label.  The types are given as strings so that defining them
+# does not import NumPy.
+POINT_RECORD_DTYPE = [
+    ( "point_key",      "i8" ),
+    ( "point_number",   "i8" ),
+    ( "point_label_id", "U1" ),
+    ( "outlier",        "?"  ),
+]
+
+def stream_point_batches( cursor, batch_size=QUERY_BATCH_SIZE ):
+    return stream_record_batches(
+        cursor,
+        """
+        SELECT point_key, point_number, COALESCE( point_label_id, '' ), outlier
+        FROM points
+        ORDER BY point_key;
+        """,
+        POINT_RECORD_DTYPE,
+        batch_size=batch_size,
+    )
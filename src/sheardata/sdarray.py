@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Array-backed uncertain values.  An SDArray stores the values and the standard
+# uncertainties of a whole profile in two contiguous NumPy arrays, instead of
+# one ufloat per element.  Arithmetic propagates the uncertainties to first
+# order, assuming that the operands are uncorrelated, which is the same
+# assumption that sdfloat makes for values read from the database.
+#
+# An unknown uncertainty is stored as NaN, as sdfloat does, so it propagates to
+# every result that depends on it.  Use from_sdfloats and to_sdfloats to
+# convert to and from lists of sdfloats at the edges of a calculation.
+
+import numpy as np
+
+import sheardata as sd
+
+class SDArray:
+    values        = None
+    uncertainties = None
+
+    # Make NumPy defer to the reflected operators below, so that an expression
+    # like numpy_array * sdarray returns an SDArray.
+    __array_ufunc__ = None
+
+    def __init__( self, values, uncertainties=sd.UNKNOWN_UNCERTAINTY ):
+        self.values = np.array( values, dtype=np.float64, ndmin=1 )
+        if ( uncertainties is sd.UNKNOWN_UNCERTAINTY ):
+            self.uncertainties = np.full( self.values.shape, np.nan )
+        else:
+            self.uncertainties = np.broadcast_to(
+                np.array( uncertainties, dtype=np.float64 ),
+                self.values.shape,
+            ).copy()
+
+    def __len__( self ):
+        return len(self.values)
+
+    def __getitem__( self, index ):
+        if ( isinstance( index, ( int, np.integer ) ) ):
+            return sd.sdfloat( self.values[index], self.uncertainties[index] )
+        return SDArray( self.values[index], self.uncertainties[index] )
+
+    def __iter__( self ):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__( self ):
+        return "SDArray({!r}, {!r})".format( self.values, self.uncertainties )
+
+    def __neg__( self ):
+        return SDArray( -self.values, self.uncertainties )
+
+    def __pos__( self ):
+        return SDArray( self.values, self.uncertainties )
+
+    def __abs__( self ):
+        return SDArray( np.abs(self.values), self.uncertainties )
+
+    # For f = a + b and f = a - b,
+    #
+    #     s_f^2 = s_a^2 + s_b^2
+    def __add__( self, other ):
+        b, s_b = split_operand( other )
+        return SDArray( self.values + b, np.hypot( self.uncertainties, s_b ) )
+
+    def __radd__( self, other ):
+        return self.__add__( other )
+
+    def __sub__( self, other ):
+        b, s_b = split_operand( other )
+        return SDArray( self.values - b, np.hypot( self.uncertainties, s_b ) )
+
+    def __rsub__( self, other ):
+        return ( -self ).__add__( other )
+
+    # For f = a * b,
+    #
+    #     s_f^2 = ( b s_a )^2 + ( a s_b )^2
+    def __mul__( self, other ):
+        b, s_b = split_operand( other )
+        a, s_a = self.values, self.uncertainties
+        return SDArray( a * b, np.hypot( b * s_a, a * s_b ) )
+
+    def __rmul__( self, other ):
+        return self.__mul__( other )
+
+    # For f = a / b,
+    #
+    #     s_f^2 = ( s_a / b )^2 + ( a s_b / b^2 )^2
+    def __truediv__( self, other ):
+        b, s_b = split_operand( other )
+        a, s_a = self.values, self.uncertainties
+        return SDArray( a / b, np.hypot( s_a / b, a * s_b / b**2 ) )
+
+    def __rtruediv__( self, other ):
+        a, s_a = split_operand( other )
+        return SDArray( a, s_a ).__truediv__( self )
+
+    # For f = a^p with an exact exponent p,
+    #
+    #     s_f = | p a^(p-1) | s_a
+    def __pow__( self, exponent ):
+        if ( isinstance( exponent, SDArray ) or hasattr( exponent, "std_dev" ) ):
+            raise TypeError( "SDArray exponents must not be uncertain" )
+        a, s_a = self.values, self.uncertainties
+        return SDArray(
+            a**exponent,
+            np.abs( exponent * a**( exponent - 1.0 ) ) * s_a,
+        )
+
+    def sqrt( self ):
+        return self**0.5
+
+    def sum( self ):
+        return sd.sdfloat(
+            np.sum(self.values),
+            np.sqrt( np.sum(self.uncertainties**2) ),
+        )
+
+    def nominal_values( self ):
+        return self.values
+
+    def std_devs( self ):
+        return self.uncertainties
+
+    def to_sdfloats( self ):
+        return [ sd.sdfloat( value, uncertainty ) for value, uncertainty in
+                 zip( self.values.tolist(), self.uncertainties.tolist() ) ]
+
+# Returns the values and uncertainties of anything that can appear on the other
+# side of an operation: another SDArray, a single sdfloat, or exact numbers
+# (floats or plain arrays), whose uncertainties are zero.
+def split_operand( other ):
+    if ( isinstance( other, SDArray ) ):
+        return other.values, other.uncertainties
+    elif ( hasattr( other, "nominal_value" ) and hasattr( other, "std_dev" ) ):
+        return other.nominal_value, other.std_dev
+    else:
+        return np.asarray( other, dtype=np.float64 ), 0.0
+
+def from_sdfloats( sdfloats ):
+    values        = np.empty( len(sdfloats) )
+    uncertainties = np.empty( len(sdfloats) )
+    for i, value in enumerate(sdfloats):
+        values[i], uncertainties[i] = split_operand( value )
+    return SDArray( values, uncertainties )
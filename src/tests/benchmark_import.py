@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Times the import of sheardata in new interpreters, with and without numpy and
+# uncertainties, which sheardata only imports on first use.  Run it from the
+# src directory:
+#
+#     python3 tests/benchmark_import.py [number_of_runs]
+
+import os
+import subprocess
+import sys
+import time
+
+SOURCE_DIRECTORY = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+
+CASES = [
+    ( "python alone",                     "pass"                                   ),
+    ( "sheardata",                        "import sheardata"                       ),
+    ( "sheardata with identifiers",       "import sheardata as sd; sd.identify_point( 'D', 1911, 1, 1, 1, 1 )" ),
+    ( "sheardata with numpy",             "import sheardata as sd; sd.np"          ),
+    ( "sheardata with all dependencies",  "import sheardata as sd; sd.np; sd.ufloat" ),
+]
+
+def time_interpreter( code, number_of_runs ):
+    elapsed_times = []
+    for i in range(number_of_runs):
+        start_time = time.perf_counter()
+        subprocess.run( [ sys.executable, "-c", code ], cwd=SOURCE_DIRECTORY,
+                        check=True )
+        elapsed_times.append( time.perf_counter() - start_time )
+    return min(elapsed_times)
+
+def main( argv ):
+    number_of_runs = 10
+    if ( len(argv) > 1 ):
+        number_of_runs = int(argv[1])
+    for name, code in CASES:
+        print( "{:40s} {:8.3f} s".format(
+            name,
+            time_interpreter( code, number_of_runs ),
+        ) )
+
+if ( __name__ == "__main__" ):
+    main( sys.argv )
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+# Times the wall distance views and refresh_wall_distances on a synthetic
+# database of duct flow stations, each with one wall point and evenly spaced
+# points above it, all at one time and without instruments.  Run it from the
+# src directory:
+#
+#     python3 tests/benchmark_wall_distances.py [stations] [runs]
+
+import os
+import sys
+import tempfile
+import time
+
+SOURCE_DIRECTORY = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+sys.path.insert( 0, SOURCE_DIRECTORY )
+
+import sheardata as sd
+import sheardata.build
+
+POINTS_PER_STATION  = 100
+STATIONS_PER_SERIES = 100
+SERIES_PER_STUDY    = 10
+
+def add_synthetic_stations( cursor, number_of_stations ):
+    station_ids = []
+    for i in range(number_of_stations):
+        study_number   = i // ( STATIONS_PER_SERIES * SERIES_PER_STUDY ) + 1
+        series_number  = i // STATIONS_PER_SERIES % SERIES_PER_STUDY + 1
+        station_number = i % STATIONS_PER_SERIES + 1
+        if ( i % ( STATIONS_PER_SERIES * SERIES_PER_STUDY ) == 0 ):
+            sd.add_study( cursor, sd.FC_DUCT_FLOW, 2023, study_number,
+                          sd.ST_EXPERIMENT )
+        if ( i % STATIONS_PER_SERIES == 0 ):
+            series_id = sd.add_series( cursor, sd.FC_DUCT_FLOW, 2023, study_number,
+                                       series_number, 2 )
+            cursor.execute( "INSERT INTO times( series_id ) VALUES( ? );",
+                            ( series_id, ) )
+            time_id = cursor.lastrowid
+
+        station_ids.append( sd.add_station( cursor, sd.FC_DUCT_FLOW, 2023,
+                                            study_number, series_number,
+                                            station_number ) )
+        point_numbers = list( range( 1, POINTS_PER_STATION+1 ) )
+        sd.add_points( cursor, sd.FC_DUCT_FLOW, 2023, study_number, series_number,
+                       station_number, point_numbers,
+                       point_label_ids=[ sd.PL_WALL ] + [ None ] * ( POINTS_PER_STATION-1 ) )
+
+        for direction, alias in sd.COORDINATE_DIRECTIONS:
+            rows = []
+            for point_number in point_numbers:
+                value = 0.0
+                if ( direction == "transverse" ):
+                    value = 0.01 * ( point_number - 1 )
+                rows.append( (
+                    sd.identify_point_key( sd.FC_DUCT_FLOW, 2023, study_number,
+                                           series_number, station_number,
+                                           point_number ),
+                    time_id,
+                    value,
+                    0.001,
+                ) )
+            cursor.executemany(
+            """
+            INSERT INTO {:s}_coordinate( point_key, time_id, value, uncertainty )
+            VALUES( ?, ?, ?, ? );
+            """.format( direction ),
+            rows
+            )
+    return station_ids
+
+def time_function( function, number_of_runs ):
+    elapsed_times = []
+    for i in range(number_of_runs):
+        start_time = time.perf_counter()
+        function()
+        elapsed_times.append( time.perf_counter() - start_time )
+    return min(elapsed_times)
+
+def time_query( cursor, query, parameters, number_of_runs ):
+    def function():
+        cursor.execute( query, parameters )
+        cursor.fetchall()
+    return time_function( function, number_of_runs )
+
+def main( argv ):
+    number_of_stations = 2100
+    number_of_runs     = 10
+    if ( len(argv) > 1 ):
+        number_of_stations = int(argv[1])
+    if ( len(argv) > 2 ):
+        number_of_runs = int(argv[2])
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = sd.Database( os.path.join( directory, "benchmark.db" ), build_mode=True )
+        sheardata.build.run_prep_stages( db )
+        station_ids = add_synthetic_stations( db.cursor, number_of_stations )
+        sheardata.build.create_indexes( db.cursor )
+        db.commit()
+        print( "{:d} stations, {:d} points".format(
+            number_of_stations,
+            number_of_stations * POINTS_PER_STATION,
+        ) )
+
+        cursor = db.cursor
+        station_id = station_ids[len(station_ids)//2]
+        cursor.execute( "SELECT point_key FROM points WHERE station_id=? LIMIT 1 OFFSET 1;",
+                        ( station_id, ) )
+        point_key = cursor.fetchone()[0]
+        cases = [
+            ( "wall_distance, one station",
+              lambda: time_query( cursor, "SELECT * FROM wall_distance WHERE station_id=?;",
+                                  ( station_id, ), number_of_runs ) ),
+            ( "wall_distance, one point",
+              lambda: time_query( cursor, "SELECT * FROM wall_distance WHERE point_key=?;",
+                                  ( point_key, ), number_of_runs ) ),
+            ( "transverse_wall_distance, one station",
+              lambda: time_query( cursor, "SELECT * FROM transverse_wall_distance WHERE station_id=?;",
+                                  ( station_id, ), number_of_runs ) ),
+            ( "refresh_wall_distances, 20 stations",
+              lambda: time_function( lambda: sd.refresh_wall_distances( cursor, station_ids[:20] ),
+                                     number_of_runs ) ),
+            ( "refresh_wall_distances, all stations",
+              lambda: time_function( lambda: sd.refresh_wall_distances( cursor ),
+                                     max( 1, number_of_runs // 5 ) ) ),
+        ]
+        for name, function in cases:
+            print( "{:40s} {:8.3f} ms".format( name, 1000.0 * function() ) )
+        db.rollback()
+        db.close()
+
+if ( __name__ == "__main__" ):
+    main( sys.argv )
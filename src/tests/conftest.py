@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import pytest
+import shutil
+import sys
+
+SOURCE_DIRECTORY = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+sys.path.insert( 0, SOURCE_DIRECTORY )
+
+import sheardata as sd
+import sheardata.build
+
+TEST_FLOW_CLASS = sd.FC_DUCT_FLOW
+TEST_YEAR       = 2023
+
+# The build stages read their files relative to the source directory.
+@pytest.fixture
+def in_source_directory( monkeypatch ):
+    monkeypatch.chdir( SOURCE_DIRECTORY )
+
+# A database with the tables, views, and basic data, but without any studies.
+@pytest.fixture( scope="session" )
+def prepared_database( tmp_path_factory ):
+    filename = str( tmp_path_factory.mktemp( "prepared" ) / "prepared.db" )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir( SOURCE_DIRECTORY )
+        db = sd.Database( filename, build_mode=True )
+        sheardata.build.run_prep_stages( db )
+        db.close()
+    return filename
+
+@pytest.fixture
+def database( prepared_database, tmp_path ):
+    filename = str( tmp_path / "test.db" )
+    shutil.copyfile( prepared_database, filename )
+    db = sd.Database( filename )
+    yield db
+    db.close()
+
+# Adds a station (and its study and series, if needed) with one point for each
+# transverse coordinate, all at one time.  The streamwise and spanwise
+# coordinates are zero.  Returns the station ID and the point keys.
+def add_test_station( cursor, study_number, series_number, station_number,
+                      transverse_coordinates, wall_points=( 1, ),
+                      instrument_id=None, point_label_ids=None ):
+    study_id = sd.identify_study( TEST_FLOW_CLASS, TEST_YEAR, study_number )
+    cursor.execute( "SELECT COUNT(*) FROM studies WHERE study_id=?;", ( study_id, ) )
+    if ( cursor.fetchone()[0] == 0 ):
+        sd.add_study( cursor, TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                      sd.ST_EXPERIMENT )
+
+    series_id = sd.identify_series( TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                                    series_number )
+    cursor.execute( "SELECT COUNT(*) FROM series WHERE series_id=?;", ( series_id, ) )
+    if ( cursor.fetchone()[0] == 0 ):
+        sd.add_series( cursor, TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                       series_number, 2 )
+    cursor.execute( "INSERT INTO times( series_id ) VALUES( ? );", ( series_id, ) )
+    time_id = cursor.lastrowid
+
+    station_id = sd.add_station( cursor, TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                                 series_number, station_number )
+    point_numbers = list( range( 1, len(transverse_coordinates)+1 ) )
+    if ( point_label_ids == None ):
+        point_label_ids = [ sd.PL_WALL if point_number in wall_points else None
+                            for point_number in point_numbers ]
+    sd.add_points( cursor, TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                   series_number, station_number, point_numbers,
+                   point_label_ids=point_label_ids )
+
+    point_keys = [ sd.identify_point_key( TEST_FLOW_CLASS, TEST_YEAR, study_number,
+                                          series_number, station_number,
+                                          point_number )
+                   for point_number in point_numbers ]
+    for direction, alias in sd.COORDINATE_DIRECTIONS:
+        for point_key, y in zip( point_keys, transverse_coordinates ):
+            value = y if ( direction == "transverse" ) else 0.0
+            cursor.execute(
+            """
+            INSERT INTO {:s}_coordinate( point_key, time_id, instrument_id,
+                                         value, uncertainty )
+            VALUES( ?, ?, ?, ?, ? );
+            """.format( direction ),
+            (
+                point_key,
+                time_id,
+                instrument_id,
+                value,
+                0.01,
+            )
+            )
+    return station_id, point_keys
+
+@pytest.fixture
+def station_factory():
+    return add_test_station
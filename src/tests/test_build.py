@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import importlib
+import os
+import pytest
+import shutil
+import sqlite3
+import sys
+
+import sheardata as sd
+import sheardata.build
+
+# Returns the sorted rows of every table, along with the schema.  Reloading a
+# study gives its rows new keys in the tables in AUTOINCREMENT_KEYS, so these
+# keys (and every column that refers to them) can be left out.
+def dump_database( filename, without_autoincrement_keys=False ):
+    connection = sqlite3.connect( filename )
+    cursor = connection.cursor()
+    cursor.execute(
+    """
+    SELECT type, name, sql
+    FROM sqlite_master
+    WHERE name NOT LIKE 'sqlite_%'
+    ORDER BY type, name;
+    """
+    )
+    schema = cursor.fetchall()
+
+    tables = {}
+    for object_type, name, sql in schema:
+        if ( object_type == "table" ):
+            columns = []
+            cursor.execute( "PRAGMA table_info({:s});".format( name ) )
+            for result in cursor.fetchall():
+                if ( without_autoincrement_keys == False or str(result[1]) not in
+                     sheardata.build.AUTOINCREMENT_KEYS.values() ):
+                    columns.append( str(result[1]) )
+            if ( len(columns) == 0 ):
+                columns.append( "COUNT(*)" )
+            cursor.execute( "SELECT {:s} FROM {:s};".format(
+                ", ".join( columns ), name,
+            ) )
+            tables[name] = sorted( cursor.fetchall(), key=repr )
+    connection.close()
+    return schema, tables
+
+@pytest.fixture( scope="module" )
+def serial_build( tmp_path_factory ):
+    filename = str( tmp_path_factory.mktemp( "serial" ) / "serial.db" )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir( os.path.dirname( os.path.dirname( sd.__file__ ) ) )
+        sheardata.build.build( filename )
+    return filename
+
+def test_serial_build_has_every_study( serial_build, in_source_directory ):
+    stages = sheardata.build.list_proc_stages()
+    assert len(stages) != 0
+
+    schema, tables = dump_database( serial_build )
+    study_ids = sorted( row[0] for row in tables["studies"] )
+    assert study_ids == sorted( sheardata.build.study_id_of_stage( stage )
+                                for stage in stages )
+    assert len( tables["study_summary_mat"] ) == len(study_ids)
+
+def test_parallel_build_matches_serial_build( serial_build, in_source_directory,
+                                              tmp_path ):
+    filename = str( tmp_path / "parallel.db" )
+    sheardata.build.build( filename, jobs=2 )
+    assert dump_database( filename ) == dump_database( serial_build )
+
+# A proc_ stage that adds rows to every table with AUTOINCREMENT keys but the
+# facilities and models, along with rows that refer to those keys.  Each study
+# adds a different number of instruments and times, so the keys of each shard
+# overlap with the others' and have to be shifted when the shards are merged.
+KEYED_STAGE_SOURCE = """
+import sheardata as sd
+
+def main( cursor ):
+    study_number = {0:d}
+    note_ids = [ sd.add_note( cursor, "note_{0:d}.tex" ) ]
+    sd.add_study( cursor, sd.FC_DUCT_FLOW, 2023, study_number, sd.ST_EXPERIMENT,
+                  note_ids=note_ids )
+    series_id = sd.add_series( cursor, sd.FC_DUCT_FLOW, 2023, study_number, 1, 2 )
+    sd.add_station( cursor, sd.FC_DUCT_FLOW, 2023, study_number, 1, 1 )
+    sd.add_points( cursor, sd.FC_DUCT_FLOW, 2023, study_number, 1, 1, [ 1, 2 ],
+                   point_label_ids=[ sd.PL_WALL, None ],
+                   note_ids=[ note_ids, note_ids ] )
+
+    for i in range( study_number ):
+        instrument_id = sd.add_instrument( cursor, sd.IC_PITOT_STATIC_TUBE,
+                                           note_ids=note_ids )
+        cursor.execute( "INSERT INTO times( series_id, instrument_id ) VALUES( ?, ? );",
+                        ( series_id, instrument_id ) )
+        time_id = cursor.lastrowid
+        for point_number in [ 1, 2 ]:
+            point_key = sd.identify_point_key( sd.FC_DUCT_FLOW, 2023, study_number,
+                                               1, 1, point_number )
+            for direction, alias in sd.COORDINATE_DIRECTIONS:
+                value = 0.1 * ( point_number - 1 ) if ( direction == "transverse" ) else 0.0
+                cursor.execute(
+                    "INSERT INTO {{:s}}_coordinate( point_key, time_id, instrument_id, value ) "
+                    "VALUES( ?, ?, ?, ? );".format( direction ),
+                    ( point_key, time_id, instrument_id, value ),
+                )
+"""
+
+# Builds from a copy of the source directory whose only proc_ stages are the
+# keyed stages above.
+@pytest.fixture
+def keyed_stages( tmp_path, monkeypatch ):
+    source_directory = os.path.dirname( os.path.dirname( sd.__file__ ) )
+    directory = tmp_path / "src"
+    directory.mkdir()
+    for filename in os.listdir( source_directory ):
+        if ( filename.startswith( "prep_" ) ):
+            os.symlink( os.path.join( source_directory, filename ),
+                        directory / filename )
+    os.symlink( os.path.join( source_directory, sheardata.build.DATA_DIRECTORY ),
+                tmp_path / "data" )
+
+    stages = []
+    for study_number in range( 1, 4 ):
+        stage = "proc_" + sd.identify_study( sd.FC_DUCT_FLOW, 2023, study_number )
+        ( directory / "note_{:d}.tex".format( study_number ) ).write_text(
+            "Note of study {:d}.".format( study_number )
+        )
+        ( directory / ( stage+".py" ) ).write_text(
+            KEYED_STAGE_SOURCE.format( study_number )
+        )
+        stages.append( stage )
+
+    monkeypatch.chdir( directory )
+    monkeypatch.syspath_prepend( str(directory) )
+    yield stages
+    for stage in stages:
+        sys.modules.pop( stage, None )
+
+def test_parallel_build_shifts_autoincrement_keys( keyed_stages, tmp_path ):
+    assert sheardata.build.list_proc_stages() == keyed_stages
+    serial_filename   = str( tmp_path / "serial.db" )
+    parallel_filename = str( tmp_path / "parallel.db" )
+    sheardata.build.build( serial_filename )
+    sheardata.build.build( parallel_filename, jobs=3 )
+
+    schema, tables = dump_database( serial_filename )
+    assert len( tables["instruments"]      ) == 6
+    assert len( tables["instrument_notes"] ) == 6
+    assert len( tables["times"]            ) == 6
+    assert len( tables["wall_distance_mat"] ) == 12
+    assert dump_database( parallel_filename ) == ( schema, tables )
+
+@pytest.fixture
+def previous_build( serial_build, tmp_path ):
+    filename = str( tmp_path / "incremental.db" )
+    shutil.copyfile( serial_build, filename )
+    return filename
+
+def change_fingerprints( filename, statement, parameters=() ):
+    connection = sqlite3.connect( filename )
+    connection.execute( statement, parameters )
+    connection.commit()
+    connection.close()
+
+def test_incremental_build_without_changes_keeps_the_database( serial_build,
+                                                               previous_build,
+                                                               in_source_directory,
+                                                               capsys ):
+    sheardata.build.build( previous_build, incremental=True )
+    assert dump_database( previous_build ) == dump_database( serial_build )
+    assert "unchanged" in capsys.readouterr().out
+
+def test_incremental_build_reloads_changed_studies( serial_build, previous_build,
+                                                    in_source_directory,
+                                                    capsys ):
+    stage = sheardata.build.list_proc_stages()[0]
+    change_fingerprints( previous_build,
+                         "UPDATE build_fingerprints SET fingerprint='changed' "
+                         "WHERE stage_name=?;", ( stage, ) )
+    sheardata.build.build( previous_build, incremental=True )
+    output = capsys.readouterr().out
+    assert "{:40s} unchanged".format( stage ) not in output
+    assert dump_database( previous_build, without_autoincrement_keys=True ) == \
+           dump_database( serial_build,   without_autoincrement_keys=True )
+
+def test_incremental_build_removes_studies_without_stages( serial_build,
+                                                           previous_build,
+                                                           in_source_directory,
+                                                           station_factory ):
+    db = sd.Database( previous_build )
+    station_factory( db.cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    sd.refresh_wall_distances( db.cursor )
+    sd.refresh_study_summaries( db.cursor )
+    sheardata.build.record_fingerprint(
+        db.cursor,
+        "proc_" + sd.identify_study( "D", 2023, 1 ),
+        "removed",
+    )
+    db.commit()
+    db.close()
+
+    sheardata.build.build( previous_build, incremental=True )
+    assert dump_database( previous_build, without_autoincrement_keys=True ) == \
+           dump_database( serial_build,   without_autoincrement_keys=True )
+
+def test_changed_prep_stages_rebuild_everything( serial_build, previous_build,
+                                                 in_source_directory ):
+    change_fingerprints( previous_build,
+                         "UPDATE build_fingerprints SET fingerprint='changed' "
+                         "WHERE stage_name=?;",
+                         ( sheardata.build.PREP_STAGE_NAME, ) )
+    sheardata.build.build( previous_build, incremental=True )
+    assert dump_database( previous_build ) == dump_database( serial_build )
+
+def test_merge_rejects_shards_that_change_the_template( in_source_directory,
+                                                        tmp_path ):
+    template_filename = str( tmp_path / "template.db" )
+    db = sd.Database( template_filename, build_mode=True )
+    sheardata.build.run_prep_stages( db )
+    db.close()
+
+    shard_filename = str( tmp_path / "proc_D2023001.db" )
+    shutil.copyfile( template_filename, shard_filename )
+    db = sd.Database( shard_filename )
+    db.cursor.execute( "UPDATE point_labels SET point_label_name='changed' "
+                       "WHERE point_label_id=?;", ( sd.PL_WALL, ) )
+    db.commit()
+    db.close()
+
+    with pytest.raises( sqlite3.IntegrityError,
+                        match="proc_D2023001.db changed or deleted 1 rows of point_labels" ):
+        sheardata.build.merge_shards( str( tmp_path / "merged.db" ),
+                                      template_filename, [ shard_filename ] )
+
+def test_main_builds_only_the_given_stages( in_source_directory, tmp_path ):
+    stages = sheardata.build.list_proc_stages()[:2]
+    filename = str( tmp_path / "partial.db" )
+    sheardata.build.main( [ filename ] + [ stage+".py" for stage in stages ] )
+    schema, tables = dump_database( filename )
+    assert sorted( row[0] for row in tables["studies"] ) == \
+           sorted( sheardata.build.study_id_of_stage( stage ) for stage in stages )
+    assert sorted( row[0] for row in tables["build_fingerprints"] ) == \
+           sorted( stages + [ sheardata.build.PREP_STAGE_NAME ] )
+
+def test_refresh_rebuilds_the_materialized_tables( serial_build, previous_build,
+                                                   in_source_directory ):
+    change_fingerprints( previous_build, "DELETE FROM study_summary_mat;" )
+    sheardata.build.main( [ "--refresh", previous_build ] )
+    assert dump_database( previous_build ) == dump_database( serial_build )
+
+def test_failed_stages_roll_back_and_stop_the_build( in_source_directory,
+                                                     tmp_path, monkeypatch ):
+    stage = sheardata.build.list_proc_stages()[0]
+    module = importlib.import_module( stage )
+
+    def failing_main( cursor ):
+        sd.add_study( cursor, "D", 2023, 1, sd.ST_EXPERIMENT )
+        raise RuntimeError( "failed" )
+
+    monkeypatch.setattr( module, "main", failing_main )
+    filename = str( tmp_path / "failed.db" )
+    with pytest.raises( RuntimeError ):
+        sheardata.build.build( filename, [ stage ] )
+    schema, tables = dump_database( filename )
+    assert tables["studies"] == []
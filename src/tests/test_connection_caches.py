@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import collections
+import gc
+import pytest
+import sqlite3
+import weakref
+
+import sheardata as sd
+
+def nitrogen_molar_mass( cursor ):
+    return sd.calculate_molar_mass_of_component(
+        cursor,
+        sd.F_GASEOUS_DIATOMIC_NITROGEN,
+    ).n
+
+def test_molar_masses_are_cached( database ):
+    cursor = database.cursor
+    assert nitrogen_molar_mass( cursor ) == pytest.approx( 28.0134e-3, rel=1.0e-4 )
+    assert sd.get_chemistry( cursor ) is sd.get_chemistry( cursor )
+
+def test_caches_see_changes_to_their_tables( database ):
+    cursor = database.cursor
+    chemistry = sd.get_chemistry( cursor )
+    molar_mass = nitrogen_molar_mass( cursor )
+
+    # Changes to other tables keep the cache.
+    sd.add_study( cursor, sd.FC_DUCT_FLOW, 2023, 1, sd.ST_EXPERIMENT )
+    assert sd.get_chemistry( cursor ) is chemistry
+
+    cursor.execute(
+    """
+    UPDATE elements
+    SET conventional_atomic_weight = 2.0 * conventional_atomic_weight
+    WHERE element_symbol='N';
+    """
+    )
+    assert sd.get_chemistry( cursor ) is not chemistry
+    assert nitrogen_molar_mass( cursor ) == pytest.approx( 2.0 * molar_mass )
+
+# Changes from other connections are only seen after invalidating the caches,
+# since checking for them would take a query on every lookup.
+def test_caches_see_changes_from_other_connections_once_invalidated( database ):
+    cursor = database.cursor
+    molar_mass = nitrogen_molar_mass( cursor )
+
+    other = sd.Database( database.filename )
+    other.cursor.execute(
+    """
+    UPDATE elements
+    SET conventional_atomic_weight = 3.0 * conventional_atomic_weight
+    WHERE element_symbol='N';
+    """
+    )
+    other.commit()
+    other.close()
+
+    assert nitrogen_molar_mass( cursor ) == molar_mass
+    sd.invalidate_connection_caches( cursor )
+    assert nitrogen_molar_mass( cursor ) == pytest.approx( 3.0 * molar_mass )
+
+def count_statements( connection, function ):
+    statements = []
+    connection.set_trace_callback( statements.append )
+    try:
+        function()
+    finally:
+        connection.set_trace_callback( None )
+    return statements
+
+def test_cached_lookups_run_no_queries( database ):
+    cursor = database.cursor
+    fractions = sd.dry_air_amount_fractions()
+    sd.calculate_specific_gas_constant_from_amount_fractions( cursor, fractions )
+    sd.evaluate_fluid_property( cursor, sd.F_LIQUID_WATER, sd.Q_MASS_DENSITY, 300.0 )
+
+    def lookups():
+        for i in range(10):
+            nitrogen_molar_mass( cursor )
+            sd.calculate_specific_gas_constant_from_amount_fractions( cursor, fractions )
+            sd.evaluate_fluid_property( cursor, sd.F_LIQUID_WATER,
+                                        sd.Q_MASS_DENSITY, 300.0 )
+
+    assert count_statements( database.connection, lookups ) == []
+
+    # A write to another table reads the versions once, and keeps the caches.
+    chemistry = sd.get_chemistry( cursor )
+    sd.add_study( cursor, sd.FC_DUCT_FLOW, 2023, 1, sd.ST_EXPERIMENT )
+    assert len( count_statements( database.connection, lookups ) ) == 2
+    assert sd.get_chemistry( cursor ) is chemistry
+
+def test_fluid_property_tables_see_new_values( database ):
+    cursor = database.cursor
+    fluid_id    = sd.F_LIQUID_WATER
+    quantity_id = sd.Q_MASS_DENSITY
+    before = sd.evaluate_fluid_property( cursor, fluid_id, quantity_id, 300.0 ).n
+
+    cursor.execute(
+    """
+    UPDATE fluid_property_values
+    SET fluid_property_value = 2.0 * fluid_property_value
+    WHERE fluid_id=? AND quantity_id=?;
+    """,
+    (
+        fluid_id,
+        quantity_id,
+    )
+    )
+    after = sd.evaluate_fluid_property( cursor, fluid_id, quantity_id, 300.0 ).n
+    assert after == pytest.approx( 2.0 * before )
+
+def test_caches_are_dropped_with_their_connections( prepared_database ):
+    connection = sqlite3.connect( prepared_database, factory=sd.Connection )
+    sd.get_chemistry( connection.cursor() )
+    assert connection in sd.connection_caches
+
+    reference = weakref.ref( connection )
+    connection.close()
+    del connection
+    gc.collect()
+    assert reference() is None
+
+def test_caches_are_kept_for_plain_connections( prepared_database ):
+    connection = sqlite3.connect( prepared_database )
+    cursor = connection.cursor()
+    chemistry = sd.get_chemistry( cursor )
+    assert sd.get_chemistry( connection.cursor() ) is chemistry
+    assert nitrogen_molar_mass( cursor ) == pytest.approx( 28.0134e-3, rel=1.0e-4 )
+    assert count_statements( connection,
+                             lambda: nitrogen_molar_mass( cursor ) ) == []
+
+    cursor.execute( "UPDATE elements SET conventional_atomic_weight = "
+                    "2.0 * conventional_atomic_weight WHERE element_symbol='N';" )
+    assert sd.get_chemistry( cursor ) is not chemistry
+    sd.drop_connection_caches( connection )
+    assert id(connection) not in sd.plain_connection_caches
+    connection.close()
+
+def test_plain_connections_are_released( prepared_database, monkeypatch ):
+    monkeypatch.setattr( sd, "PLAIN_CONNECTION_CACHE_LIMIT", 2 )
+    monkeypatch.setattr( sd, "plain_connection_caches",
+                         collections.OrderedDict() )
+
+    closed = sqlite3.connect( prepared_database )
+    sd.get_chemistry( closed.cursor() )
+    closed.close()
+
+    connections = [ sqlite3.connect( prepared_database ) for i in range(3) ]
+    sd.get_chemistry( connections[0].cursor() )
+    assert list( sd.plain_connection_caches ) == [ id(connections[0]) ]
+    for connection in connections[1:]:
+        sd.get_chemistry( connection.cursor() )
+    assert list( sd.plain_connection_caches ) == [ id(connection) for connection
+                                                   in connections[1:] ]
+    for connection in connections:
+        connection.close()
+
+def test_closing_a_database_drops_its_caches( prepared_database ):
+    db = sd.Database( prepared_database )
+    sd.get_chemistry( db.cursor )
+    connection = db.connection
+    assert connection in sd.connection_caches
+    db.close()
+    assert connection not in sd.connection_caches
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+from sheardata.fluid_properties import *
+
+REFERENCE_TEMPERATURE = 273.15
+
+TEMPERATURES = np.linspace( 250.0, 400.0, 16 )
+
+EXACT_COEFFICIENTS = [
+    ( sd.CT_SUTHERLAND_LAW,         None, [ 1.716e-5, 110.4 ]         ),
+    ( sd.CT_POWER_LAW,              None, [ 1.716e-5, 0.7 ]           ),
+    ( sd.CT_POLYNOMIAL,             2,    [ 1000.0, -5.0, -80.0 ]     ),
+    ( sd.CT_EXPONENTIAL_POLYNOMIAL, 2,    [ np.log(1.8e-3), -6.0, 9.0 ] ),
+]
+
+@pytest.mark.parametrize( "correlation_type_id, degree, coefficients",
+                          EXACT_COEFFICIENTS )
+def test_fits_recover_exact_coefficients( correlation_type_id, degree,
+                                          coefficients ):
+    values, slopes = CORRELATION_FUNCTIONS[correlation_type_id](
+        np.array(coefficients), REFERENCE_TEMPERATURE, TEMPERATURES,
+    )
+    c, relative_uncertainty = fit_fluid_property_correlation(
+        correlation_type_id, TEMPERATURES, values,
+        np.full( len(values), np.nan ), REFERENCE_TEMPERATURE, degree,
+    )
+    assert c == pytest.approx( coefficients, rel=1.0e-8 )
+    assert relative_uncertainty < 1.0e-10
+
+@pytest.mark.parametrize( "correlation_type_id, degree, coefficients",
+                          EXACT_COEFFICIENTS )
+def test_slopes_are_the_derivatives( correlation_type_id, degree, coefficients ):
+    function = CORRELATION_FUNCTIONS[correlation_type_id]
+    c = np.array(coefficients)
+    h = 1.0e-3
+    values, slopes = function( c, REFERENCE_TEMPERATURE, TEMPERATURES )
+    above, _ = function( c, REFERENCE_TEMPERATURE, TEMPERATURES + h )
+    below, _ = function( c, REFERENCE_TEMPERATURE, TEMPERATURES - h )
+    assert slopes == pytest.approx( ( above - below ) / ( 2.0 * h ), rel=1.0e-6 )
+
+def test_fit_uncertainty_includes_the_tabulated_uncertainties():
+    values, slopes = sutherland_law( np.array( [ 1.716e-5, 110.4 ] ),
+                                     REFERENCE_TEMPERATURE, TEMPERATURES )
+    c, relative_uncertainty = fit_fluid_property_correlation(
+        sd.CT_SUTHERLAND_LAW, TEMPERATURES, values, 0.02 * values,
+        REFERENCE_TEMPERATURE,
+    )
+    assert relative_uncertainty == pytest.approx( 0.02, rel=1.0e-6 )
+
+    noise = 1.0 + 0.01 * np.where( np.arange(len(values)) % 2 == 0, 1.0, -1.0 )
+    c, relative_uncertainty = fit_fluid_property_correlation(
+        sd.CT_SUTHERLAND_LAW, TEMPERATURES, values * noise, 0.02 * values,
+        REFERENCE_TEMPERATURE,
+    )
+    assert 0.02 < relative_uncertainty < 0.03
+
+def test_fits_reject_bad_input():
+    with pytest.raises( ValueError ):
+        fit_fluid_property_correlation( "?", TEMPERATURES, TEMPERATURES,
+                                        TEMPERATURES, REFERENCE_TEMPERATURE )
+    with pytest.raises( ValueError ):
+        fit_fluid_property_correlation( sd.CT_POLYNOMIAL, [ 300.0, 310.0 ],
+                                        [ 1.0, 2.0 ], [ 0.1, 0.1 ],
+                                        REFERENCE_TEMPERATURE, 2 )
+
+def read_correlations( cursor ):
+    cursor.execute( "SELECT fluid_id, quantity_id, correlation_type_id "
+                    "FROM fluid_property_correlations;" )
+    return cursor.fetchall()
+
+def test_stored_correlations_follow_their_tables( database ):
+    cursor = database.cursor
+    correlations = read_correlations( cursor )
+    assert len(correlations) != 0
+    for fluid_id, quantity_id, correlation_type_id in correlations:
+        correlation = get_fluid_property_correlation(
+            cursor, fluid_id, quantity_id, correlation_type_id,
+        )
+        table = get_fluid_property_table( cursor, fluid_id, quantity_id )
+        inside = ( table.temperatures >= correlation.minimum_temperature ) & \
+                 ( table.temperatures <= correlation.maximum_temperature )
+        assert np.any(inside)
+        values = correlation.evaluate( table.temperatures[inside] )
+        relative_errors = values.values / table.values[inside] - 1.0
+        assert np.all( np.abs(relative_errors) <
+                       5.0 * correlation.correlation_uncertainty + 1.0e-3 )
+
+def test_preferred_correlations_are_the_default( database ):
+    cursor = database.cursor
+    correlation = get_fluid_property_correlation( cursor, sd.F_GASEOUS_AIR,
+                                                  sd.Q_DYNAMIC_VISCOSITY )
+    assert correlation.correlation_type_id == sd.CT_SUTHERLAND_LAW
+    assert get_fluid_property_correlation( cursor, sd.F_GASEOUS_AIR,
+                                           sd.Q_DYNAMIC_VISCOSITY ) is correlation
+    assert get_fluid_property_correlation(
+        cursor, sd.F_GASEOUS_AIR, sd.Q_DYNAMIC_VISCOSITY, sd.CT_POWER_LAW,
+    ).correlation_type_id == sd.CT_POWER_LAW
+    with pytest.raises( ValueError ):
+        get_fluid_property_correlation( cursor, sd.F_GASEOUS_AIR,
+                                        sd.Q_SPEED_OF_SOUND )
+
+def test_evaluate_correlation( database ):
+    cursor = database.cursor
+    correlation = get_fluid_property_correlation( cursor, sd.F_GASEOUS_AIR,
+                                                  sd.Q_DYNAMIC_VISCOSITY )
+    value = evaluate_correlation( cursor, sd.F_GASEOUS_AIR,
+                                  sd.Q_DYNAMIC_VISCOSITY, 300.0 )
+    assert value.n == pytest.approx( 1.85e-5, rel=0.02 )
+    assert value.s == pytest.approx( correlation.correlation_uncertainty * value.n )
+
+    uncertain = evaluate_correlation( cursor, sd.F_GASEOUS_AIR,
+                                      sd.Q_DYNAMIC_VISCOSITY,
+                                      sd.sdfloat( 300.0, 5.0 ) )
+    assert uncertain.n == value.n
+    assert uncertain.s > value.s
+
+    profile = evaluate_correlation( cursor, sd.F_GASEOUS_AIR,
+                                    sd.Q_DYNAMIC_VISCOSITY,
+                                    np.array( [ 50.0, 300.0, 3000.0 ] ) )
+    assert isinstance( profile, SDArray )
+    assert np.isnan( profile.values[0] ) and np.isnan( profile.values[2] )
+    assert profile.values[1] == value.n
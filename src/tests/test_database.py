@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import pytest
+import shutil
+import sqlite3
+
+import sheardata as sd
+
+def read_pragma( db, name ):
+    db.cursor.execute( "PRAGMA {:s};".format( name ) )
+    return str(db.cursor.fetchone()[0]).lower()
+
+def count_studies( filename ):
+    db = sd.Database( filename )
+    db.cursor.execute( "SELECT COUNT(*) FROM studies;" )
+    count = int(db.cursor.fetchone()[0])
+    db.close()
+    return count
+
+@pytest.fixture
+def filename( prepared_database, tmp_path ):
+    filename = str( tmp_path / "test.db" )
+    shutil.copyfile( prepared_database, filename )
+    return filename
+
+def test_foreign_keys_are_enforced( filename ):
+    db = sd.Database( filename )
+    assert read_pragma( db, "foreign_keys" ) == "1"
+    with pytest.raises( sqlite3.IntegrityError ):
+        db.add_series( "D", 2023, 1, 1, 2 )
+    db.close()
+
+def test_build_mode_is_undone_on_close( filename ):
+    db = sd.Database( filename, build_mode=True )
+    assert db.build_mode
+    assert read_pragma( db, "journal_mode" ) == "wal"
+    assert read_pragma( db, "synchronous"  ) == "0"
+    db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+    db.commit()
+    db.close()
+    assert db.connection == None
+    db.close()
+
+    # The finished database is a single file again.
+    assert not os.path.exists( filename+"-wal" )
+    db = sd.Database( filename )
+    assert read_pragma( db, "journal_mode" ) == "delete"
+    assert read_pragma( db, "synchronous"  ) == "2"
+    db.close()
+    assert count_studies( filename ) == 1
+
+def test_closing_discards_uncommitted_changes( filename ):
+    for build_mode in [ False, True ]:
+        db = sd.Database( filename, build_mode=build_mode )
+        db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+        db.close()
+        assert count_studies( filename ) == 0
+
+def test_build_mode_can_be_switched_within_a_session( filename ):
+    db = sd.Database( filename )
+    assert not db.build_mode
+    db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+    db.enable_build_mode()
+    assert read_pragma( db, "journal_mode" ) == "wal"
+    db.disable_build_mode()
+    assert read_pragma( db, "journal_mode" ) == "delete"
+    assert not db.build_mode
+    db.close()
+
+    # Changing the mode commits the open transaction.
+    assert count_studies( filename ) == 1
+
+def test_context_manager_commits_on_success( filename ):
+    with sd.Database( filename ) as db:
+        db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+    assert db.connection == None
+    assert count_studies( filename ) == 1
+
+def test_context_manager_rolls_back_on_failure( filename ):
+    with pytest.raises( RuntimeError ):
+        with sd.Database( filename, build_mode=True ) as db:
+            db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+            raise RuntimeError( "failed" )
+    assert db.connection == None
+    assert count_studies( filename ) == 0
+
+def test_methods_use_the_session_cursor( filename ):
+    with sd.Database( filename ) as db:
+        db.add_study( "D", 2023, 1, sd.ST_EXPERIMENT )
+        db.add_series( "D", 2023, 1, 1, 2 )
+        db.add_station( "D", 2023, 1, 1, 1 )
+        point_ids = db.add_points( "D", 2023, 1, 1, 1, [ 1, 2 ] )
+        assert point_ids == [ sd.identify_point( "D", 2023, 1, 1, 1, 1 ),
+                              sd.identify_point( "D", 2023, 1, 1, 1, 2 ) ]
+        db.delete_series( sd.identify_series( "D", 2023, 1, 1 ) )
+        db.cursor.execute( "SELECT COUNT(*) FROM points;" )
+        assert db.cursor.fetchone()[0] == 0
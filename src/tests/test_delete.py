@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+
+# Tables that every study, series, station, or point owns rows of, and the
+# column that ties those rows to the test studies.
+OWNED_TABLES = [
+    ( "studies",               "study_id"   ),
+    ( "study_notes",           "study_id"   ),
+    ( "study_sources",         "study_id"   ),
+    ( "study_summary_mat",     "study_id"   ),
+    ( "series",                "series_id"  ),
+    ( "series_notes",          "series_id"  ),
+    ( "times",                 "series_id"  ),
+    ( "stations",              "station_id" ),
+    ( "station_notes",         "station_id" ),
+    ( "station_paths",         "station_descendant_id" ),
+    ( "points",                "station_id" ),
+    ( "wall_distance_mat",     "station_id" ),
+]
+
+COORDINATE_TABLES = [ "{:s}_coordinate".format( direction )
+                      for direction, alias in sd.COORDINATE_DIRECTIONS ]
+
+def count_rows( cursor, table, column=None, prefix=None ):
+    if ( column == None ):
+        cursor.execute( "SELECT COUNT(*) FROM {:s};".format( table ) )
+    else:
+        cursor.execute(
+            "SELECT COUNT(*) FROM {:s} WHERE substr( {:s}, 1, ? )=?;".format(
+                table, column,
+            ),
+            ( len(prefix), prefix, )
+        )
+    return int(cursor.fetchone()[0])
+
+def count_coordinates( cursor, point_keys ):
+    total = 0
+    for table in COORDINATE_TABLES:
+        for point_key in point_keys:
+            cursor.execute(
+                "SELECT COUNT(*) FROM {:s} WHERE point_key=?;".format( table ),
+                ( point_key, )
+            )
+            total += int(cursor.fetchone()[0])
+    return total
+
+def add_note_with_contents( cursor, tmp_path, contents ):
+    filename = tmp_path / "{:d}.tex".format( abs(hash(contents)) )
+    filename.write_text( contents )
+    return sd.add_note( cursor, str(filename) )
+
+# Two studies that share a facility.  The first study also has its own model,
+# instrument, and notes.
+def add_test_studies( cursor, station_factory, tmp_path ):
+    facility_id = sd.add_facility( cursor, sd.FT_WIND_TUNNEL, "Shared tunnel",
+                                   "USA" )
+    model_id = sd.add_model( cursor, sd.MC_INTERIOR_MODEL, "Duct model" )
+    sd.add_model_source( cursor, model_id, "SmithJ+2000+eng+JOUR" )
+    instrument_note_id = add_note_with_contents( cursor, tmp_path, "Probe" )
+    instrument_id = sd.add_instrument( cursor, sd.IC_CALCULATION, "Probe",
+                                       note_ids=[ instrument_note_id ] )
+    study_note_id  = add_note_with_contents( cursor, tmp_path, "Study" )
+    series_note_id = add_note_with_contents( cursor, tmp_path, "Series" )
+
+    sd.add_study( cursor, "D", 2023, 1, sd.ST_EXPERIMENT,
+                  note_ids=[ study_note_id ] )
+    sd.add_study_source( cursor, sd.identify_study( "D", 2023, 1 ),
+                         "SmithJ+2000+eng+JOUR" )
+    sd.add_series( cursor, "D", 2023, 1, 1, 2, facility_id=facility_id,
+                   model_id=model_id, note_ids=[ series_note_id ] )
+    sd.add_series( cursor, "D", 2023, 1, 2, 2, facility_id=facility_id )
+    sd.add_study( cursor, "D", 2023, 2, sd.ST_EXPERIMENT )
+    sd.add_series( cursor, "D", 2023, 2, 1, 2, facility_id=facility_id )
+
+    station_id, first_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1, 0.2 ],
+                                              instrument_id=instrument_id )
+    station_id, second_keys = station_factory( cursor, 1, 2, 1, [ 0.0, 0.1 ] )
+    station_id, other_keys = station_factory( cursor, 2, 1, 1, [ 0.0, 0.3 ] )
+    sd.refresh_wall_distances( cursor )
+    sd.refresh_study_summaries( cursor )
+    return {
+        "facility_id":   facility_id,
+        "model_id":      model_id,
+        "instrument_id": instrument_id,
+        "note_ids":      [ instrument_note_id, study_note_id, series_note_id ],
+        "first_keys":    first_keys + second_keys,
+        "other_keys":    other_keys,
+    }
+
+def row_exists( cursor, table, column, value ):
+    cursor.execute(
+        "SELECT COUNT(*) FROM {:s} WHERE {:s}=?;".format( table, column ),
+        ( value, )
+    )
+    return int(cursor.fetchone()[0]) != 0
+
+def test_delete_study_removes_everything_that_it_owns( database, station_factory,
+                                                       tmp_path ):
+    cursor = database.cursor
+    rows = add_test_studies( cursor, station_factory, tmp_path )
+    first_id = sd.identify_study( "D", 2023, 1 )
+    other_id = sd.identify_study( "D", 2023, 2 )
+    other_counts = [ count_rows( cursor, table, column, other_id )
+                     for table, column in OWNED_TABLES ]
+
+    sd.delete_study( cursor, first_id )
+
+    for table, column in OWNED_TABLES:
+        assert count_rows( cursor, table, column, first_id ) == 0, table
+    assert count_coordinates( cursor, rows["first_keys"] ) == 0
+    assert [ count_rows( cursor, table, column, other_id )
+             for table, column in OWNED_TABLES ] == other_counts
+    assert count_coordinates( cursor, rows["other_keys"] ) == \
+        len(rows["other_keys"]) * len(COORDINATE_TABLES)
+
+    # The facility is still used by the other study, but nothing refers to the
+    # model, the instrument, or the notes any longer.
+    assert     row_exists( cursor, "facilities",  "facility_id",   rows["facility_id"]   )
+    assert not row_exists( cursor, "models",      "model_id",      rows["model_id"]      )
+    assert not row_exists( cursor, "model_sources", "model_id",    rows["model_id"]      )
+    assert not row_exists( cursor, "instruments", "instrument_id", rows["instrument_id"] )
+    assert not row_exists( cursor, "instrument_notes", "instrument_id",
+                           rows["instrument_id"] )
+    for note_id in rows["note_ids"]:
+        assert not row_exists( cursor, "notes", "note_id", note_id )
+
+def test_delete_series_keeps_the_rest_of_the_study( database, station_factory,
+                                                    tmp_path ):
+    cursor = database.cursor
+    rows = add_test_studies( cursor, station_factory, tmp_path )
+    deleted_id = sd.identify_series( "D", 2023, 1, 1 )
+    kept_id    = sd.identify_series( "D", 2023, 1, 2 )
+
+    sd.delete_series( cursor, deleted_id )
+
+    for table, column in OWNED_TABLES[4:]:
+        assert count_rows( cursor, table, column, deleted_id ) == 0, table
+    assert count_coordinates( cursor, rows["first_keys"][:3] ) == 0
+    assert count_rows( cursor, "points",            "station_id", kept_id ) == 2
+    assert count_rows( cursor, "wall_distance_mat", "station_id", kept_id ) == 2
+    assert row_exists( cursor, "studies",     "study_id", sd.identify_study( "D", 2023, 1 ) )
+    assert row_exists( cursor, "study_notes", "note_id",  rows["note_ids"][1] )
+    assert row_exists( cursor, "notes",       "note_id",  rows["note_ids"][1] )
+    assert not row_exists( cursor, "notes",   "note_id",  rows["note_ids"][2] )
+    assert not row_exists( cursor, "models",  "model_id", rows["model_id"]    )
+    assert row_exists( cursor, "facilities",  "facility_id", rows["facility_id"] )
+
+def test_facilities_are_removed_with_their_last_series( database, station_factory,
+                                                        tmp_path ):
+    cursor = database.cursor
+    rows = add_test_studies( cursor, station_factory, tmp_path )
+    sd.delete_study( cursor, sd.identify_study( "D", 2023, 1 ) )
+    sd.delete_series( cursor, sd.identify_series( "D", 2023, 2, 1 ) )
+    assert not row_exists( cursor, "facilities", "facility_id", rows["facility_id"] )
+
+    # The names are unique, so the same facility can only be added again once
+    # the old one is gone.
+    sd.add_facility( cursor, sd.FT_WIND_TUNNEL, "Shared tunnel", "USA" )
+
+def test_deleted_studies_can_be_added_again( database, station_factory, tmp_path ):
+    cursor = database.cursor
+    add_test_studies( cursor, station_factory, tmp_path )
+    sd.delete_study( cursor, sd.identify_study( "D", 2023, 1 ) )
+
+    station_factory( cursor, 1, 1, 1, [ 0.0, 0.2 ] )
+    cursor.execute( "SELECT name FROM temp.sqlite_master WHERE type='table';" )
+    assert cursor.fetchall() == []
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import sheardata as sd
+
+def station_id( study_number, series_number, station_number ):
+    return sd.identify_station( "D", 2023, study_number, series_number,
+                                station_number )
+
+# Three studies: the first has two series with two stations each, the second
+# is a simulation with a model, and the third is a boundary layer.
+@pytest.fixture
+def stations( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0, 0.1, 0.2 ] )
+    station_factory( cursor, 1, 1, 2, [ 0.0, 0.5, 1.0 ] )
+    station_factory( cursor, 1, 2, 1, [ 0.0, 0.1 ] )
+    station_factory( cursor, 1, 2, 2, [ 0.0, 0.1 ] )
+
+    model_id = sd.add_model( cursor, sd.MC_INTERIOR_RECTANGULAR_CROSS_SECTION )
+    sd.add_study( cursor, "D", 2023, 2, sd.ST_DIRECT_NUMERICAL_SIMULATION )
+    sd.add_series( cursor, "D", 2023, 2, 1, 3, model_id=model_id )
+    station_factory( cursor, 2, 1, 1, [ 0.0, 0.2 ] )
+
+    sd.add_study( cursor, "B", 2023, 1, sd.ST_EXPERIMENT )
+    sd.add_series( cursor, "B", 2023, 1, 1, 2 )
+    sd.add_station( cursor, "B", 2023, 1, 1, 1 )
+    cursor.execute( "UPDATE stations SET flow_regime_id=? WHERE station_id=?;",
+                    ( sd.FR_TURBULENT, sd.identify_station( "B", 2023, 1, 1, 1 ) ) )
+
+    sd.refresh_wall_distances( cursor )
+    return cursor
+
+def test_an_empty_filter_selects_every_station_in_order( stations ):
+    station_ids = sd.StationFilter().station_ids( stations )
+    assert station_ids == sorted(station_ids)
+    assert len(station_ids) == 6
+
+def test_flow_classes_match_their_descendants( stations ):
+    boundary_layer_id = sd.identify_station( "B", 2023, 1, 1, 1 )
+    duct_flow_ids = sd.StationFilter().flow_class( sd.FC_DUCT_FLOW ) \
+                                      .station_ids( stations )
+    assert len(duct_flow_ids) == 5
+    assert boundary_layer_id not in duct_flow_ids
+    assert sd.StationFilter().flow_class( sd.FC_INTERNAL_FLOW ) \
+                             .station_ids( stations ) == duct_flow_ids
+    assert sd.StationFilter().flow_class( sd.FC_INTERNAL_FLOW, descendants=False ) \
+                             .station_ids( stations ) == []
+    assert sd.StationFilter().flow_class( sd.FC_BOUNDARY_LAYER ) \
+                             .station_ids( stations ) == [ boundary_layer_id ]
+
+def test_study_and_series_conditions( stations ):
+    assert sd.StationFilter().study( "D-2023-001" ).station_ids( stations ) == [
+        station_id( 1, 1, 1 ), station_id( 1, 1, 2 ),
+        station_id( 1, 2, 1 ), station_id( 1, 2, 2 ),
+    ]
+    assert sd.StationFilter().study_type( sd.ST_DIRECT_NUMERICAL_SIMULATION ) \
+                             .station_ids( stations ) == [ station_id( 2, 1, 1 ) ]
+    assert sd.StationFilter().number_of_dimensions( 3 ) \
+                             .station_ids( stations ) == [ station_id( 2, 1, 1 ) ]
+
+def test_model_classes_match_their_descendants( stations ):
+    assert sd.StationFilter().model_class( sd.MC_INTERIOR_MODEL ) \
+                             .station_ids( stations ) == [ station_id( 2, 1, 1 ) ]
+    assert sd.StationFilter().model_class( sd.MC_INTERIOR_MODEL, descendants=False ) \
+                             .station_ids( stations ) == []
+
+def test_station_conditions( stations ):
+    assert sd.StationFilter().flow_regime( sd.FR_TURBULENT ) \
+                             .station_ids( stations ) == [
+        sd.identify_station( "B", 2023, 1, 1, 1 ),
+    ]
+    stations.execute( "UPDATE stations SET streamwise_periodic=TRUE, "
+                      "spanwise_periodic=FALSE WHERE station_id=?;",
+                      ( station_id( 1, 2, 2 ), ) )
+    assert sd.StationFilter().streamwise_periodic() \
+                             .station_ids( stations ) == [ station_id( 1, 2, 2 ) ]
+    assert sd.StationFilter().spanwise_periodic( False ) \
+                             .station_ids( stations ) == [ station_id( 1, 2, 2 ) ]
+
+def test_outliers_at_any_level_are_excluded( stations ):
+    stations.execute( "UPDATE series SET outlier=TRUE WHERE series_id=?;",
+                      ( sd.identify_series( "D", 2023, 1, 2 ), ) )
+    stations.execute( "UPDATE stations SET outlier=TRUE WHERE station_id=?;",
+                      ( station_id( 1, 1, 1 ), ) )
+    stations.execute( "UPDATE studies SET outlier=TRUE WHERE study_id=?;",
+                      ( sd.identify_study( "D", 2023, 2 ), ) )
+    assert sd.StationFilter().exclude_outliers().station_ids( stations ) == [
+        sd.identify_station( "B", 2023, 1, 1, 1 ),
+        station_id( 1, 1, 2 ),
+    ]
+
+def test_quantity_between_matches_any_point( stations ):
+    assert sd.StationFilter().quantity_between( "transverse_coordinate",
+                                                minimum=0.4, maximum=0.6 ) \
+                             .station_ids( stations ) == [ station_id( 1, 1, 2 ) ]
+    assert sd.StationFilter().quantity_between( "wall_distance", minimum=0.15 ) \
+                             .station_ids( stations ) == [
+        station_id( 1, 1, 1 ), station_id( 1, 1, 2 ), station_id( 2, 1, 1 ),
+    ]
+    assert sd.StationFilter().quantity_between( "wall_distance", maximum=0.0,
+                                                point_label_id=sd.PL_WALL ) \
+                             .station_ids( stations ) == [
+        station_id( 1, 1, 1 ), station_id( 1, 1, 2 ), station_id( 1, 2, 1 ),
+        station_id( 1, 2, 2 ), station_id( 2, 1, 1 ),
+    ]
+    assert sd.StationFilter().quantity_between( "transverse_coordinate",
+                                                minimum=0.05,
+                                                point_label_id=sd.PL_WALL ) \
+                             .station_ids( stations ) == []
+
+def test_outlying_values_never_match( stations ):
+    stations.execute( "UPDATE transverse_coordinate SET outlier=TRUE "
+                      "WHERE value=0.5;" )
+    assert sd.StationFilter().quantity_between( "transverse_coordinate",
+                                                minimum=0.4, maximum=0.6 ) \
+                             .station_ids( stations ) == []
+
+def test_unknown_quantities_are_rejected():
+    with pytest.raises( ValueError ):
+        sd.StationFilter().quantity_between( "velocity", minimum=0.0 )
+
+def test_conditions_chain_and_join_only_the_tables_they_need( stations ):
+    station_filter = sd.StationFilter().streamwise_periodic( False )
+    query, parameters = station_filter.sql()
+    assert "JOIN" not in query
+
+    station_filter.model_class( sd.MC_INTERIOR_MODEL ) \
+                  .study_type( sd.ST_DIRECT_NUMERICAL_SIMULATION ) \
+                  .quantity_between( "wall_distance", minimum=0.1 )
+    query, parameters = station_filter.sql()
+    assert query.count( "JOIN series" ) == 1
+    assert "JOIN models"  in query
+    assert "JOIN studies" in query
+    assert query.index( "JOIN series" ) < query.index( "JOIN models" )
+    assert parameters == ( 0, sd.MC_INTERIOR_MODEL,
+                           sd.ST_DIRECT_NUMERICAL_SIMULATION, 0.1 )
+    assert sd.ST_DIRECT_NUMERICAL_SIMULATION not in query
+    assert station_filter.station_ids( stations ) == [ station_id( 2, 1, 1 ) ]
+
+def test_explain_returns_the_query_plan( stations ):
+    plan = sd.StationFilter().flow_class( sd.FC_DUCT_FLOW ) \
+                             .quantity_between( "wall_distance", maximum=0.1 ) \
+                             .explain( stations )
+    assert len(plan) != 0
+    assert all( isinstance( line, str ) for line in plan )
+    assert any( "stations" in line for line in plan )
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+
+WATER_DENSITY = ( sd.F_LIQUID_WATER, sd.Q_MASS_DENSITY )
+
+def test_every_entry_point_uses_the_preferred_values_by_default( database ):
+    cursor = database.cursor
+    table = sd.get_fluid_property_table( cursor, *WATER_DENSITY )
+    assert table.preferred == True
+    assert sd.FluidPropertyTable( cursor, *WATER_DENSITY ).preferred == True
+    assert sd.get_fluid_property_table( cursor, *WATER_DENSITY,
+                                        preferred=True ) is table
+    assert sd.evaluate_fluid_property( cursor, *WATER_DENSITY, 300.0 ).n == \
+        table.evaluate( 300.0 ).n
+
+def test_tables_select_values_by_preference( database ):
+    cursor = database.cursor
+    cursor.execute(
+    """
+    SELECT preferred, COUNT(*)
+    FROM fluid_property_values
+    WHERE fluid_id=? AND quantity_id=?
+    GROUP BY preferred;
+    """,
+    WATER_DENSITY
+    )
+    counts = dict( cursor.fetchall() )
+    assert len( sd.FluidPropertyTable( cursor, *WATER_DENSITY,
+                                       preferred=True  ).values ) <= counts[1]
+    assert len( sd.FluidPropertyTable( cursor, *WATER_DENSITY,
+                                       preferred=None ).values ) > counts[1]
+
+def test_tables_reproduce_tabulated_values( database ):
+    table = sd.get_fluid_property_table( database.cursor, *WATER_DENSITY )
+    k = table.nearest_level()
+    begin, end = table.offsets[k], table.offsets[k+1]
+    values = table.evaluate( table.temperatures[begin:end] )
+    assert values.values        == pytest.approx( table.values[begin:end] )
+    assert values.uncertainties == pytest.approx( table.uncertainties[begin:end],
+                                                  nan_ok=True )
+
+def test_tables_interpolate_linearly_and_do_not_extrapolate( database ):
+    table = sd.get_fluid_property_table( database.cursor, *WATER_DENSITY )
+    k = table.nearest_level()
+    T = table.temperatures[table.offsets[k]:table.offsets[k+1]]
+    v = table.values[table.offsets[k]:table.offsets[k+1]]
+
+    middle = 0.5 * ( T[0] + T[1] )
+    assert table.evaluate( middle ).n == pytest.approx( 0.5 * ( v[0] + v[1] ) )
+    assert np.isnan( table.evaluate( T[0]  - 1.0 ).n )
+    assert np.isnan( table.evaluate( T[-1] + 1.0 ).n )
+
+def test_tables_propagate_temperature_uncertainties( database ):
+    table = sd.get_fluid_property_table( database.cursor, *WATER_DENSITY )
+    exact     = table.evaluate( 300.0 )
+    uncertain = table.evaluate( sd.sdfloat( 300.0, 1.0 ) )
+    assert uncertain.n == exact.n
+    assert uncertain.s > exact.s
+
+def test_scalars_and_arrays_agree( database ):
+    table = sd.get_fluid_property_table( database.cursor, *WATER_DENSITY )
+    temperatures = np.array( [ 290.0, 300.0, 310.0 ] )
+    values = table.evaluate( temperatures )
+    assert isinstance( values, sd.SDArray )
+    for T, value in zip( temperatures, values.values ):
+        assert table.evaluate( float(T) ).n == pytest.approx( value )
+
+def test_missing_tables_are_errors( database ):
+    with pytest.raises( ValueError ):
+        sd.FluidPropertyTable( database.cursor, sd.F_GASEOUS_ARGON,
+                               sd.Q_MASS_DENSITY )
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+
+PRESSURES    = [ 1.0e5, 1.2e5, 0.8e5 ]
+TEMPERATURES = [ 280.0, 300.0, 350.0 ]
+VELOCITIES   = [  10.0, 100.0, 300.0 ]
+
+def profile( values, relative_uncertainty=0.01 ):
+    values = np.array( values )
+    return sd.SDArray( values, relative_uncertainty * values )
+
+@pytest.fixture
+def air( database ):
+    return database.cursor, sd.dry_air_amount_fractions()
+
+def assert_matches_scalars( result, expected ):
+    assert isinstance( result, sd.SDArray )
+    for i, value in enumerate(expected):
+        assert result.values[i]        == pytest.approx( value.n, rel=1.0e-12 )
+        assert result.uncertainties[i] == pytest.approx( value.s, rel=1.0e-12 )
+
+def test_mass_density_profile_matches_scalar_function( air ):
+    cursor, fractions = air
+    p, T = profile( PRESSURES ), profile( TEMPERATURES )
+    assert_matches_scalars(
+        sd.calculate_ideal_gas_mass_density_profile_from_amount_fractions(
+            cursor, p, T, fractions,
+        ),
+        [ sd.calculate_ideal_gas_mass_density_from_amount_fractions(
+            cursor, p_i, T_i, fractions,
+        ) for p_i, T_i in zip( p.to_sdfloats(), T.to_sdfloats() ) ],
+    )
+
+def test_speed_of_sound_profile_matches_scalar_function( air ):
+    cursor, fractions = air
+    mass_fractions = sd.calculate_mass_fractions_from_amount_fractions(
+        cursor, fractions,
+    )
+    T = profile( TEMPERATURES )
+    assert_matches_scalars(
+        sd.calculate_ideal_gas_speed_of_sound_profile_from_mass_fractions(
+            cursor, T, mass_fractions,
+        ),
+        [ sd.calculate_ideal_gas_speed_of_sound_from_mass_fractions(
+            cursor, T_i, mass_fractions,
+        ) for T_i in T.to_sdfloats() ],
+    )
+
+def test_mach_number_profile_matches_scalar_function( air ):
+    cursor, fractions = air
+    u, T = profile( VELOCITIES ), profile( TEMPERATURES )
+    assert_matches_scalars(
+        sd.calculate_ideal_gas_mach_number_profile_from_amount_fractions(
+            cursor, u, T, fractions,
+        ),
+        [ u_i / sd.calculate_ideal_gas_speed_of_sound_from_amount_fractions(
+            cursor, T_i, fractions,
+        ) for u_i, T_i in zip( u.to_sdfloats(), T.to_sdfloats() ) ],
+    )
+
+def test_plain_arrays_give_plain_arrays_of_the_nominal_values( air ):
+    cursor, fractions = air
+    p, T, u = np.array( PRESSURES ), np.array( TEMPERATURES ), np.array( VELOCITIES )
+    density = sd.calculate_ideal_gas_mass_density_profile_from_amount_fractions(
+        cursor, p, T, fractions,
+    )
+    mach_number = sd.calculate_ideal_gas_mach_number_profile_from_amount_fractions(
+        cursor, u, T, fractions,
+    )
+    assert type(density)     == np.ndarray
+    assert type(mach_number) == np.ndarray
+
+    R = sd.calculate_specific_gas_constant_from_amount_fractions( cursor, fractions ).n
+    gamma = sd.calculate_ideal_gas_heat_capacity_ratio_from_amount_fractions(
+        cursor, fractions,
+    ).n
+    assert np.allclose( density, p / ( R * T ), rtol=1.0e-12, atol=0.0 )
+    assert np.allclose( mach_number, u / np.sqrt( gamma * R * T ),
+                        rtol=1.0e-12, atol=0.0 )
+
+def test_mixture_uncertainties_propagate_to_profiles( database ):
+    cursor = database.cursor
+    fractions = {
+        sd.F_GASEOUS_DIATOMIC_NITROGEN: sd.sdfloat( 0.75, 0.01 ),
+        sd.F_GASEOUS_DIATOMIC_OXYGEN:   sd.sdfloat( 0.25, 0.01 ),
+    }
+    T = sd.SDArray( TEMPERATURES, 0.0 )
+    speed_of_sound = sd.calculate_ideal_gas_speed_of_sound_profile_from_mass_fractions(
+        cursor, T, fractions,
+    )
+    assert np.all( speed_of_sound.uncertainties > 0.0 )
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+
+def random_fields( number, seed=0 ):
+    generator = np.random.default_rng( seed )
+    fields = []
+    for i in range(number):
+        fields.append( (
+            chr( ord("A") + int( generator.integers( 0, 26 ) ) ),
+            int( generator.integers( 1000, 10000 ) ),
+            int( generator.integers( 0, 1000 ) ),
+            int( generator.integers( 0, 1000 ) ),
+            int( generator.integers( 0, 1000 ) ),
+            int( generator.integers( 0, 10000 ) ),
+        ) )
+    return fields
+
+def test_point_keys_round_trip():
+    for fields in random_fields( 100 ):
+        point_id  = sd.identify_point( *fields )
+        point_key = sd.identify_point_key( *fields )
+        assert sd.point_id_to_key( point_id ) == point_key
+        assert sd.point_key_to_id( point_key ) == point_id
+        assert sd.split_point_key( point_key ) == fields
+        assert sd.point_key_to_id( point_key, readable=True ) == \
+            sd.identify_point( *fields, readable=True )
+
+def test_point_keys_sort_like_point_identifiers():
+    fields = random_fields( 100 )
+    point_ids  = [ sd.identify_point( *f ) for f in fields ]
+    point_keys = [ sd.identify_point_key( *f ) for f in fields ]
+    assert sorted( point_keys ) == [ sd.point_id_to_key( point_id )
+                                     for point_id in sorted( point_ids ) ]
+    assert max( point_keys ) < 2**63
+
+def test_point_keys_reject_fields_out_of_range():
+    with pytest.raises( ValueError ):
+        sd.identify_point_key( "D", 2**14, 1, 1, 1, 1 )
+    with pytest.raises( ValueError ):
+        sd.identify_point_key( "a", 2023, 1, 1, 1, 1 )
+    with pytest.raises( ValueError ):
+        sd.identify_point_key( "D", 2023, 1, 1, 1, -1 )
+
+def test_truncation_of_point_keys():
+    point_key = sd.identify_point_key( "D", 1911, 1, 2, 3, 4 )
+    assert sd.truncate_to_study_id(   point_key ) == "D1911001"
+    assert sd.truncate_to_series_id(  point_key ) == "D1911001002"
+    assert sd.truncate_to_station_id( point_key ) == "D1911001002003"
+
+def test_encoded_identifiers_match_point_keys():
+    fields = random_fields( 50 )
+    point_ids = [ sd.identify_point( *f ) for f in fields ]
+    keys = sd.encode_identifiers( point_ids )
+    assert keys.dtype == np.int64
+    assert keys.tolist() == [ sd.identify_point_key( *f ) for f in fields ]
+    assert sd.encode_identifiers( keys ).tolist() == keys.tolist()
+    assert sd.decode_keys( keys ).tolist() == point_ids
+
+def test_identifiers_of_every_level_round_trip():
+    identifiers = [
+        "D1911001",
+        "D1911001002",
+        "D1911001002003",
+        "D19110010020030004",
+    ]
+    readable_identifiers = [ sd.make_readable_identifier( identifier )
+                             for identifier in identifiers ]
+    keys = sd.encode_identifiers( identifiers )
+    assert sd.encode_identifiers( readable_identifiers ).tolist() == keys.tolist()
+
+    assert sd.identifier_levels( identifiers ).tolist() == [
+        sd.IL_STUDY, sd.IL_SERIES, sd.IL_STATION, sd.IL_POINT,
+    ]
+    assert sd.make_readable_identifiers( identifiers ).tolist() == \
+        readable_identifiers
+    for level, identifier in zip( range( sd.IL_STUDY, sd.IL_POINT+1 ),
+                                  identifiers ):
+        assert sd.decode_keys( sd.encode_identifiers( [ identifier ] ),
+                               level ).tolist() == [ identifier ]
+
+def test_truncated_identifiers_match_the_scalar_functions():
+    point_ids = [ sd.identify_point( *f ) for f in random_fields( 50 ) ]
+    for level, truncate in [
+        ( sd.IL_STUDY,   sd.truncate_to_study_id   ),
+        ( sd.IL_SERIES,  sd.truncate_to_series_id  ),
+        ( sd.IL_STATION, sd.truncate_to_station_id ),
+    ]:
+        assert sd.truncate_identifiers( point_ids, level ).tolist() == \
+            [ truncate( point_id ) for point_id in point_ids ]
+
+def test_count_studies():
+    point_ids = [
+        "D19110010010010001",
+        "D19110010010010002",
+        "D1911001002001-0001",
+        "B1914001001001-0001",
+    ]
+    assert sd.count_studies( point_ids ) == {
+        "B1914001": 1,
+        "D1911001": 3,
+    }
+    assert sd.count_studies( sd.encode_identifiers( point_ids ) ) == \
+        sd.count_studies( point_ids )
+    assert sd.count_identifiers( point_ids, sd.IL_SERIES ) == {
+        "B1914001001": 1,
+        "D1911001001": 2,
+        "D1911001002": 1,
+    }
+    assert sd.count_studies( [] ) == {}
+
+@pytest.mark.parametrize( "identifiers", [
+    [ "B191400" ],
+    [ "B1914001", "B19140010" ],
+    [ "B1914001001001000100" ],
+    [ "B-1914-001-001-001-00010" ],
+] )
+def test_identifiers_of_the_wrong_length_are_rejected( identifiers ):
+    with pytest.raises( ValueError ):
+        sd.encode_identifiers( identifiers )
+    with pytest.raises( ValueError ):
+        sd.count_studies( identifiers )
+
+@pytest.mark.parametrize( "identifier", [
+    "B19X4001",
+    "b1914001",
+    "B1914001001001000A",
+] )
+def test_identifiers_with_invalid_characters_are_rejected( identifier ):
+    with pytest.raises( ValueError ):
+        sd.encode_identifiers( [ identifier ] )
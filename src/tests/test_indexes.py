@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import pytest
+import re
+import shutil
+
+import sheardata as sd
+import sheardata.build
+
+# The query planner only prefers an index to a scan once the tables hold more
+# than a few rows, so the database has 400 stations with 10 points each, all
+# at one time, and with a source for every study.
+@pytest.fixture( scope="module" )
+def indexed_database( prepared_database, tmp_path_factory ):
+    filename = str( tmp_path_factory.mktemp( "indexed" ) / "indexed.db" )
+    shutil.copyfile( prepared_database, filename )
+    db = sd.Database( filename )
+    cursor = db.cursor
+
+    series_rows   = []
+    station_rows  = []
+    point_rows    = []
+    value_rows    = []
+    for study_number in range( 1, 5 ):
+        sd.add_study( cursor, sd.FC_DUCT_FLOW, 2023, study_number,
+                      sd.ST_EXPERIMENT )
+        sd.add_study_source( cursor, sd.identify_study( "D", 2023, study_number ),
+                             "SmithJ+2000+eng+JOUR" )
+        for series_number in range( 1, 11 ):
+            series_id = sd.identify_series( "D", 2023, study_number, series_number )
+            series_rows.append( ( series_id, series_id[0:8], series_number, 2 ) )
+            for station_number in range( 1, 11 ):
+                station_id = series_id + "{:03d}".format( station_number )
+                station_rows.append( ( station_id, series_id, station_number ) )
+                for point_number in range( 1, 11 ):
+                    point_key = sd.identify_point_key( "D", 2023, study_number,
+                                                       series_number,
+                                                       station_number,
+                                                       point_number )
+                    point_rows.append( (
+                        point_key,
+                        sd.point_key_to_id( point_key ),
+                        station_id,
+                        point_number,
+                        sd.PL_WALL if point_number == 1 else None,
+                    ) )
+                    value_rows.append( ( point_key, 1.0e-3 * point_number ) )
+
+    cursor.executemany(
+        "INSERT INTO series( series_id, study_id, series_number, "
+        "number_of_dimensions ) VALUES( ?, ?, ?, ? );",
+        series_rows,
+    )
+    cursor.execute( "INSERT INTO times( series_id ) VALUES( ? );",
+                    ( series_rows[0][0], ) )
+    time_id = cursor.lastrowid
+    cursor.executemany(
+        "INSERT INTO stations( station_id, series_id, station_number ) "
+        "VALUES( ?, ?, ? );",
+        station_rows,
+    )
+    cursor.executemany(
+        "INSERT INTO points( point_key, point_id, station_id, point_number, "
+        "point_label_id ) VALUES( ?, ?, ?, ?, ? );",
+        point_rows,
+    )
+    for direction, alias in sd.COORDINATE_DIRECTIONS:
+        cursor.executemany(
+            "INSERT INTO {:s}_coordinate( point_key, time_id, value ) "
+            "VALUES( ?, {:d}, ? );".format( direction, time_id ),
+            value_rows,
+        )
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir( os.path.dirname( os.path.dirname( sd.__file__ ) ) )
+        sheardata.build.create_indexes( cursor )
+    db.commit()
+    yield db
+    db.close()
+
+def query_plan( cursor, query, parameters=() ):
+    cursor.execute( "EXPLAIN QUERY PLAN " + query, parameters )
+    return [ str(result[3]) for result in cursor.fetchall() ]
+
+def assert_searches( plan, table, index, columns ):
+    pattern = r"SEARCH {:s} USING (COVERING )?INDEX {:s} \({:s}\)".format(
+        table,
+        index,
+        re.escape( " AND ".join( "{:s}=?".format( column ) for column in columns ) ),
+    )
+    assert any( re.match( pattern, line ) for line in plan ), plan
+
+def test_points_are_found_by_station( indexed_database ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT point_id FROM points WHERE station_id=? ORDER BY point_number;",
+        ( "D2023001001001", ),
+    )
+    assert_searches( plan, "points", "points_by_station", [ "station_id" ] )
+
+def test_stations_are_found_by_series( indexed_database ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT station_id FROM stations WHERE series_id=?;",
+        ( "D2023001001", ),
+    )
+    assert_searches( plan, "stations", "stations_by_series", [ "series_id" ] )
+
+def test_series_are_found_by_study( indexed_database ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT series_id FROM series WHERE study_id=?;",
+        ( "D2023001", ),
+    )
+    assert_searches( plan, "series", "series_by_study", [ "study_id" ] )
+
+def test_study_sources_are_found_by_classification( indexed_database ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT citation_key FROM study_sources "
+        "WHERE study_id=? AND source_classification_id=?;",
+        ( "D2023001", sd.PRIMARY_SOURCE ),
+    )
+    assert_searches( plan, "study_sources", "study_sources_by_classification",
+                     [ "study_id", "source_classification_id" ] )
+
+def test_study_summary_uses_the_indexes( indexed_database ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT * FROM study_summary WHERE study_id=?;",
+        ( "D2023001", ),
+    )
+    assert_searches( plan, "series",   "series_by_study",    [ "study_id"   ] )
+    assert_searches( plan, "stations", "stations_by_series", [ "series_id"  ] )
+    assert_searches( plan, "points",   "points_by_station",  [ "station_id" ] )
+    assert not any( line.startswith( "SCAN" ) and "study_summary" not in line
+                    for line in plan ), plan
+
+@pytest.mark.parametrize( "view", [
+    "wall_distance",
+    "streamwise_wall_distance",
+    "transverse_wall_distance",
+    "spanwise_wall_distance",
+] )
+def test_wall_distance_views_join_coordinates_by_key( indexed_database, view ):
+    plan = query_plan(
+        indexed_database.cursor,
+        "SELECT * FROM {:s} WHERE station_id=?;".format( view ),
+        ( "D2023001001001", ),
+    )
+    assert_searches( plan, "wall",   "points_by_station", [ "station_id", "point_label_id" ] )
+    assert_searches( plan, "points", "points_by_station", [ "station_id" ] )
+    for direction, alias in sd.COORDINATE_DIRECTIONS:
+        if ( view != "wall_distance" and not view.startswith( direction ) ):
+            continue
+        assert_searches( plan, alias, "sqlite_autoindex_{:s}_coordinate_1".format( direction ),
+                         [ "point_key", "time_id", "instrument_id" ] )
+    # The only scans are of the rows of that station that rank the walls.
+    assert not any( line.startswith( "SCAN" ) and "subquery" not in line
+                    for line in plan ), plan
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+from sheardata.integration import *
+
+RULES = [ IR_TRAPEZOID_RULE, IR_SIMPSONS_RULE, IR_MONOTONE_SPLINE ]
+
+def random_segments( lengths, seed=0 ):
+    generator = np.random.default_rng( seed )
+    offsets = np.concatenate( [ [0], np.cumsum(lengths) ] ).astype(int)
+    x = np.concatenate( [ np.sort( generator.uniform( 0.0, 1.0, length ) )
+                          for length in lengths ] )
+    f = sd.SDArray( generator.uniform( -1.0, 1.0, len(x) ),
+                    generator.uniform(  0.0, 0.1, len(x) ) )
+    x = sd.SDArray( x, generator.uniform( 0.0, 0.01, len(x) ) )
+    return x, f, offsets
+
+def segment( a, offsets, s ):
+    return a[offsets[s]:offsets[s+1]]
+
+@pytest.mark.parametrize( "rule", RULES )
+def test_batched_integrals_match_single_segments( rule ):
+    x, f, offsets = random_segments( [ 5, 2, 1, 0, 8, 3, 13 ] )
+    integrals = integrate( x, f, offsets, rule )
+    for s in range(len(offsets)-1):
+        if ( offsets[s+1] == offsets[s] ):
+            assert integrals.values[s] == 0.0
+            continue
+        single = integrate( segment( x, offsets, s ), segment( f, offsets, s ),
+                            rule=rule )
+        assert integrals.values[s]        == pytest.approx( single.n, abs=1.0e-12 )
+        assert integrals.uncertainties[s] == pytest.approx( single.s, abs=1.0e-12 )
+
+@pytest.mark.parametrize( "rule", RULES )
+def test_batched_cumulative_integrals_match_single_segments( rule ):
+    x, f, offsets = random_segments( [ 4, 7, 1, 3 ] )
+    integrals = integrate( x, f, offsets, rule, cumulative=True )
+    for s in range(len(offsets)-1):
+        single = integrate(
+            segment( x, offsets, s ),
+            segment( f, offsets, s ),
+            [ 0, offsets[s+1] - offsets[s] ],
+            rule,
+            cumulative=True,
+        )
+        assert segment( integrals.values, offsets, s ) == \
+            pytest.approx( single.values, abs=1.0e-12 )
+        assert segment( integrals.uncertainties, offsets, s ) == \
+            pytest.approx( single.uncertainties, abs=1.0e-12 )
+
+@pytest.mark.parametrize( "rule", RULES )
+def test_nan_uncertainty_stays_in_its_segment( rule ):
+    x = np.array( [ 0.0, 1.0, 2.0, 0.0, 1.0, 2.0 ] )
+    s_f = np.full( 6, 0.1 )
+    s_f[0] = np.nan
+    integrals = integrate( x, sd.SDArray( np.ones(6), s_f ), [ 0, 3, 6 ], rule )
+    assert np.isnan( integrals.uncertainties[0] )
+    assert np.isfinite( integrals.uncertainties[1] )
+    assert integrals.values == pytest.approx( [ 2.0, 2.0 ] )
+
+@pytest.mark.parametrize( "rule", RULES )
+def test_nan_value_stays_in_its_segment( rule ):
+    x = np.array( [ 0.0, 1.0, 2.0, 0.0, 1.0, 2.0 ] )
+    f = np.ones(6)
+    f[0] = np.nan
+    integrals = integrate( x, sd.SDArray( f, 0.1 ), [ 0, 3, 6 ], rule )
+    assert np.isnan( integrals.values[0] )
+    assert integrals.values[1] == 2.0
+    assert np.isfinite( integrals.uncertainties[1] )
+
+@pytest.mark.parametrize( "rule", RULES )
+def test_large_values_stay_in_their_segment( rule ):
+    x = np.array( [ 0.0, 1.0, 2.0, 0.0, 1.0, 2.0 ] )
+    f = np.array( [ 1.0e17, 1.0e17, 1.0e17, 1.0, 1.0, 1.0 ] )
+    integrals = integrate( x, f, [ 0, 3, 6 ], rule )
+    assert integrals.values[0] == 2.0e17
+    assert integrals.values[1] == 2.0
+    cumulative = integrate( x, f, [ 0, 3, 6 ], rule, cumulative=True )
+    assert cumulative.values[3:] == pytest.approx( [ 0.0, 1.0, 2.0 ] )
+
+def test_trapezoid_rule_is_exact_for_lines():
+    x = np.array( [ 0.0, 0.5, 1.5, 2.0 ] )
+    assert integrate( x, 3.0 * x + 1.0 ).n == pytest.approx( 8.0 )
+
+def test_simpsons_rule_is_exact_for_parabolas():
+    for x in [ np.array( [ 0.0, 0.3, 1.0, 1.2, 2.0 ] ),
+               np.array( [ 0.0, 0.3, 1.0, 2.0 ] ) ]:
+        f = x**2 - x
+        assert integrate( x, f, rule=IR_SIMPSONS_RULE ).n == \
+            pytest.approx( 2.0 / 3.0 )
+
+def test_monotone_spline_preserves_monotonicity():
+    x = np.linspace( 0.0, 1.0, 11 )
+    f = np.where( x < 0.5, 0.0, 1.0 )
+    cumulative = integrate( x, f, rule=IR_MONOTONE_SPLINE, cumulative=True )
+    assert np.all( np.diff(cumulative.values) >= 0.0 )
+
+# The first-order uncertainty of a linear function of f is exact, so compare it
+# with the uncertainty from the uncertainties package.
+@pytest.mark.parametrize( "rule", [ IR_TRAPEZOID_RULE, IR_SIMPSONS_RULE ] )
+def test_uncertainties_match_the_uncertainties_package( rule ):
+    x, f, offsets = random_segments( [ 9 ] )
+    x = x.values
+    integral = integrate( x, f, rule=rule )
+    weights = np.array( [ integrate( x, np.eye(len(x))[i], rule=rule ).n
+                          for i in range(len(x)) ] )
+    expected = sum( w * value for w, value in zip( weights, f.to_sdfloats() ) )
+    assert integral.n == pytest.approx( expected.n )
+    assert integral.s == pytest.approx( expected.s )
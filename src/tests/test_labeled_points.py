@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import sheardata as sd
+
+# A station with wall points at both ends and two center-line points, and a
+# second station with no labeled points.
+@pytest.fixture
+def labeled_stations( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory(
+        cursor, 1, 1, 1, [ 0.0, 0.2, 0.5, 0.5, 1.0 ],
+        point_label_ids=[ sd.PL_WALL, None, sd.PL_CENTER_LINE,
+                          sd.PL_CENTER_LINE, sd.PL_WALL ],
+    )
+    other_id, point_keys = station_factory( cursor, 1, 1, 2, [ 0.0, 0.5 ],
+                                            point_label_ids=[ None, None ] )
+    return cursor, station_id, other_id
+
+def point_id( station_number, point_number ):
+    return sd.identify_point( "D", 2023, 1, 1, station_number, point_number )
+
+def test_resolve_labeled_points( labeled_stations ):
+    cursor, station_id, other_id = labeled_stations
+    point_label_ids = [ sd.PL_LOWER_WALL, sd.PL_UPPER_WALL, sd.PL_WALL,
+                        sd.PL_CENTER_LINE, sd.PL_LOWER_EDGE ]
+    assert sd.resolve_labeled_points( cursor, [ other_id, station_id, station_id ],
+                                      point_label_ids ) == {
+        station_id: {
+            sd.PL_LOWER_WALL:  point_id( 1, 1 ),
+            sd.PL_UPPER_WALL:  point_id( 1, 5 ),
+            sd.PL_WALL:        [ point_id( 1, 1 ), point_id( 1, 5 ) ],
+            sd.PL_CENTER_LINE: [ point_id( 1, 3 ), point_id( 1, 4 ) ],
+            sd.PL_LOWER_EDGE:  None,
+        },
+        other_id: {
+            sd.PL_LOWER_WALL:  None,
+            sd.PL_UPPER_WALL:  None,
+            sd.PL_WALL:        [],
+            sd.PL_CENTER_LINE: [],
+            sd.PL_LOWER_EDGE:  None,
+        },
+    }
+
+def test_resolve_labeled_points_of_every_station( labeled_stations ):
+    cursor, station_id, other_id = labeled_stations
+    resolved_points = sd.resolve_labeled_points( cursor, None, [ sd.PL_UPPER_WALL ] )
+    assert resolved_points == {
+        station_id: { sd.PL_UPPER_WALL: point_id( 1, 5 ) },
+        other_id:   { sd.PL_UPPER_WALL: None },
+    }
+    assert sd.resolve_labeled_points( cursor, [], [ sd.PL_WALL ] ) == {}
+
+def test_locate_labeled_points( labeled_stations ):
+    cursor, station_id, other_id = labeled_stations
+    assert sd.locate_labeled_point( cursor, station_id, sd.PL_UPPER_WALL ) == point_id( 1, 5 )
+    assert sd.locate_labeled_point( cursor, station_id, sd.PL_WALL ) == point_id( 1, 1 )
+    assert sd.locate_labeled_point( cursor, other_id, sd.PL_WALL ) == None
+    assert sd.locate_labeled_points( cursor, station_id, sd.PL_CENTER_LINE ) == [
+        point_id( 1, 3 ), point_id( 1, 4 ),
+    ]
+    assert sd.locate_labeled_points( cursor, station_id, sd.PL_LOWER_WALL ) == [
+        point_id( 1, 1 ),
+    ]
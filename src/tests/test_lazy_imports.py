@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import subprocess
+import sys
+
+import sheardata as sd
+
+SOURCE_DIRECTORY = os.path.dirname( os.path.dirname( os.path.abspath( sd.__file__ ) ) )
+
+# Runs the code in a new interpreter, so that no other test has imported numpy
+# or uncertainties yet, and returns the modules that it imported among those.
+def imported_modules( code ):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "import sheardata as sd\n"
+            "{:s}\n"
+            "print( ' '.join( sorted( set( [ 'numpy', 'uncertainties' ] )"
+            " & set( sys.modules ) ) ) )".format( code ),
+        ],
+        cwd=SOURCE_DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+def test_identifiers_and_constants_do_not_import_numpy():
+    assert imported_modules(
+        "point_id = sd.identify_point( sd.FC_DUCT_FLOW, 1911, 1, 2, 3, 4 )\n"
+        "point_key = sd.identify_point_key( sd.FC_DUCT_FLOW, 1911, 1, 2, 3, 4 )\n"
+        "assert sd.truncate_to_study_id( point_id ) == 'D1911001'\n"
+        "assert sd.truncate_to_series_id( point_key ) == 'D1911001002'\n"
+        "assert sd.truncate_to_station_id( point_id ) == 'D1911001002003'\n"
+        "assert sd.make_readable_identifier( point_id ) == 'D-1911-001-002-003-0004'\n"
+        "assert sd.point_key_to_id( point_key ) == point_id\n"
+        "assert sd.STANDARD_ATMOSPHERIC_PRESSURE > 0.0\n"
+        "assert sd.PL_WALL == 'W'\n"
+        "assert sd.IL_POINT == 6\n"
+    ) == []
+
+def test_streaming_rows_does_not_import_numpy():
+    assert imported_modules(
+        "import sqlite3\n"
+        "connection = sqlite3.connect( ':memory:' )\n"
+        "assert list( sd.stream_rows( connection.cursor(), 'SELECT 1, 2;' ) ) == [ ( 1, 2 ) ]\n"
+        "assert list( sd.stream_values( connection.cursor(), 'SELECT 3;' ) ) == [ 3 ]\n"
+        "sd.stream_point_batches\n"
+    ) == []
+    assert "numpy" in imported_modules(
+        "import sqlite3\n"
+        "connection = sqlite3.connect( ':memory:' )\n"
+        "list( sd.stream_record_batches( connection.cursor(), 'SELECT 1;', [ ( 'n', 'i8' ) ] ) )\n"
+    )
+
+def test_numerical_parts_import_numpy_on_first_use():
+    assert imported_modules( "sd.np" ) == [ "numpy" ]
+    assert "uncertainties" in imported_modules( "sd.sdfloat( 1.0, 0.1 )" )
+    assert "numpy" in imported_modules( "sd.SDArray( [ 1.0 ] )" )
+    assert "numpy" in imported_modules( "sd.encode_identifiers( [ 'D1911001' ] )" )
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import pytest
+
+import sheardata as sd
+
+def nitrogen_and_oxygen( nitrogen, uncertainty=0.0 ):
+    return {
+        sd.F_GASEOUS_DIATOMIC_NITROGEN: sd.sdfloat( nitrogen,       uncertainty ),
+        sd.F_GASEOUS_DIATOMIC_OXYGEN:   sd.sdfloat( 1.0 - nitrogen, uncertainty ),
+    }
+
+def test_equal_compositions_share_their_properties( database ):
+    cursor = database.cursor
+    mixture = sd.get_mixture_properties_from_mass_fractions(
+        cursor, nitrogen_and_oxygen( 0.75 ),
+    )
+    assert sd.get_mixture_properties_from_mass_fractions(
+        cursor, dict( reversed( list( nitrogen_and_oxygen( 0.75 ).items() ) ) ),
+    ) is mixture
+    assert sd.get_mixture_properties_from_mass_fractions(
+        cursor, nitrogen_and_oxygen( 0.70 ),
+    ) is not mixture
+    assert sd.get_mixture_properties_from_amount_fractions(
+        cursor, nitrogen_and_oxygen( 0.75 ),
+    ) is not mixture
+
+def test_unknown_uncertainties_still_match( database ):
+    cursor = database.cursor
+    fractions = nitrogen_and_oxygen( 0.75, sd.UNKNOWN_UNCERTAINTY )
+    mixture = sd.get_mixture_properties_from_mass_fractions( cursor, fractions )
+    assert math.isnan( mixture.specific_gas_constant.s )
+    assert sd.get_mixture_properties_from_mass_fractions(
+        cursor, nitrogen_and_oxygen( 0.75, sd.UNKNOWN_UNCERTAINTY ),
+    ) is mixture
+
+def test_exact_fractions_match_sdfloats_without_uncertainty( database ):
+    cursor = database.cursor
+    mixture = sd.get_mixture_properties_from_mass_fractions(
+        cursor, nitrogen_and_oxygen( 0.75 ),
+    )
+    assert sd.get_mixture_properties_from_mass_fractions(
+        cursor, { sd.F_GASEOUS_DIATOMIC_NITROGEN: 0.75,
+                  sd.F_GASEOUS_DIATOMIC_OXYGEN:   0.25, },
+    ) is mixture
+
+def test_cached_properties_match_a_new_calculation( database ):
+    cursor = database.cursor
+    fractions = nitrogen_and_oxygen( 0.75, 0.01 )
+    sd.get_mixture_properties_from_mass_fractions( cursor, fractions )
+    cached = sd.get_mixture_properties_from_mass_fractions( cursor, fractions )
+    calculated = sd.MixtureProperties( sd.get_chemistry( cursor ), fractions )
+    for name in [ "molar_mass", "specific_gas_constant",
+                  "specific_isochoric_heat_capacity",
+                  "specific_isobaric_heat_capacity", "heat_capacity_ratio" ]:
+        assert getattr( cached, name ).n == getattr( calculated, name ).n
+        assert getattr( cached, name ).s == getattr( calculated, name ).s
+
+def test_least_recently_used_mixtures_are_dropped( database, monkeypatch ):
+    cursor = database.cursor
+    monkeypatch.setattr( sd, "MIXTURE_CACHE_SIZE", 2 )
+    first  = sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.1 ) )
+    second = sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.2 ) )
+    assert sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.1 ) ) is first
+    sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.3 ) )
+    assert len( sd.get_chemistry( cursor ).mixture_properties ) == 2
+    assert sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.1 ) ) is first
+    assert sd.get_mixture_properties_from_mass_fractions( cursor, nitrogen_and_oxygen( 0.2 ) ) is not second
+
+def test_returned_mass_fractions_are_copies( database ):
+    cursor = database.cursor
+    amount_fractions = sd.dry_air_amount_fractions()
+    mass_fractions = sd.calculate_mass_fractions_from_amount_fractions(
+        cursor, amount_fractions,
+    )
+    assert sum( mass_fractions.values() ).n == pytest.approx( 1.0 )
+    mass_fractions.clear()
+    assert len( sd.calculate_mass_fractions_from_amount_fractions(
+        cursor, amount_fractions,
+    ) ) == len(amount_fractions)
+
+def test_amount_and_mass_fractions_give_the_same_mixture( database ):
+    cursor = database.cursor
+    amount_fractions = sd.dry_air_amount_fractions()
+    mass_fractions = sd.calculate_mass_fractions_from_amount_fractions(
+        cursor, amount_fractions,
+    )
+    R_from_amounts = sd.calculate_specific_gas_constant_from_amount_fractions(
+        cursor, amount_fractions,
+    )
+    R_from_masses = sd.calculate_specific_gas_constant_from_mass_fractions(
+        cursor, mass_fractions,
+    )
+    assert R_from_amounts.n == pytest.approx( R_from_masses.n, rel=1.0e-12 )
+    assert R_from_amounts.n == pytest.approx( 287.0, rel=1.0e-2 )
+    assert sd.calculate_ideal_gas_heat_capacity_ratio_from_amount_fractions(
+        cursor, amount_fractions,
+    ).n == pytest.approx( 1.4, rel=1.0e-2 )
+    assert sd.calculate_molar_mass_from_amount_fractions(
+        cursor, amount_fractions,
+    ).n == pytest.approx( sd.MOLAR_GAS_CONSTANT / R_from_amounts.n, rel=1.0e-12 )
+
+def test_changing_the_elements_drops_the_mixtures( database ):
+    cursor = database.cursor
+    fractions = nitrogen_and_oxygen( 0.75 )
+    mixture = sd.get_mixture_properties_from_mass_fractions( cursor, fractions )
+    cursor.execute( "UPDATE elements SET conventional_atomic_weight = "
+                    "2.0 * conventional_atomic_weight WHERE element_symbol='N';" )
+    changed = sd.get_mixture_properties_from_mass_fractions( cursor, fractions )
+    assert changed is not mixture
+    assert changed.specific_gas_constant.n < mixture.specific_gas_constant.n
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import sheardata as sd
+
+def add_test_station( cursor ):
+    sd.add_study( cursor, "D", 2023, 1, sd.ST_EXPERIMENT )
+    sd.add_series( cursor, "D", 2023, 1, 1, 2 )
+    sd.add_station( cursor, "D", 2023, 1, 1, 1 )
+    sd.add_station( cursor, "D", 2023, 1, 1, 2 )
+
+def read_table( cursor, table ):
+    cursor.execute( "SELECT * FROM {:s};".format( table ) )
+    return sorted( cursor.fetchall() )
+
+def test_add_points_matches_add_point( database, tmp_path ):
+    cursor = database.cursor
+    add_test_station( cursor )
+    filename = tmp_path / "note.tex"
+    filename.write_text( "Note" )
+    note_id = sd.add_note( cursor, str(filename) )
+
+    point_ids = sd.add_points(
+        cursor, "D", 2023, 1, 1, 1, [ 1, 2, 3 ],
+        point_label_ids=[ sd.PL_WALL, None, sd.PL_CENTER_LINE ],
+        outliers=[ False, True, False ],
+        note_ids=[ [ note_id ], [], [ note_id ] ],
+        point_external_ids=[ {}, { sd.C_CH_1969: "4501" }, {} ],
+    )
+    assert point_ids == [ sd.identify_point( "D", 2023, 1, 1, 1, point_number )
+                          for point_number in [ 1, 2, 3 ] ]
+    batched = [ read_table( cursor, table ) for table in
+                [ "points", "point_notes", "point_external_ids" ] ]
+
+    for table in [ "point_notes", "point_external_ids", "points" ]:
+        cursor.execute( "DELETE FROM {:s};".format( table ) )
+    assert sd.add_point( cursor, "D", 2023, 1, 1, 1, 1,
+                         point_label_id=sd.PL_WALL,
+                         note_ids=[ note_id ] ) == point_ids[0]
+    sd.add_point( cursor, "D", 2023, 1, 1, 1, 2, outlier=True,
+                  point_external_ids={ sd.C_CH_1969: "4501" } )
+    sd.add_point( cursor, "D", 2023, 1, 1, 1, 3,
+                  point_label_id=sd.PL_CENTER_LINE, note_ids=[ note_id ] )
+    assert [ read_table( cursor, table ) for table in
+             [ "points", "point_notes", "point_external_ids" ] ] == batched
+
+def test_points_are_keyed_by_their_identifiers( database ):
+    cursor = database.cursor
+    add_test_station( cursor )
+    sd.add_points( cursor, "D", 2023, 1, 1, 2, [ 10, 2 ] )
+    cursor.execute( "SELECT point_key, point_id, station_id, point_number, "
+                    "point_label_id, outlier FROM points ORDER BY point_key;" )
+    rows = cursor.fetchall()
+    assert [ row[3] for row in rows ] == [ 2, 10 ]
+    for point_key, point_id, station_id, point_number, point_label_id, outlier in rows:
+        assert point_key  == sd.identify_point_key( "D", 2023, 1, 1, 2, point_number )
+        assert point_id   == sd.point_key_to_id( point_key )
+        assert station_id == sd.identify_station( "D", 2023, 1, 1, 2 )
+        assert point_label_id == None
+        assert outlier == 0
+
+def test_add_points_rejects_lists_of_the_wrong_length( database ):
+    cursor = database.cursor
+    add_test_station( cursor )
+    with pytest.raises( AssertionError ):
+        sd.add_points( cursor, "D", 2023, 1, 1, 1, [ 1, 2 ],
+                       point_label_ids=[ sd.PL_WALL ] )
+
+def test_add_points_stays_in_the_current_transaction( database ):
+    cursor = database.cursor
+    add_test_station( cursor )
+    database.commit()
+    sd.add_points( cursor, "D", 2023, 1, 1, 1, [ 1, 2, 3 ] )
+    database.rollback()
+    assert read_table( cursor, "points" ) == []
+
+def test_point_keys_order_points_like_their_identifiers( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 2, 1, 1, [ 0.0, 0.1 ] )
+    station_factory( cursor, 1, 3, 2, [ 0.0 ] )
+    station_factory( cursor, 1, 3, 10, [ 0.0, 0.1, 0.2 ] )
+    cursor.execute( "SELECT point_id FROM points ORDER BY point_key;" )
+    by_key = [ row[0] for row in cursor.fetchall() ]
+    cursor.execute( "SELECT point_id FROM points ORDER BY point_id;" )
+    assert by_key == [ row[0] for row in cursor.fetchall() ]
+
+    # Every coordinate refers to a point through its key.
+    for direction, alias in sd.COORDINATE_DIRECTIONS:
+        cursor.execute(
+        """
+        SELECT COUNT(*)
+        FROM {:s}_coordinate AS c
+        JOIN points ON points.point_key = c.point_key;
+        """.format( direction )
+        )
+        assert cursor.fetchone()[0] == len(by_key)
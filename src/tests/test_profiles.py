@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+import sqlite3
+
+import sheardata as sd
+import sheardata.profiles
+
+QUANTITIES = [ "transverse_coordinate", "wall_distance" ]
+
+def test_profile_of_a_station_with_two_walls( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1,
+                                              [ 0.0, 0.3, 1.5, 2.0 ],
+                                              wall_points=( 1, 4 ) )
+    sd.refresh_wall_distances( cursor )
+
+    profile = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert list(profile["point_key"])    == point_keys
+    assert list(profile["point_number"]) == [ 1, 2, 3, 4 ]
+    assert profile["transverse_coordinate"] == pytest.approx( [ 0.0, 0.3, 1.5, 2.0 ] )
+    assert profile["wall_distance"]         == pytest.approx( [ 0.0, 0.3, 0.5, 0.0 ] )
+    assert profile["wall_distance_uncertainty"][0] == 0.0
+    assert not np.any( profile["wall_distance_outlier"] )
+
+def test_profile_of_missing_values_is_nan( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+
+    # The wall distances have not been refreshed yet.
+    profile = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert len(profile) == 2
+    assert np.all( np.isnan( profile["wall_distance"] ) )
+    assert np.all( np.isnan( profile["wall_distance_uncertainty"] ) )
+
+def test_profile_only_has_points_of_its_station( database, station_factory ):
+    cursor = database.cursor
+    first_id,  first_keys  = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    second_id, second_keys = station_factory( cursor, 1, 1, 2, [ 0.0, 0.2, 0.4 ] )
+    sd.refresh_wall_distances( cursor )
+
+    profile = sd.load_station_profile( cursor, second_id, QUANTITIES )
+    assert list(profile["point_key"]) == second_keys
+    assert profile["wall_distance"] == pytest.approx( [ 0.0, 0.2, 0.4 ] )
+
+def test_profile_rejects_unknown_quantities( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    with pytest.raises( ValueError ):
+        sd.load_station_profile( cursor, station_id, [ "velocity" ] )
+
+def test_cached_profiles_are_read_only( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    profile = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert sd.load_station_profile( cursor, station_id, QUANTITIES ) is profile
+    with pytest.raises( ValueError ):
+        profile["transverse_coordinate"][0] = 1.0
+
+def test_profile_cache_sees_changes( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    before = sd.load_station_profile( cursor, station_id, QUANTITIES )
+
+    sd.refresh_wall_distances( cursor )
+    after = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert after is not before
+    assert after["wall_distance"] == pytest.approx( [ 0.0, 0.1 ] )
+
+def test_profile_cache_sees_changes_from_other_connections( database,
+                                                            station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    database.commit()
+    before = sd.load_station_profile( cursor, station_id, QUANTITIES )
+
+    other = sd.Database( database.filename )
+    other.cursor.execute(
+        "UPDATE transverse_coordinate SET value=0.2 WHERE point_key=?;",
+        ( point_keys[1], ),
+    )
+    other.commit()
+    other.close()
+
+    after = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert after["transverse_coordinate"] == pytest.approx( [ 0.0, 0.2 ] )
+
+def test_profile_cache_works_on_plain_connections( database, station_factory ):
+    station_id, point_keys = station_factory( database.cursor, 1, 1, 1,
+                                              [ 0.0, 0.1 ] )
+    database.commit()
+
+    connection = sqlite3.connect( database.filename )
+    cursor = connection.cursor()
+    profile = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert sd.load_station_profile( connection.cursor(), station_id,
+                                    QUANTITIES ) is profile
+
+    cursor.execute(
+        "UPDATE transverse_coordinate SET value=0.2 WHERE point_key=?;",
+        ( point_keys[1], ),
+    )
+    after = sd.load_station_profile( cursor, station_id, QUANTITIES )
+    assert after is not profile
+    assert after["transverse_coordinate"] == pytest.approx( [ 0.0, 0.2 ] )
+    connection.close()
+
+def test_profile_cache_keeps_the_most_recent_profiles( database, station_factory,
+                                                       monkeypatch ):
+    monkeypatch.setattr( sheardata.profiles, "PROFILE_CACHE_SIZE", 2 )
+    cursor = database.cursor
+    station_ids = [ station_factory( cursor, 1, 1, station_number, [ 0.0 ] )[0]
+                    for station_number in range( 1, 4 ) ]
+
+    profiles = [ sd.load_station_profile( cursor, station_id, QUANTITIES )
+                 for station_id in station_ids[:2] ]
+    sd.load_station_profile( cursor, station_ids[0], QUANTITIES )
+    sd.load_station_profile( cursor, station_ids[2], QUANTITIES )
+
+    assert sd.load_station_profile( cursor, station_ids[0], QUANTITIES ) \
+        is profiles[0]
+    assert sd.load_station_profile( cursor, station_ids[1], QUANTITIES ) \
+        is not profiles[1]
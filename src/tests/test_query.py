@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import sheardata as sd
+
+NUMBERS_QUERY = """
+WITH RECURSIVE numbers( n ) AS (
+    SELECT 1 UNION ALL SELECT n+1 FROM numbers WHERE n < ?
+)
+SELECT n, n * 0.5 FROM numbers;
+"""
+
+def test_row_batches_hold_at_most_the_batch_size( database ):
+    batches = list( sd.stream_row_batches( database.cursor, NUMBERS_QUERY,
+                                           ( 10, ), batch_size=4 ) )
+    assert [ len(rows) for rows in batches ] == [ 4, 4, 2 ]
+    assert [ row[0] for rows in batches for row in rows ] == list( range( 1, 11 ) )
+    assert list( sd.stream_row_batches( database.cursor, NUMBERS_QUERY,
+                                        ( 0, ), batch_size=4 ) ) == [ [ ( 1, 0.5 ) ] ]
+
+def test_rows_and_values_match_fetchall( database ):
+    cursor = database.cursor
+    cursor.execute( NUMBERS_QUERY, ( 100, ) )
+    rows = cursor.fetchall()
+    assert list( sd.stream_rows( cursor, NUMBERS_QUERY, ( 100, ),
+                                 batch_size=7 ) ) == rows
+    assert list( sd.stream_values( cursor, NUMBERS_QUERY, ( 100, ),
+                                   batch_size=7 ) ) == [ row[0] for row in rows ]
+
+def test_the_cursor_stays_free_while_streaming( database ):
+    cursor = database.cursor
+    total = 0
+    for value in sd.stream_values( cursor, NUMBERS_QUERY, ( 5, ), batch_size=2 ):
+        cursor.execute( "SELECT ? * 2;", ( value, ) )
+        total += cursor.fetchone()[0]
+    assert total == 30
+
+def test_record_batches_use_the_dtype( database ):
+    dtype = [ ( "n", np.int64 ), ( "half", np.float64 ) ]
+    batches = list( sd.stream_record_batches(
+        database.cursor,
+        "SELECT n, CASE WHEN n = 2 THEN NULL ELSE n * 0.5 END "
+        "FROM ( SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 );",
+        dtype,
+        batch_size=2,
+    ) )
+    assert [ len(batch) for batch in batches ] == [ 2, 1 ]
+    records = np.concatenate( batches )
+    assert records.dtype == np.dtype( dtype )
+    assert records["n"].tolist() == [ 1, 2, 3 ]
+    assert records["half"][0] == 0.5
+    assert np.isnan( records["half"][1] )
+
+def test_points_at_station_are_in_order( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1, 0.2 ] )
+    station_factory( cursor, 1, 1, 2, [ 0.0 ] )
+    assert list( sd.stream_points_at_station( cursor, station_id ) ) == [
+        sd.identify_point( "D", 2023, 1, 1, 1, point_number )
+        for point_number in [ 1, 2, 3 ]
+    ]
+
+def test_series_components( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0 ] )
+    series_id = sd.identify_series( "D", 2023, 1, 1 )
+    fluid_ids = [ sd.F_GASEOUS_ARGON, sd.F_GASEOUS_CARBON_DIOXIDE ]
+    for fluid_id in fluid_ids:
+        sd.add_series_component( cursor, series_id, fluid_id )
+    assert list( sd.stream_series_components(
+        cursor, sd.identify_series( "D", 2023, 1, 2 ),
+    ) ) == []
+    assert sorted( sd.stream_series_components( cursor, series_id ) ) == fluid_ids
+
+def test_point_batches( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0, 0.5, 1.0 ],
+                     point_label_ids=[ sd.PL_WALL, None, sd.PL_CENTER_LINE ] )
+    station_id, point_keys = station_factory( cursor, 1, 1, 2, [ 0.0, 0.1 ] )
+    cursor.execute( "UPDATE points SET outlier=TRUE WHERE point_key=?;",
+                    ( point_keys[1], ) )
+
+    batches = list( sd.stream_point_batches( cursor, batch_size=2 ) )
+    assert [ len(batch) for batch in batches ] == [ 2, 2, 1 ]
+    points = np.concatenate( batches )
+    assert np.all( np.diff( points["point_key"] ) > 0 )
+    assert points["point_number"].tolist()   == [ 1, 2, 3, 1, 2 ]
+    assert points["point_label_id"].tolist() == [ sd.PL_WALL, "",
+                                                  sd.PL_CENTER_LINE,
+                                                  sd.PL_WALL, "" ]
+    assert points["outlier"].tolist() == [ False, False, False, False, True ]
+    assert sd.truncate_keys( points["point_key"][-1:], sd.IL_STATION ).tolist() == \
+           sd.encode_identifiers( [ station_id ] ).tolist()
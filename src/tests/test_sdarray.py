@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import numpy as np
+import pytest
+
+import sheardata as sd
+
+def random_operands( seed=0 ):
+    generator = np.random.default_rng( seed )
+    a = sd.SDArray( generator.uniform( 1.0, 2.0, 7 ), generator.uniform( 0.0, 0.1, 7 ) )
+    b = sd.SDArray( generator.uniform( 1.0, 2.0, 7 ), generator.uniform( 0.0, 0.1, 7 ) )
+    return a, b
+
+# Every element of an SDArray must agree with the same calculation done one
+# sdfloat at a time by the uncertainties package, which also assumes that
+# independent values are uncorrelated.
+def assert_matches_sdfloats( result, expected ):
+    assert len(result) == len(expected)
+    for i, value in enumerate(expected):
+        assert result.values[i]        == pytest.approx( value.n, rel=1.0e-12 )
+        assert result.uncertainties[i] == pytest.approx( value.s, rel=1.0e-12 )
+
+@pytest.mark.parametrize( "operation", [
+    lambda a, b: a + b,
+    lambda a, b: a - b,
+    lambda a, b: a * b,
+    lambda a, b: a / b,
+    lambda a, b: a**2.5,
+    lambda a, b: a**-1,
+    lambda a, b: -a + 2.0 * b,
+    lambda a, b: 3.0 / a - b / 4.0,
+    lambda a, b: 1.0 - a,
+    lambda a, b: +a,
+] )
+def test_operations_propagate_like_sdfloats( operation ):
+    a, b = random_operands()
+    expected = [ operation( x, y ) for x, y in zip( a.to_sdfloats(),
+                                                    b.to_sdfloats() ) ]
+    assert_matches_sdfloats( operation( a, b ), expected )
+
+def test_operations_with_single_sdfloats():
+    a, b = random_operands()
+    c = sd.sdfloat( 1.5, 0.05 )
+    assert_matches_sdfloats( a * c, [ x * c for x in a.to_sdfloats() ] )
+    assert_matches_sdfloats( a - c, [ x - c for x in a.to_sdfloats() ] )
+    assert_matches_sdfloats( a / c, [ x / c for x in a.to_sdfloats() ] )
+
+def test_numpy_arrays_on_the_left_return_sdarrays():
+    a, b = random_operands()
+    exact = np.linspace( 1.0, 2.0, len(a) )
+    result = exact * a
+    assert isinstance( result, sd.SDArray )
+    assert np.array_equal( result.values,        exact * a.values        )
+    assert np.array_equal( result.uncertainties, exact * a.uncertainties )
+    assert isinstance( exact - a, sd.SDArray )
+    assert isinstance( exact / a, sd.SDArray )
+
+def test_sqrt_and_sum():
+    a, b = random_operands()
+    assert_matches_sdfloats( a.sqrt(), [ x**0.5 for x in a.to_sdfloats() ] )
+    total = a.sum()
+    expected = sum( a.to_sdfloats() )
+    assert total.n == pytest.approx( expected.n, rel=1.0e-12 )
+    assert total.s == pytest.approx( expected.s, rel=1.0e-12 )
+
+def test_uncertain_exponents_are_rejected():
+    a, b = random_operands()
+    with pytest.raises( TypeError ):
+        a**b
+    with pytest.raises( TypeError ):
+        a**sd.sdfloat( 2.0, 0.1 )
+
+def test_unknown_uncertainties_are_nan_and_propagate():
+    a = sd.SDArray( [ 1.0, 2.0 ] )
+    assert np.all( np.isnan( a.uncertainties ) )
+    b = sd.SDArray( [ 1.0, 2.0 ], [ 0.1, sd.UNKNOWN_UNCERTAINTY ] )
+    c = sd.SDArray( [ 3.0, 4.0 ], 0.2 )
+    result = b * c
+    assert not math.isnan( result.uncertainties[0] )
+    assert math.isnan( result.uncertainties[1] )
+    assert math.isnan( ( c + a ).uncertainties[0] )
+
+def test_exact_numbers_add_no_uncertainty():
+    a = sd.SDArray( [ 1.0, 2.0 ], [ 0.1, 0.2 ] )
+    assert np.array_equal( ( a + 5.0 ).uncertainties, a.uncertainties )
+    assert np.array_equal( ( 2.0 * a ).uncertainties, [ 0.2, 0.4 ] )
+
+def test_absolute_value_keeps_the_uncertainties():
+    a = sd.SDArray( [ -1.0, 2.0 ], [ 0.1, 0.2 ] )
+    assert np.array_equal( abs(a).values,        [ 1.0, 2.0 ] )
+    assert np.array_equal( abs(a).uncertainties, [ 0.1, 0.2 ] )
+
+def test_scalar_uncertainties_broadcast():
+    a = sd.SDArray( [ 1.0, 2.0, 3.0 ], 0.5 )
+    assert np.array_equal( a.uncertainties, [ 0.5, 0.5, 0.5 ] )
+    assert sd.SDArray( 4.0, 0.1 ).values.shape == ( 1, )
+
+def test_indexing_and_iteration():
+    a = sd.SDArray( [ 1.0, 2.0, 3.0 ], [ 0.1, 0.2, 0.3 ] )
+    element = a[1]
+    assert ( element.n, element.s ) == ( 2.0, 0.2 )
+    element = a[np.int64(2)]
+    assert ( element.n, element.s ) == ( 3.0, 0.3 )
+    part = a[1:]
+    assert isinstance( part, sd.SDArray )
+    assert np.array_equal( part.values, [ 2.0, 3.0 ] )
+    assert np.array_equal( a[np.array( [ True, False, True ] )].uncertainties,
+                           [ 0.1, 0.3 ] )
+    assert [ value.n for value in a ] == [ 1.0, 2.0, 3.0 ]
+
+def test_sdfloat_round_trip():
+    values = [ sd.sdfloat( 1.0, 0.1 ), sd.sdfloat( 2.0 ), sd.sdfloat( 3.0, 0.0 ) ]
+    a = sd.from_sdfloats( values )
+    assert np.array_equal( a.nominal_values(), [ 1.0, 2.0, 3.0 ] )
+    assert a.std_devs()[0] == 0.1
+    assert math.isnan( a.std_devs()[1] )
+    for value, original in zip( a.to_sdfloats(), values ):
+        assert value.n == original.n
+        assert value.s == original.s or ( math.isnan( value.s ) and
+                                          math.isnan( original.s ) )
+
+def test_operations_do_not_change_the_operands():
+    a = sd.SDArray( [ 1.0, 2.0 ], [ 0.1, 0.2 ] )
+    values        = a.values.copy()
+    uncertainties = a.uncertainties.copy()
+    b = -a
+    b.uncertainties[0] = 5.0
+    b = a * 2.0
+    assert np.array_equal( a.values,        values        )
+    assert np.array_equal( a.uncertainties, uncertainties )
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+
+def read_summaries( cursor ):
+    return { summary.study_id: summary for summary in sd.study_summary( cursor ) }
+
+def test_study_summary_counts_the_rows_of_each_study( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0, 0.1, 0.2 ] )
+    station_factory( cursor, 1, 1, 2, [ 0.0, 0.1 ] )
+    station_factory( cursor, 1, 2, 1, [ 0.0 ] )
+    station_factory( cursor, 2, 1, 1, [ 0.0, 0.5 ] )
+    first_id  = sd.identify_study( "D", 2023, 1 )
+    second_id = sd.identify_study( "D", 2023, 2 )
+    sd.add_study_source( cursor, first_id, "SmithJ+2000+eng+JOUR" )
+    sd.add_study_source( cursor, first_id, "abbottA+1990+eng+JOUR" )
+    sd.add_study_source( cursor, first_id, "JonesB+1980+eng+BOOK",
+                         sd.SECONDARY_SOURCE )
+    sd.refresh_study_summaries( cursor )
+
+    summaries = read_summaries( cursor )
+    assert sorted(summaries) == [ first_id, second_id ]
+    first = summaries[first_id]
+    assert first.study_type_id      == sd.ST_EXPERIMENT
+    assert first.primary_sources    == [ "abbottA+1990+eng+JOUR",
+                                         "SmithJ+2000+eng+JOUR" ]
+    assert first.number_of_series   == 2
+    assert first.number_of_stations == 3
+    assert first.number_of_points   == 6
+    assert summaries[second_id].primary_sources  == []
+    assert summaries[second_id].number_of_points == 2
+
+def test_refreshing_one_study_leaves_the_others( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0 ] )
+    station_factory( cursor, 2, 1, 1, [ 0.0 ] )
+    sd.refresh_study_summaries( cursor )
+
+    first_id = sd.identify_study( "D", 2023, 1 )
+    station_factory( cursor, 1, 1, 2, [ 0.0, 0.1 ] )
+    sd.refresh_study_summaries( cursor, [ first_id ] )
+
+    summaries = read_summaries( cursor )
+    assert summaries[first_id].number_of_points == 3
+    assert summaries[sd.identify_study( "D", 2023, 2 )].number_of_points == 1
+
+def test_deleting_a_series_refreshes_its_study( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0, 0.1 ] )
+    station_factory( cursor, 1, 2, 1, [ 0.0, 0.1, 0.2 ] )
+    sd.refresh_study_summaries( cursor )
+
+    sd.delete_series( cursor, sd.identify_series( "D", 2023, 1, 2 ) )
+    summary = read_summaries( cursor )[sd.identify_study( "D", 2023, 1 )]
+    assert summary.number_of_series   == 1
+    assert summary.number_of_stations == 1
+    assert summary.number_of_points   == 2
+
+def test_deleting_a_study_removes_its_summary( database, station_factory ):
+    cursor = database.cursor
+    station_factory( cursor, 1, 1, 1, [ 0.0 ] )
+    station_factory( cursor, 2, 1, 1, [ 0.0 ] )
+    sd.refresh_study_summaries( cursor )
+
+    sd.delete_study( cursor, sd.identify_study( "D", 2023, 1 ) )
+    assert list( read_summaries( cursor ) ) == [ sd.identify_study( "D", 2023, 2 ) ]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import numpy as np
+import pytest
+
+import sheardata as sd
+import prep_load_fluid_property_values
+
+def test_split_label():
+    assert sd.split_label( "Pressure [bar]" )       == ( "Pressure", "bar" )
+    assert sd.split_label( " Temperature [°C] " )   == ( "Temperature", "°C" )
+    assert sd.split_label( "Length [in] [ft]" )     == ( "Length [in]", "ft" )
+    assert sd.split_label( "Fluid" )                == ( "Fluid", None )
+    assert sd.split_label( "Uncertainty percent" )  == ( "Uncertainty percent", None )
+
+def test_convert_to_si_units():
+    assert sd.convert_to_si_units( 0.0,   "°C"   ) == sd.ABSOLUTE_ZERO
+    assert sd.convert_to_si_units( 32.0,  "°F"   ) == pytest.approx( sd.ABSOLUTE_ZERO )
+    assert sd.convert_to_si_units( 212.0, "°F"   ) == pytest.approx( sd.ABSOLUTE_ZERO + 100.0 )
+    assert sd.convert_to_si_units( 491.67, "°R"  ) == pytest.approx( sd.ABSOLUTE_ZERO )
+    assert sd.convert_to_si_units( 0.0,   "psig" ) == sd.STANDARD_ATMOSPHERIC_PRESSURE
+    assert sd.convert_to_si_units( 1.0,   "psia" ) == pytest.approx( 6894.757, rel=1.0e-6 )
+    assert sd.convert_to_si_units( 12.0,  "in"   ) == pytest.approx( 1.0 * sd.METERS_PER_FOOT )
+    assert np.array_equal( sd.convert_to_si_units( np.array( [ 1.0, 2.5 ] ), "kPa" ),
+                           [ 1.0e3, 2.5e3 ] )
+
+def test_unknown_units_are_errors():
+    with pytest.raises( ValueError, match="unknown unit" ):
+        sd.unit_conversion( "furlong" )
+    with pytest.raises( ValueError ):
+        sd.convert_to_si_units( 1.0, None )
+
+CITATION_KEY = "TestA+2023+eng+JOUR"
+
+def write_table( tmp_path, lines ):
+    filename = tmp_path / "table.csv"
+    filename.write_text( "\n".join( lines ) + "\n" )
+    return str(filename)
+
+def read_values( cursor ):
+    cursor.execute(
+    """
+    SELECT fluid_id, quantity_id, pressure, temperature, fluid_property_value,
+           fluid_property_uncertainty, preferred
+    FROM fluid_property_values
+    WHERE citation_key=?
+    ORDER BY rowid;
+    """,
+    ( CITATION_KEY, )
+    )
+    return cursor.fetchall()
+
+def test_loader_converts_units_and_scales_values( database, tmp_path ):
+    cursor = database.cursor
+    filename = write_table( tmp_path, [
+        '"Temperature [°F]", "Pressure [psig]", "Fluid", "Quantity", "Value", "Uncertainty percent", "Preferred?",',
+        '212.0, 0.0, "H2O(l)", "vbar", 1.25e-3, 1.0, 1,',
+        '32.0,  0.0, "H2O(l)", "mu",   1.5,     ,    0,',
+        '',
+        '50.0,  0.0, "_gaseous_air", "mu", 1.0, 2.0, 1,',
+    ] )
+    prep_load_fluid_property_values.load_fluid_property_file(
+        cursor, filename, CITATION_KEY, {
+            ( sd.F_LIQUID_WATER, sd.Q_SPECIFIC_VOLUME   ): 1.0,
+            ( sd.F_LIQUID_WATER, sd.Q_DYNAMIC_VISCOSITY ): 1.0e-3,
+            ( sd.F_GASEOUS_AIR,  sd.Q_DYNAMIC_VISCOSITY ): 1.716e-5,
+        },
+    )
+    rows = read_values( cursor )
+
+    # The rows go in in the order of the primary key.
+    assert [ row[0:2] for row in rows ] == [
+        ( sd.F_LIQUID_WATER, sd.Q_DYNAMIC_VISCOSITY ),
+        ( sd.F_LIQUID_WATER, sd.Q_MASS_DENSITY      ),
+        ( sd.F_GASEOUS_AIR,  sd.Q_DYNAMIC_VISCOSITY ),
+    ]
+    rows = { row[0:2]: row[2:] for row in rows }
+
+    pressure, temperature, value, uncertainty, preferred = \
+        rows[sd.F_LIQUID_WATER,sd.Q_MASS_DENSITY]
+    assert pressure    == sd.STANDARD_ATMOSPHERIC_PRESSURE
+    assert temperature == pytest.approx( sd.ABSOLUTE_ZERO + 100.0 )
+    assert value       == pytest.approx( 800.0 )
+    assert uncertainty == pytest.approx( 2.0 * 0.01 / 12.0**0.5 / 1.25e-3 )
+    assert preferred   == 1
+
+    pressure, temperature, value, uncertainty, preferred = \
+        rows[sd.F_LIQUID_WATER,sd.Q_DYNAMIC_VISCOSITY]
+    assert temperature == pytest.approx( sd.ABSOLUTE_ZERO )
+    assert value       == pytest.approx( 1.5e-3 )
+    assert uncertainty == None
+    assert preferred   == 0
+
+    pressure, temperature, value, uncertainty, preferred = \
+        rows[sd.F_GASEOUS_AIR,sd.Q_DYNAMIC_VISCOSITY]
+    assert value       == pytest.approx( 1.716e-5 )
+    assert uncertainty == pytest.approx( 2.0 * 1.716e-5 * 0.02 / 12.0**0.5 )
+
+def test_loader_requires_a_scale_for_every_row( database, tmp_path ):
+    filename = write_table( tmp_path, [
+        '"Temperature [K]", "Pressure [Pa]", "Fluid", "Quantity", "Value", "Preferred?",',
+        '300.0, 101325.0, "H2O(l)", "rho", 996.5, 1,',
+    ] )
+    with pytest.raises( AssertionError ):
+        prep_load_fluid_property_values.load_fluid_property_file(
+            database.cursor, filename, CITATION_KEY,
+            { ( sd.F_GASEOUS_AIR, sd.Q_MASS_DENSITY ): 1.0 },
+        )
+
+def test_loader_inserts_long_tables_in_chunks( database, tmp_path, monkeypatch ):
+    monkeypatch.setattr( prep_load_fluid_property_values, "INSERT_CHUNK_SIZE", 3 )
+    lines = [ '"Temperature [°C]", "Pressure [bar]", "Fluid", "Quantity", "Value", "Preferred?",' ]
+    for i in range(10):
+        lines.append( '{:.1f}, 1.0, "H2O(l)", "rho", 1000.0, 0,'.format( 10.0 - i ) )
+    prep_load_fluid_property_values.load_fluid_property_file(
+        database.cursor, write_table( tmp_path, lines ), CITATION_KEY,
+        { ( sd.F_LIQUID_WATER, sd.Q_MASS_DENSITY ): 1.0 },
+    )
+    temperatures = [ row[3] for row in read_values( database.cursor ) ]
+    assert len(temperatures) == 10
+    assert temperatures == sorted(temperatures)
+    assert all( math.isfinite( temperature ) for temperature in temperatures )
+
+# The prepared database has every row of every table of values, 880 in all.
+def test_loader_loads_every_tabulated_value( database, in_source_directory ):
+    cursor = database.cursor
+    cursor.execute(
+    """
+    SELECT citation_key, COUNT(*)
+    FROM fluid_property_values
+    GROUP BY citation_key;
+    """
+    )
+    counts = dict( cursor.fetchall() )
+    for citation_key in counts:
+        columns, units = prep_load_fluid_property_values.read_columns(
+            "../data/fluid_property_values/{:s}.csv".format( citation_key )
+        )
+        assert counts[citation_key] == len( columns["Value"] )
+    assert sum( counts.values() ) == 880
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2023 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import sheardata as sd
+
+CHANNEL_COORDINATES = [ 0.0, 0.3, 1.5, 2.0 ]
+
+def read_wall_distances( cursor, station_id, table="wall_distance_mat" ):
+    cursor.execute(
+    """
+    SELECT point_key, value, uncertainty
+    FROM {:s}
+    WHERE station_id=?
+    ORDER BY point_key;
+    """.format( table ),
+    (
+        station_id,
+    )
+    )
+    return cursor.fetchall()
+
+def test_wall_distances_of_one_wall( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.1, 0.4 ] )
+    sd.refresh_wall_distances( cursor )
+
+    rows = read_wall_distances( cursor, station_id )
+    assert [ row[0] for row in rows ] == point_keys
+    assert [ row[1] for row in rows ] == pytest.approx( [ 0.0, 0.1, 0.4 ] )
+    assert rows[0][2] == 0.0
+    assert rows[1][2] == pytest.approx( 2.0**0.5 * 0.01 )
+
+@pytest.mark.parametrize( "with_instrument", [ False, True ] )
+def test_wall_distances_are_from_the_nearest_wall( database, station_factory,
+                                                   with_instrument ):
+    cursor = database.cursor
+    instrument_id = None
+    if ( with_instrument ):
+        instrument_id = sd.add_instrument( cursor, sd.IC_PITOT_STATIC_TUBE )
+    station_id, point_keys = station_factory( cursor, 1, 1, 1,
+                                              CHANNEL_COORDINATES,
+                                              wall_points=( 1, 4 ),
+                                              instrument_id=instrument_id )
+
+    for station_ids in [ None, [ station_id ] ]:
+        sd.refresh_wall_distances( cursor, station_ids )
+        rows = read_wall_distances( cursor, station_id )
+        assert [ row[0] for row in rows ] == point_keys
+        assert [ row[1] for row in rows ] == pytest.approx( [ 0.0, 0.3, 0.5, 0.0 ] )
+        assert rows[3][2] == 0.0
+
+    rows = read_wall_distances( cursor, station_id, "wall_distance" )
+    assert [ row[1] for row in rows ] == pytest.approx( [ 0.0, 0.3, 0.5, 0.0 ] )
+
+def test_wall_distances_in_one_direction_are_signed( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1,
+                                              CHANNEL_COORDINATES,
+                                              wall_points=( 1, 4 ) )
+    rows = read_wall_distances( cursor, station_id, "transverse_wall_distance" )
+    assert [ row[1] for row in rows ] == pytest.approx( [ 0.0, 0.3, -0.5, 0.0 ] )
+
+    rows = read_wall_distances( cursor, station_id, "streamwise_wall_distance" )
+    assert [ row[1] for row in rows ] == [ 0.0, 0.0, 0.0, 0.0 ]
+
+# The walls are offset in the streamwise direction, so the middle point is
+# nearer to the first wall in the transverse direction but nearer to the second
+# wall overall.  Every view measures it from the second wall.
+def test_wall_distance_views_agree_on_the_nearest_wall( database, station_factory ):
+    cursor = database.cursor
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.4, 1.0 ],
+                                              wall_points=( 1, 3 ) )
+    for point_key in point_keys[1:]:
+        cursor.execute(
+        """
+        UPDATE streamwise_coordinate
+        SET value=5.0
+        WHERE point_key=?;
+        """,
+        (
+            point_key,
+        )
+        )
+    sd.refresh_wall_distances( cursor )
+
+    components = []
+    for direction, alias in sd.COORDINATE_DIRECTIONS:
+        rows = read_wall_distances( cursor, station_id,
+                                    "{:s}_wall_distance".format( direction ) )
+        assert [ row[0] for row in rows ] == point_keys
+        components.append( [ row[1] for row in rows ] )
+    assert components[0] == pytest.approx( [ 0.0,  0.0, 0.0 ] )
+    assert components[1] == pytest.approx( [ 0.0, -0.6, 0.0 ] )
+
+    rows = read_wall_distances( cursor, station_id )
+    assert [ row[1] for row in rows ] == pytest.approx(
+        [ sum( d**2 for d in point )**0.5 for point in zip( *components ) ]
+    )
+    assert rows == read_wall_distances( cursor, station_id, "wall_distance" )
+
+def test_refreshing_one_station_leaves_the_others( database, station_factory ):
+    cursor = database.cursor
+    first_id,  first_keys  = station_factory( cursor, 1, 1, 1, [ 0.0, 0.2 ] )
+    sd.refresh_wall_distances( cursor )
+    second_id, second_keys = station_factory( cursor, 1, 1, 2, [ 0.0, 0.5 ] )
+    sd.refresh_wall_distances( cursor, [ second_id ] )
+
+    assert len( read_wall_distances( cursor, first_id  ) ) == 2
+    assert len( read_wall_distances( cursor, second_id ) ) == 2
+
+# Coordinates only combine with the coordinates in the other directions that
+# have the same time and instrument, where no instrument matches no instrument.
+def test_coordinates_match_on_their_instruments( database, station_factory ):
+    cursor = database.cursor
+    instrument_id = sd.add_instrument( cursor, sd.IC_PITOT_STATIC_TUBE )
+    station_id, point_keys = station_factory( cursor, 1, 1, 1, [ 0.0, 0.2, 0.4 ],
+                                              instrument_id=instrument_id )
+    other_id, other_keys = station_factory( cursor, 1, 1, 2, [ 0.0, 0.2, 0.4 ] )
+    for keys in [ point_keys, other_keys ]:
+        cursor.execute(
+        """
+        UPDATE spanwise_coordinate
+        SET instrument_id = CASE WHEN instrument_id IS NULL THEN ? ELSE NULL END
+        WHERE point_key=?;
+        """,
+        (
+            instrument_id,
+            keys[1],
+        )
+        )
+    sd.refresh_wall_distances( cursor )
+
+    for station, keys in [ ( station_id, point_keys ), ( other_id, other_keys ) ]:
+        rows = read_wall_distances( cursor, station )
+        assert [ row[0] for row in rows ] == [ keys[0], keys[2] ]
+        assert [ row[1] for row in rows ] == pytest.approx( [ 0.0, 0.4 ] )
+        assert len( read_wall_distances( cursor, station,
+                                         "spanwise_wall_distance" ) ) == 2
+        assert len( read_wall_distances( cursor, station,
+                                         "transverse_wall_distance" ) ) == 3